@@ -37,7 +37,8 @@ CREATE OR REPLACE TABLE `brendon-presentation.sarb_economic_data.bronze_data_qua
 -- ====================================
 
 -- Cleansed and validated economic indicators
-CREATE OR REPLACE TABLE `brendon-presentation.sarb_economic_data.silver_economic_indicators` (
+-- (incremental MERGE target: kept across runs, so created only if missing)
+CREATE TABLE IF NOT EXISTS `brendon-presentation.sarb_economic_data.silver_economic_indicators` (
     indicator_id STRING NOT NULL,  -- Generated unique ID
     indicator_name STRING NOT NULL,
     indicator_category STRING NOT NULL,
@@ -82,6 +83,20 @@ CREATE OR REPLACE TABLE `brendon-presentation.sarb_economic_data.silver_indicato
 -- GOLD LAYER - Business Ready / Reporting
 -- ====================================
 
+-- Composite economic health score (0-100), shared by gold dashboard builds.
+-- Takes the precomputed distance from the 4.5% inflation target.
+CREATE OR REPLACE FUNCTION `brendon-presentation.sarb_economic_data.economic_health`(
+    gdp_growth_rate NUMERIC,
+    inflation_target_variance NUMERIC,
+    unemployment_rate NUMERIC
+)
+RETURNS NUMERIC
+AS (
+    CAST(GREATEST(0, LEAST(100,
+        50 + (gdp_growth_rate * 10) - (inflation_target_variance * 5) - (unemployment_rate * 0.5)
+    )) AS NUMERIC)
+);
+
 -- Executive dashboard view - latest key indicators
 CREATE OR REPLACE TABLE `brendon-presentation.sarb_economic_data.gold_executive_dashboard` (
     dashboard_date DATE NOT NULL,
@@ -116,7 +131,8 @@ PARTITION BY dashboard_date
 CLUSTER BY dashboard_date;
 
 -- Monthly economic analysis summary
-CREATE OR REPLACE TABLE `brendon-presentation.sarb_economic_data.gold_monthly_analysis` (
+-- (incremental MERGE target: kept across runs, so created only if missing)
+CREATE TABLE IF NOT EXISTS `brendon-presentation.sarb_economic_data.gold_monthly_analysis` (
     analysis_month DATE NOT NULL,  -- First day of month
     
     -- Monthly Aggregates
@@ -5,6 +5,8 @@ Bronze (Raw) → Silver (Cleansed) → Gold (Business Ready) + AI Insights (Sepa
 """
 
 import os
+import sys
+import uuid
 import logging
 from datetime import datetime, timezone
 from typing import Dict, List
@@ -19,10 +21,205 @@ logger = logging.getLogger(__name__)
 class SARBFinalMedallion:
     """Final 3-tier Medallion architecture demonstration"""
     
+    # Inputs below this size can skip BigQuery transforms in local mode
+    LOCAL_MODE_MAX_ROWS = 100
+    
+    # SQL templates are built once at class load; only the table prefix and
+    # per-run values are substituted in demo_3_tier_architecture
+    _BRONZE_TMPL = """
+    CREATE TABLE `{project_id}.{dataset_id}.bronze_raw_indicators`
+    CLUSTER BY indicator_name, date
+    AS
+    SELECT 
+        '{ingestion_timestamp}' as ingestion_timestamp,
+        'demo_source' as file_source,
+        *
+    FROM UNNEST([
+        STRUCT('GDP_Growth_Rate' as indicator_name, 2.3 as value, DATE('2024-09-30') as date, 'Economic Growth' as category, 'Percentage' as unit, 'SARB' as source),
+        STRUCT('Inflation_Rate', 5.4, DATE('2024-09-30'), 'Price Stability', 'Percentage', 'SARB'),
+        STRUCT('Prime_Interest_Rate', 11.75, DATE('2024-09-30'), 'Monetary Policy', 'Percentage', 'SARB'),
+        STRUCT('Unemployment_Rate', 32.1, DATE('2024-06-30'), 'Employment', 'Percentage', 'StatsSA'),
+        STRUCT('USD_ZAR_Exchange_Rate', 18.45, DATE('2024-10-21'), 'Exchange Rates', 'ZAR per USD', 'SARB')
+    ])
+    """
+    
+    _SILVER_TMPL = """
+    CREATE TABLE `{project_id}.{dataset_id}.silver_economic_indicators` AS
+    WITH cleansed_data AS (
+        SELECT 
+            GENERATE_UUID() as indicator_id,
+            indicator_name,
+            category as indicator_category,
+            value,
+            unit,
+            date,
+            source,
+            
+            -- Data Quality Flags
+            CASE WHEN value IS NOT NULL AND value >= 0 THEN TRUE ELSE FALSE END as is_validated,
+            CASE WHEN value IS NOT NULL AND value >= 0 THEN 1.0 ELSE 0.0 END as confidence_score,
+            
+            -- Business Enrichments
+            LAG(value) OVER (PARTITION BY indicator_name ORDER BY date) as previous_value,
+            CURRENT_TIMESTAMP() as processed_timestamp
+            
+        FROM `{project_id}.{dataset_id}.bronze_raw_indicators`
+        WHERE value IS NOT NULL  -- Data cleansing: remove nulls
+    ),
+    enriched_data AS (
+        SELECT *,
+            -- Period changes (business logic)
+            value - previous_value as period_change,
+            CASE 
+                WHEN previous_value IS NOT NULL AND previous_value != 0 
+                THEN ((value - previous_value) / previous_value) * 100 
+                ELSE NULL 
+            END as period_change_percent
+        FROM cleansed_data
+    )
+    SELECT * FROM enriched_data
+    """
+    
+    _GOLD_TMPL = """
+    CREATE OR REPLACE TABLE `{project_id}.{dataset_id}.gold_executive_dashboard` AS
+    WITH latest_indicators AS (
+        SELECT 
+            indicator_name,
+            value,
+            date,
+            period_change_percent,
+            ROW_NUMBER() OVER (PARTITION BY indicator_name ORDER BY date DESC) as rn
+        FROM `{project_id}.{dataset_id}.silver_economic_indicators`
+    ),
+    kpi_calculations AS (
+        SELECT 
+            CURRENT_DATE() as report_date,
+            
+            -- Current Values
+            MAX(CASE WHEN indicator_name = 'GDP_Growth_Rate' THEN value END) as gdp_growth_rate,
+            MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN value END) as inflation_rate,
+            MAX(CASE WHEN indicator_name = 'Prime_Interest_Rate' THEN value END) as prime_interest_rate,
+            MAX(CASE WHEN indicator_name = 'Unemployment_Rate' THEN value END) as unemployment_rate,
+            MAX(CASE WHEN indicator_name = 'USD_ZAR_Exchange_Rate' THEN value END) as usd_zar_exchange_rate,
+            
+            -- Report-Specific KPIs
+            ABS(MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN value END) - 4.5) as inflation_target_variance,
+            
+            CASE 
+                WHEN MAX(CASE WHEN indicator_name = 'Prime_Interest_Rate' THEN value END) > 10 THEN 'Restrictive'
+                WHEN MAX(CASE WHEN indicator_name = 'Prime_Interest_Rate' THEN value END) > 7 THEN 'Neutral'
+                ELSE 'Accommodative'
+            END as monetary_policy_stance,
+            
+            -- Economic Health Score (Composite KPI)
+            GREATEST(0, LEAST(100, 
+                50 + 
+                (COALESCE(MAX(CASE WHEN indicator_name = 'GDP_Growth_Rate' THEN value END), 0) * 10) - 
+                (ABS(COALESCE(MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN value END), 4.5) - 4.5) * 5) - 
+                ((COALESCE(MAX(CASE WHEN indicator_name = 'Unemployment_Rate' THEN value END), 25) - 25) * 0.5)
+            )) as economic_health_score,
+            
+            -- Risk Assessment KPIs
+            CASE 
+                WHEN MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN value END) > 6 THEN 'High'
+                WHEN MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN value END) > 4.5 THEN 'Medium'
+                ELSE 'Low'
+            END as inflation_risk_level,
+            
+            -- Trend Analysis
+            CASE 
+                WHEN MAX(CASE WHEN indicator_name = 'GDP_Growth_Rate' THEN value END) > 3 THEN 'Improving'
+                WHEN MAX(CASE WHEN indicator_name = 'GDP_Growth_Rate' THEN value END) > 1 THEN 'Stable'
+                ELSE 'Declining'
+            END as gdp_trend
+            
+        FROM latest_indicators 
+        WHERE rn = 1
+    )
+    SELECT 
+        *,
+        CURRENT_TIMESTAMP() as report_generated_timestamp
+    FROM kpi_calculations
+    """
+    
+    # Default AI risk factors / recommendations live in dim_ai_defaults so they
+    # are stored once and can be versioned independently of the insights
+    AI_DEFAULTS_ID = 1
+    AI_RISK_FACTORS = ['Global uncertainty', 'Inflation persistence', 'Structural unemployment']
+    AI_POLICY_RECOMMENDATIONS = ['Monitor inflation expectations', 'Maintain current stance', 'Support reforms']
+    
+    _AI_DEFAULTS_TMPL = """
+    CREATE TABLE IF NOT EXISTS `{project_id}.{dataset_id}.dim_ai_defaults` AS
+    SELECT 
+        @defaults_id as default_id,
+        @risk_factors as risk_factors,
+        @policy_recommendations as policy_recommendations
+    """
+    
+    _AI_TMPL = """
+    CREATE TABLE `{project_id}.{dataset_id}.ai_economic_insights` AS
+    SELECT 
+        GENERATE_UUID() as insight_id,
+        CURRENT_DATE() as analysis_date,
+        @ai_summary as executive_summary,
+        'Monetary policy assessment based on current indicators' as monetary_policy_assessment,
+        'Exchange rate analysis showing ZAR trends' as exchange_rate_analysis,
+        d.risk_factors,
+        d.policy_recommendations,
+        @ai_provider as ai_provider,
+        @confidence as confidence_score,
+        CURRENT_TIMESTAMP() as analysis_timestamp
+    FROM `{project_id}.{dataset_id}.dim_ai_defaults` d
+    WHERE d.default_id = @defaults_id
+    """
+    
+    _VIEW_TMPL = """
+    CREATE VIEW `{project_id}.{dataset_id}.reporting_economic_dashboard` AS
+    SELECT 
+        -- Business Data from Gold Layer
+        ed.report_date,
+        ed.gdp_growth_rate,
+        ed.inflation_rate,
+        ed.prime_interest_rate,
+        ed.unemployment_rate,
+        ed.usd_zar_exchange_rate,
+        ed.inflation_target_variance,
+        ed.monetary_policy_stance,
+        ed.economic_health_score,
+        ed.inflation_risk_level,
+        ed.gdp_trend,
+        
+        -- AI Insights from Separate Table (clearly separated)
+        ai.executive_summary as ai_summary,
+        ai.ai_provider,
+        ai.confidence_score as ai_confidence,
+        
+        -- Metadata
+        ed.report_generated_timestamp
+        
+    FROM `{project_id}.{dataset_id}.gold_executive_dashboard` ed
+    LEFT JOIN `{project_id}.{dataset_id}.ai_economic_insights` ai
+        ON ed.report_date = ai.analysis_date
+    """
+    
+    _EXPORT_TMPL = """
+    EXPORT DATA OPTIONS(
+        uri='gs://{bucket}/reporting/*.parquet',
+        format='PARQUET',
+        compression='SNAPPY',
+        overwrite=true
+    ) AS
+    SELECT * FROM `{project_id}.{dataset_id}.reporting_economic_dashboard`
+    """
+    
     def __init__(self, project_id='brendon-presentation', gemini_api_key=None):
         self.project_id = project_id
         self.dataset_id = 'sarb_economic_data'
         self.bigquery_client = bigquery.Client(project=self.project_id)
+        # BI tools (Looker Studio, Power BI) read the Parquet export from here
+        self.export_bucket = os.getenv('DASHBOARD_EXPORT_BUCKET', f'{self.project_id}-dashboards')
+        # Progress messages are buffered and written to stdout in one go
+        self._log_buffer = []
         
         # Initialize AI
         self.ai_ready = False
@@ -48,194 +245,175 @@ class SARBFinalMedallion:
             try:
                 drop_sql = f"DROP TABLE IF EXISTS `{self.project_id}.{self.dataset_id}.{table}`"
                 self.bigquery_client.query(drop_sql).result()
-                print(f"🧹 Cleaned existing table: {table}")
+                self._log(f"🧹 Cleaned existing table: {table}")
             except Exception as e:
-                print(f"⚠️ Could not drop {table}: {e}")
+                self._log(f"⚠️ Could not drop {table}: {e}")
         
         # Also drop the view
         try:
             drop_view_sql = f"DROP VIEW IF EXISTS `{self.project_id}.{self.dataset_id}.reporting_economic_dashboard`"
             self.bigquery_client.query(drop_view_sql).result()
-            print("🧹 Cleaned existing view: reporting_economic_dashboard")
+            self._log("🧹 Cleaned existing view: reporting_economic_dashboard")
         except Exception as e:
-            print(f"⚠️ Could not drop view: {e}")
+            self._log(f"⚠️ Could not drop view: {e}")
     
-    def demo_3_tier_architecture(self, sample_data: List[Dict]):
+    def _log(self, message: str):
+        """Queue a progress message for the next flush"""
+        self._log_buffer.append(message)
+    
+    def _flush_log(self):
+        """Write all queued progress messages with a single stdout write"""
+        if self._log_buffer:
+            sys.stdout.write('\n'.join(self._log_buffer) + '\n')
+            sys.stdout.flush()
+            self._log_buffer = []
+    
+    def demo_3_tier_architecture(self, sample_data: List[Dict], local: bool = False):
         """Demonstrate proper 3-tier architecture as requested by assessor"""
+        try:
+            if local and len(sample_data) < self.LOCAL_MODE_MAX_ROWS:
+                return self._demo_local(sample_data)
+            return self._run_3_tier_architecture(sample_data)
+        finally:
+            self._flush_log()
+    
+    def _demo_local(self, sample_data: List[Dict]):
+        """Compute Silver/Gold KPIs in Python and load only the Gold + AI rows"""
+        self._log("\n⚡ LOCAL MODE - Silver/Gold computed in-process")
+        self._log("-" * 50)
+        
+        # Silver: drop nulls, then keep the latest observation per indicator
+        valid = [r for r in sample_data if r.get('value') is not None]
+        latest = {}
+        for record in sorted(valid, key=lambda r: r['date']):
+            latest[record['indicator_name']] = record['value']
+        
+        gdp = latest.get('GDP_Growth_Rate')
+        inflation = latest.get('Inflation_Rate')
+        prime = latest.get('Prime_Interest_Rate')
+        unemployment = latest.get('Unemployment_Rate')
+        
+        # Gold: same KPI rules as _GOLD_TMPL
+        health_score = 50 + (gdp if gdp is not None else 0) * 10 \
+            - abs((inflation if inflation is not None else 4.5) - 4.5) * 5 \
+            - ((unemployment if unemployment is not None else 25) - 25) * 0.5
+        now = datetime.now(timezone.utc)
+        gold_row = {
+            'report_date': now.date().isoformat(),
+            'gdp_growth_rate': gdp,
+            'inflation_rate': inflation,
+            'prime_interest_rate': prime,
+            'unemployment_rate': unemployment,
+            'usd_zar_exchange_rate': latest.get('USD_ZAR_Exchange_Rate'),
+            'inflation_target_variance': abs(inflation - 4.5) if inflation is not None else None,
+            'monetary_policy_stance': 'Restrictive' if (prime or 0) > 10 else 'Neutral' if (prime or 0) > 7 else 'Accommodative',
+            'economic_health_score': max(0, min(100, health_score)),
+            'inflation_risk_level': 'High' if (inflation or 0) > 6 else 'Medium' if (inflation or 0) > 4.5 else 'Low',
+            'gdp_trend': 'Improving' if (gdp or 0) > 3 else 'Stable' if (gdp or 0) > 1 else 'Declining',
+            'report_generated_timestamp': now.isoformat()
+        }
+        ai_row = {
+            'insight_id': str(uuid.uuid4()),
+            'analysis_date': gold_row['report_date'],
+            'executive_summary': "Economic indicators show balanced performance with inflation approaching target range.",
+            'monetary_policy_assessment': 'Monetary policy assessment based on current indicators',
+            'exchange_rate_analysis': 'Exchange rate analysis showing ZAR trends',
+            'risk_factors': self.AI_RISK_FACTORS,
+            'policy_recommendations': self.AI_POLICY_RECOMMENDATIONS,
+            'ai_provider': 'fallback',
+            'confidence_score': 0.9,
+            'analysis_timestamp': now.isoformat()
+        }
+        
+        job_config = bigquery.LoadJobConfig(
+            write_disposition="WRITE_TRUNCATE",
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            autodetect=True,
+        )
+        for table, row in (('gold_executive_dashboard', gold_row), ('ai_economic_insights', ai_row)):
+            table_ref = f"{self.project_id}.{self.dataset_id}.{table}"
+            self.bigquery_client.load_table_from_json([row], table_ref, job_config=job_config).result()
+        
+        self._log(f"✅ Economic Health Score: {gold_row['economic_health_score']:.1f}/100")
+        self._log(f"✅ Policy Stance: {gold_row['monetary_policy_stance']}")
+        self._log(f"✅ Risk Level: {gold_row['inflation_risk_level']}")
+        
+        return {
+            'bronze_records': len(sample_data),
+            'silver_records': len(valid),
+            'gold_records': 1,
+            'ai_records': 1,
+            'architecture_complete': True
+        }
+    
+    def _run_3_tier_architecture(self, sample_data: List[Dict]):
+        """Build Bronze → Silver → Gold + AI and the reporting view"""
         
         # Clean existing tables first
-        print("🧹 CLEANING EXISTING TABLES")
-        print("-" * 40)
+        self._log("🧹 CLEANING EXISTING TABLES")
+        self._log("-" * 40)
         self.clean_existing_tables()
         
-        print("\n🎯 SARB 3-TIER MEDALLION ARCHITECTURE")
-        print("=" * 60)
-        print("Implementing assessor feedback:")
-        print("✅ Bronze Layer: Raw data landing zone")
-        print("✅ Silver Layer: Staging with transformations")  
-        print("✅ Gold Layer: Reporting with KPIs")
-        print("✅ AI Insights: Separate summary table")
-        print("=" * 60)
+        self._log("\n🎯 SARB 3-TIER MEDALLION ARCHITECTURE")
+        self._log("=" * 60)
+        self._log("Implementing assessor feedback:")
+        self._log("✅ Bronze Layer: Raw data landing zone")
+        self._log("✅ Silver Layer: Staging with transformations")  
+        self._log("✅ Gold Layer: Reporting with KPIs")
+        self._log("✅ AI Insights: Separate summary table")
+        self._log("=" * 60)
         
         # 1. BRONZE LAYER - Raw Data Landing
-        print("\n🥉 BRONZE LAYER - Raw Data Landing Zone")
-        print("Purpose: Exact copy of source data, no transformations")
-        print("-" * 50)
+        self._log("\n🥉 BRONZE LAYER - Raw Data Landing Zone")
+        self._log("Purpose: Exact copy of source data, no transformations")
+        self._log("-" * 50)
         
-        # Create Bronze table (simple, no partitioning)
-        bronze_sql = f"""
-        CREATE TABLE `{self.project_id}.{self.dataset_id}.bronze_raw_indicators` AS
-        SELECT 
-            '{datetime.now().isoformat()}' as ingestion_timestamp,
-            'demo_source' as file_source,
-            *
-        FROM UNNEST([
-            STRUCT('GDP_Growth_Rate' as indicator_name, 2.3 as value, DATE('2024-09-30') as date, 'Economic Growth' as category, 'Percentage' as unit, 'SARB' as source),
-            STRUCT('Inflation_Rate', 5.4, DATE('2024-09-30'), 'Price Stability', 'Percentage', 'SARB'),
-            STRUCT('Prime_Interest_Rate', 11.75, DATE('2024-09-30'), 'Monetary Policy', 'Percentage', 'SARB'),
-            STRUCT('Unemployment_Rate', 32.1, DATE('2024-06-30'), 'Employment', 'Percentage', 'StatsSA'),
-            STRUCT('USD_ZAR_Exchange_Rate', 18.45, DATE('2024-10-21'), 'Exchange Rates', 'ZAR per USD', 'SARB')
-        ])
-        """
+        # Create Bronze table, clustered to match the Silver LAG window
+        bronze_sql = self._render(self._BRONZE_TMPL, ingestion_timestamp=datetime.now().isoformat())
         
         self.bigquery_client.query(bronze_sql).result()
         bronze_count = self._get_count('bronze_raw_indicators')
         
-        print(f"✅ Raw data stored: {bronze_count} records")
-        print("✅ Data lineage: Ingestion timestamp and source tracking")
-        print("✅ No transformations: Exact copy of source data")
+        self._log(f"✅ Raw data stored: {bronze_count} records")
+        self._log("✅ Data lineage: Ingestion timestamp and source tracking")
+        self._log("✅ No transformations: Exact copy of source data")
         
         # 2. SILVER LAYER - Staging with Transformations
-        print("\n🥈 SILVER LAYER - Staging with Transformations")
-        print("Purpose: Data cleansing, validation, and business logic")
-        print("-" * 50)
-        
-        silver_sql = f"""
-        CREATE TABLE `{self.project_id}.{self.dataset_id}.silver_economic_indicators` AS
-        WITH cleansed_data AS (
-            SELECT 
-                GENERATE_UUID() as indicator_id,
-                indicator_name,
-                category as indicator_category,
-                value,
-                unit,
-                date,
-                source,
-                
-                -- Data Quality Flags
-                CASE WHEN value IS NOT NULL AND value >= 0 THEN TRUE ELSE FALSE END as is_validated,
-                CASE WHEN value IS NOT NULL AND value >= 0 THEN 1.0 ELSE 0.0 END as confidence_score,
-                
-                -- Business Enrichments
-                LAG(value) OVER (PARTITION BY indicator_name ORDER BY date) as previous_value,
-                CURRENT_TIMESTAMP() as processed_timestamp
-                
-            FROM `{self.project_id}.{self.dataset_id}.bronze_raw_indicators`
-            WHERE value IS NOT NULL  -- Data cleansing: remove nulls
-        ),
-        enriched_data AS (
-            SELECT *,
-                -- Period changes (business logic)
-                value - previous_value as period_change,
-                CASE 
-                    WHEN previous_value IS NOT NULL AND previous_value != 0 
-                    THEN ((value - previous_value) / previous_value) * 100 
-                    ELSE NULL 
-                END as period_change_percent
-            FROM cleansed_data
-        )
-        SELECT * FROM enriched_data
-        """
+        self._log("\n🥈 SILVER LAYER - Staging with Transformations")
+        self._log("Purpose: Data cleansing, validation, and business logic")
+        self._log("-" * 50)
+        
+        silver_sql = self._render(self._SILVER_TMPL)
         
         self.bigquery_client.query(silver_sql).result()
         silver_count = self._get_count('silver_economic_indicators')
         
-        print(f"✅ Data cleansing: Removed invalid records")
-        print(f"✅ Data validation: Added quality flags")
-        print(f"✅ Business logic: Added period changes and trends")
-        print(f"✅ Records processed: {silver_count}")
+        self._log(f"✅ Data cleansing: Removed invalid records")
+        self._log(f"✅ Data validation: Added quality flags")
+        self._log(f"✅ Business logic: Added period changes and trends")
+        self._log(f"✅ Records processed: {silver_count}")
         
         # 3. GOLD LAYER - Reporting Layer with KPIs
-        print("\n🥇 GOLD LAYER - Reporting Layer with KPIs")
-        print("Purpose: Report-specific enhancements and KPIs for business users")
-        print("-" * 50)
-        
-        gold_sql = f"""
-        CREATE TABLE `{self.project_id}.{self.dataset_id}.gold_executive_dashboard` AS
-        WITH latest_indicators AS (
-            SELECT 
-                indicator_name,
-                value,
-                date,
-                period_change_percent,
-                ROW_NUMBER() OVER (PARTITION BY indicator_name ORDER BY date DESC) as rn
-            FROM `{self.project_id}.{self.dataset_id}.silver_economic_indicators`
-        ),
-        kpi_calculations AS (
-            SELECT 
-                CURRENT_DATE() as report_date,
-                
-                -- Current Values
-                MAX(CASE WHEN indicator_name = 'GDP_Growth_Rate' THEN value END) as gdp_growth_rate,
-                MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN value END) as inflation_rate,
-                MAX(CASE WHEN indicator_name = 'Prime_Interest_Rate' THEN value END) as prime_interest_rate,
-                MAX(CASE WHEN indicator_name = 'Unemployment_Rate' THEN value END) as unemployment_rate,
-                MAX(CASE WHEN indicator_name = 'USD_ZAR_Exchange_Rate' THEN value END) as usd_zar_exchange_rate,
-                
-                -- Report-Specific KPIs
-                ABS(MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN value END) - 4.5) as inflation_target_variance,
-                
-                CASE 
-                    WHEN MAX(CASE WHEN indicator_name = 'Prime_Interest_Rate' THEN value END) > 10 THEN 'Restrictive'
-                    WHEN MAX(CASE WHEN indicator_name = 'Prime_Interest_Rate' THEN value END) > 7 THEN 'Neutral'
-                    ELSE 'Accommodative'
-                END as monetary_policy_stance,
-                
-                -- Economic Health Score (Composite KPI)
-                GREATEST(0, LEAST(100, 
-                    50 + 
-                    (COALESCE(MAX(CASE WHEN indicator_name = 'GDP_Growth_Rate' THEN value END), 0) * 10) - 
-                    (ABS(COALESCE(MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN value END), 4.5) - 4.5) * 5) - 
-                    ((COALESCE(MAX(CASE WHEN indicator_name = 'Unemployment_Rate' THEN value END), 25) - 25) * 0.5)
-                )) as economic_health_score,
-                
-                -- Risk Assessment KPIs
-                CASE 
-                    WHEN MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN value END) > 6 THEN 'High'
-                    WHEN MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN value END) > 4.5 THEN 'Medium'
-                    ELSE 'Low'
-                END as inflation_risk_level,
-                
-                -- Trend Analysis
-                CASE 
-                    WHEN MAX(CASE WHEN indicator_name = 'GDP_Growth_Rate' THEN value END) > 3 THEN 'Improving'
-                    WHEN MAX(CASE WHEN indicator_name = 'GDP_Growth_Rate' THEN value END) > 1 THEN 'Stable'
-                    ELSE 'Declining'
-                END as gdp_trend
-                
-            FROM latest_indicators 
-            WHERE rn = 1
-        )
-        SELECT 
-            *,
-            CURRENT_TIMESTAMP() as report_generated_timestamp
-        FROM kpi_calculations
-        """
+        self._log("\n🥇 GOLD LAYER - Reporting Layer with KPIs")
+        self._log("Purpose: Report-specific enhancements and KPIs for business users")
+        self._log("-" * 50)
         
-        self.bigquery_client.query(gold_sql).result()
-        gold_count = self._get_count('gold_executive_dashboard')
+        gold_sql = self._render(self._GOLD_TMPL)
+        
+        # Gold is not submitted on its own - it is batched with the AI insights
+        # insert below so both tables are built by a single BigQuery job
+        pending_script = [gold_sql]
         
-        print(f"✅ Business KPIs: Inflation target variance, policy stance")
-        print(f"✅ Composite metrics: Economic health score (0-100)")
-        print(f"✅ Risk assessment: Automated risk level classification")
-        print(f"✅ Trend analysis: GDP and economic trend indicators")
-        print(f"✅ Report optimization: Ready for executive dashboards")
-        print(f"✅ Records created: {gold_count}")
+        self._log(f"✅ Business KPIs: Inflation target variance, policy stance")
+        self._log(f"✅ Composite metrics: Economic health score (0-100)")
+        self._log(f"✅ Risk assessment: Automated risk level classification")
+        self._log(f"✅ Trend analysis: GDP and economic trend indicators")
+        self._log(f"✅ Report optimization: Ready for executive dashboards")
         
         # 4. AI INSIGHTS - Separate Summary Table
-        print("\n🤖 AI INSIGHTS - Separate Summary Table")
-        print("Purpose: AI-generated insights separate from business data")
-        print("-" * 50)
+        self._log("\n🤖 AI INSIGHTS - Separate Summary Table")
+        self._log("Purpose: AI-generated insights separate from business data")
+        self._log("-" * 50)
         
         # Get data for AI analysis
         ai_summary = "Economic indicators show balanced performance with inflation approaching target range."
@@ -249,7 +427,10 @@ class SARBFinalMedallion:
             """
             
             try:
-                df = self.bigquery_client.query(dashboard_query).to_dataframe()
+                # The AI needs the Gold row, so flush Gold in the same job as the read
+                script = ";\n".join(pending_script + [dashboard_query])
+                df = self.bigquery_client.query(script).to_dataframe()
+                pending_script = []
                 if not df.empty:
                     data = df.iloc[0].to_dict()
                     
@@ -268,111 +449,87 @@ class SARBFinalMedallion:
                     ai_summary = response.text.replace("'", "").replace('"', '').replace('\n', ' ')[:200]
                     ai_provider = "gemini_api"
                     confidence = 0.85
-                    print("✅ Real AI analysis generated")
+                    self._log("✅ Real AI analysis generated")
             except Exception as e:
-                print(f"⚠️ AI generation failed: {e}, using professional fallback")
+                self._log(f"⚠️ AI generation failed: {e}, using professional fallback")
         else:
-            print("⚠️ AI not available, using professional analysis")
+            self._log("⚠️ AI not available, using professional analysis")
         
         # Create AI insights table using parameterized query to avoid quote issues
-        ai_sql = f"""
-        CREATE TABLE `{self.project_id}.{self.dataset_id}.ai_economic_insights` AS
-        SELECT 
-            GENERATE_UUID() as insight_id,
-            CURRENT_DATE() as analysis_date,
-            @ai_summary as executive_summary,
-            'Monetary policy assessment based on current indicators' as monetary_policy_assessment,
-            'Exchange rate analysis showing ZAR trends' as exchange_rate_analysis,
-            ['Global uncertainty', 'Inflation persistence', 'Structural unemployment'] as risk_factors,
-            ['Monitor inflation expectations', 'Maintain current stance', 'Support reforms'] as policy_recommendations,
-            @ai_provider as ai_provider,
-            @confidence as confidence_score,
-            CURRENT_TIMESTAMP() as analysis_timestamp
-        """
+        ai_sql = self._render(self._AI_TMPL)
         
         job_config = bigquery.QueryJobConfig(
             query_parameters=[
                 bigquery.ScalarQueryParameter("ai_summary", "STRING", ai_summary),
                 bigquery.ScalarQueryParameter("ai_provider", "STRING", ai_provider),
                 bigquery.ScalarQueryParameter("confidence", "FLOAT", confidence),
+                bigquery.ScalarQueryParameter("defaults_id", "INT64", self.AI_DEFAULTS_ID),
+                bigquery.ArrayQueryParameter("risk_factors", "STRING", self.AI_RISK_FACTORS),
+                bigquery.ArrayQueryParameter("policy_recommendations", "STRING", self.AI_POLICY_RECOMMENDATIONS),
             ]
         )
         
-        self.bigquery_client.query(ai_sql, job_config=job_config).result()
+        # Seeding dim_ai_defaults is a no-op once the table exists
+        pending_script.append(self._render(self._AI_DEFAULTS_TMPL))
+        pending_script.append(ai_sql)
+        self.bigquery_client.query(";\n".join(pending_script), job_config=job_config).result()
+        gold_count = self._get_count('gold_executive_dashboard')
         ai_count = self._get_count('ai_economic_insights')
         
-        print(f"✅ AI insights stored separately from business data")
-        print(f"✅ Separation of concerns: Business KPIs ≠ AI analysis")
-        print(f"✅ AI provider: {ai_provider}")
-        print(f"✅ Insights records: {ai_count}")
+        self._log(f"✅ Gold records created: {gold_count}")
+        self._log(f"✅ AI insights stored separately from business data")
+        self._log(f"✅ Separation of concerns: Business KPIs ≠ AI analysis")
+        self._log(f"✅ AI provider: {ai_provider}")
+        self._log(f"✅ Insights records: {ai_count}")
         
         # 5. Final Optimized View for Reporting
-        print("\n📊 FINAL OPTIMIZED REPORTING VIEW")
-        print("Purpose: Single view combining all layers for end users")
-        print("-" * 50)
-        
-        final_query = f"""
-        CREATE VIEW `{self.project_id}.{self.dataset_id}.reporting_economic_dashboard` AS
-        SELECT 
-            -- Business Data from Gold Layer
-            ed.report_date,
-            ed.gdp_growth_rate,
-            ed.inflation_rate,
-            ed.prime_interest_rate,
-            ed.unemployment_rate,
-            ed.usd_zar_exchange_rate,
-            ed.inflation_target_variance,
-            ed.monetary_policy_stance,
-            ed.economic_health_score,
-            ed.inflation_risk_level,
-            ed.gdp_trend,
-            
-            -- AI Insights from Separate Table (clearly separated)
-            ai.executive_summary as ai_summary,
-            ai.ai_provider,
-            ai.confidence_score as ai_confidence,
-            
-            -- Metadata
-            ed.report_generated_timestamp
-            
-        FROM `{self.project_id}.{self.dataset_id}.gold_executive_dashboard` ed
-        LEFT JOIN `{self.project_id}.{self.dataset_id}.ai_economic_insights` ai
-            ON ed.report_date = ai.analysis_date
-        """
+        self._log("\n📊 FINAL OPTIMIZED REPORTING VIEW")
+        self._log("Purpose: Single view combining all layers for end users")
+        self._log("-" * 50)
         
-        self.bigquery_client.query(final_query).result()
+        final_query = self._render(self._VIEW_TMPL)
         
-        # Show final view
-        view_query = f"""
+        # Create the view and read its first row back in the same script job
+        preview_query = f"""
         SELECT * FROM `{self.project_id}.{self.dataset_id}.reporting_economic_dashboard`
+        LIMIT 1
         """
-        final_df = self.bigquery_client.query(view_query).to_dataframe()
+        rows = list(self.bigquery_client.query(final_query + ";\n" + preview_query).result())
+        
+        # Export the view straight to GCS as Parquet so BI tools never round-trip through Python
+        try:
+            export_sql = self._render(self._EXPORT_TMPL, bucket=self.export_bucket)
+            self.bigquery_client.query(export_sql).result()
+            self._log(f"✅ Reporting view exported: gs://{self.export_bucket}/reporting/")
+        except Exception as e:
+            self._log(f"⚠️ Parquet export skipped: {e}")
         
-        if not final_df.empty:
-            print("✅ Final optimized view created")
-            print(f"   • Economic Health Score: {final_df.iloc[0]['economic_health_score']:.1f}/100")
-            print(f"   • Policy Stance: {final_df.iloc[0]['monetary_policy_stance']}")
-            print(f"   • Risk Level: {final_df.iloc[0]['inflation_risk_level']}")
-            print(f"   • AI Provider: {final_df.iloc[0]['ai_provider']}")
-            print(f"   • Data Layers: Bronze → Silver → Gold + AI")
+        if rows:
+            final_row = rows[0]
+            self._log("✅ Final optimized view created")
+            self._log(f"   • Economic Health Score: {final_row.get('economic_health_score'):.1f}/100")
+            self._log(f"   • Policy Stance: {final_row.get('monetary_policy_stance')}")
+            self._log(f"   • Risk Level: {final_row.get('inflation_risk_level')}")
+            self._log(f"   • AI Provider: {final_row.get('ai_provider')}")
+            self._log(f"   • Data Layers: Bronze → Silver → Gold + AI")
         
         # Summary
-        print("\n" + "=" * 60)
-        print("🎉 3-TIER MEDALLION ARCHITECTURE COMPLETE!")
-        print("=" * 60)
-        print("✅ BRONZE: Raw data landing (5 records)")
-        print("✅ SILVER: Staging with transformations (5 records)")
-        print("✅ GOLD: Reporting layer with KPIs (1 dashboard)")
-        print("✅ AI INSIGHTS: Separate summary table (1 insight)")
-        print("✅ FINAL VIEW: Optimized for reporting")
-        print("=" * 60)
-        print("Architecture satisfies assessor feedback:")
-        print("• Raw layer where data lands ✅")
-        print("• Staging with transformations ✅") 
-        print("• Reporting layer with KPIs ✅")
-        print("• AI insights separate table ✅")
-        print("• Final view optimized for reporting ✅")
-        print("=" * 60)
+        self._log("\n" + "=" * 60)
+        self._log("🎉 3-TIER MEDALLION ARCHITECTURE COMPLETE!")
+        self._log("=" * 60)
+        self._log("✅ BRONZE: Raw data landing (5 records)")
+        self._log("✅ SILVER: Staging with transformations (5 records)")
+        self._log("✅ GOLD: Reporting layer with KPIs (1 dashboard)")
+        self._log("✅ AI INSIGHTS: Separate summary table (1 insight)")
+        self._log("✅ FINAL VIEW: Optimized for reporting")
+        self._log("=" * 60)
+        self._log("Architecture satisfies assessor feedback:")
+        self._log("• Raw layer where data lands ✅")
+        self._log("• Staging with transformations ✅") 
+        self._log("• Reporting layer with KPIs ✅")
+        self._log("• AI insights separate table ✅")
+        self._log("• Final view optimized for reporting ✅")
+        self._log("=" * 60)
         
         return {
             'bronze_records': bronze_count,
@@ -382,6 +539,10 @@ class SARBFinalMedallion:
             'architecture_complete': True
         }
     
+    def _render(self, template: str, **params) -> str:
+        """Fill a class-level SQL template for this project and dataset"""
+        return template.format(project_id=self.project_id, dataset_id=self.dataset_id, **params)
+    
     def _get_count(self, table_name: str) -> int:
         """Get record count for a table"""
         try:
@@ -393,6 +554,11 @@ class SARBFinalMedallion:
 
 def main():
     """Demo the corrected 3-tier architecture"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='SARB Final 3-Tier Architecture Demo')
+    parser.add_argument('--local', action='store_true', help='Compute Silver/Gold in-process for small inputs')
+    args = parser.parse_args()
     
     sample_data = [
         {'indicator_name': 'GDP_Growth_Rate', 'value': 2.3, 'date': '2024-09-30'},
@@ -404,7 +570,7 @@ def main():
     
     gemini_api_key = os.getenv('GEMINI_API_KEY')
     architecture = SARBFinalMedallion(gemini_api_key=gemini_api_key)
-    results = architecture.demo_3_tier_architecture(sample_data)
+    results = architecture.demo_3_tier_architecture(sample_data, local=args.local)
     
     print(f"\n📊 FINAL RESULTS:")
     for key, value in results.items():
@@ -5,20 +5,292 @@ Bronze → Silver → Gold datasets for cleaner GCP architecture
 """
 
 import os
+import json
+import uuid
+import hashlib
 import logging
+import time
+import threading
 from datetime import datetime, timezone
 from typing import Dict, List
-import pandas as pd
+from google.api_core.exceptions import NotFound
 from google.cloud import bigquery
-import google.generativeai as genai
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Clients are shared per project so repeat runs reuse credentials and HTTP sessions
+_CLIENT_CACHE: Dict[str, bigquery.Client] = {}
+_CLIENT_LOCK = threading.Lock()
+
+def _get_bigquery_client(project_id: str) -> bigquery.Client:
+    """Return the cached BigQuery client for a project, creating and warming it once"""
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(project_id)
+        if client is None:
+            client = bigquery.Client(project=project_id)
+            _CLIENT_CACHE[project_id] = client
+            # Open the auth/TLS session in the background while the caller sets up
+            threading.Thread(target=_warm_client, args=(client,), daemon=True).start()
+        return client
+
+def _warm_client(client: bigquery.Client):
+    """Issue a cheap metadata call so the first real request skips the handshake"""
+    try:
+        list(client.list_datasets(max_results=1))
+    except Exception as e:
+        logger.debug(f"BigQuery client warm-up skipped: {e}")
+
+# SQL bodies are formatted once per instance in SARBImprovedMedallion.__init__
+
+# Incrementally maintained base: one row per indicator/date, kept fresh
+# by BigQuery as Bronze grows, so it is only created once
+SILVER_MV_SQL_TEMPLATE = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS `{project}.{silver}.economic_indicators_clean`
+PARTITION BY date
+CLUSTER BY indicator_name
+OPTIONS(enable_refresh = true, refresh_interval_minutes = 1440)
+AS
+SELECT 
+    indicator_name,
+    category,
+    unit,
+    date,
+    source,
+    MAX(value) as value,
+    COUNT(*) as observation_count
+FROM `{project}.{bronze}.economic_indicators_raw`
+GROUP BY indicator_name, category, unit, date, source
+"""
+
+# Window functions are not allowed in materialized views, so the
+# validation and trend logic is a plain view layered on the MV
+SILVER_SQL_TEMPLATE = """
+CREATE OR REPLACE VIEW `{project}.{silver}.economic_indicators_validated` AS
+WITH clean AS (
+    -- Validate first so the window functions below only sort valid rows
+    SELECT *
+    FROM `{project}.{silver}.economic_indicators_clean`
+    WHERE value IS NOT NULL AND value > 0 AND value < 1000
+),
+data_quality AS (
+    SELECT 
+        GENERATE_UUID() as record_id,
+        indicator_name,
+        category,
+        value,
+        unit,
+        date,
+        source,
+        'VALID' as data_quality_flag,
+        
+        -- Business Logic Transformations
+        LAG(value) OVER (PARTITION BY indicator_name ORDER BY date) as previous_period_value,
+        AVG(value) OVER (PARTITION BY indicator_name ORDER BY date ROWS BETWEEN 2 PRECEDING AND CURRENT ROW) as rolling_3_period_avg,
+        
+        -- Metadata
+        CURRENT_TIMESTAMP() as processing_timestamp,
+        'silver_validation_v1' as transformation_version
+        
+    FROM clean
+),
+enriched_data AS (
+    SELECT *,
+        -- Period-over-period analysis
+        value - previous_period_value as period_change_absolute,
+        CASE 
+            WHEN previous_period_value IS NOT NULL AND previous_period_value != 0 
+            THEN ROUND(((value - previous_period_value) / previous_period_value) * 100, 2)
+            ELSE NULL 
+        END as period_change_percent,
+        
+        -- Trend classification
+        CASE 
+            WHEN value > rolling_3_period_avg * 1.05 THEN 'IMPROVING'
+            WHEN value < rolling_3_period_avg * 0.95 THEN 'DECLINING'
+            ELSE 'STABLE'
+        END as trend_classification
+        
+    FROM data_quality
+)
+SELECT * FROM enriched_data
+"""
+
+# Rows failing validation stay auditable without touching the Silver windows
+REJECTED_SQL_TEMPLATE = """
+CREATE OR REPLACE VIEW `{project}.{bronze}.rejected_records` AS
+SELECT 
+    *,
+    CASE 
+        WHEN value IS NULL THEN 'NULL_VALUE'
+        WHEN value <= 0 THEN 'NEGATIVE_VALUE'
+        WHEN value >= 1000 THEN 'OUTLIER'
+        ELSE 'UNKNOWN'
+    END as data_quality_flag
+FROM `{project}.{bronze}.economic_indicators_raw`
+WHERE NOT (value IS NOT NULL AND value > 0 AND value < 1000)
+"""
+
+GOLD_SQL_TEMPLATE = """
+CREATE OR REPLACE TABLE `{project}.{gold}.executive_economic_dashboard` AS
+WITH current_indicators AS (
+    -- Latest observation per indicator in a single pass
+    SELECT 
+        indicator_name,
+        value,
+        period_change_percent,
+        trend_classification,
+        date
+    FROM `{project}.{silver}.economic_indicators_validated`
+    WHERE value IS NOT NULL
+    QUALIFY ROW_NUMBER() OVER (PARTITION BY indicator_name ORDER BY date DESC) = 1
+),
+indicator_map AS (
+    -- One aggregation packs the latest values into a single row
+    SELECT ARRAY_AGG(STRUCT(indicator_name, value)) as inds
+    FROM current_indicators
+),
+pivoted AS (
+    -- Each indicator becomes a named column once; KPIs below reuse them
+    SELECT 
+        (SELECT value FROM UNNEST(inds) WHERE indicator_name = 'GDP_Growth_Rate') as gdp_growth_rate,
+        (SELECT value FROM UNNEST(inds) WHERE indicator_name = 'Inflation_Rate') as inflation_rate,
+        (SELECT value FROM UNNEST(inds) WHERE indicator_name = 'Prime_Interest_Rate') as prime_rate,
+        (SELECT value FROM UNNEST(inds) WHERE indicator_name = 'Unemployment_Rate') as unemployment_rate,
+        (SELECT value FROM UNNEST(inds) WHERE indicator_name = 'USD_ZAR_Exchange_Rate') as usd_zar_rate,
+        (SELECT value FROM UNNEST(inds) WHERE indicator_name = 'Government_Debt_GDP_Ratio') as debt_gdp_ratio,
+        (SELECT value FROM UNNEST(inds) WHERE indicator_name = 'Current_Account_Balance') as current_account,
+        (SELECT value FROM UNNEST(inds) WHERE indicator_name = 'Manufacturing_PMI') as manufacturing_pmi
+    FROM indicator_map
+),
+kpi_dashboard AS (
+    SELECT 
+        CURRENT_DATE() as dashboard_date,
+        
+        -- Core Economic Indicators
+        gdp_growth_rate,
+        inflation_rate,
+        prime_rate,
+        unemployment_rate,
+        usd_zar_rate,
+        debt_gdp_ratio,
+        current_account,
+        manufacturing_pmi,
+        
+        -- Executive KPIs
+        CASE 
+            WHEN inflation_rate BETWEEN 3.0 AND 6.0 THEN 'WITHIN_TARGET'
+            WHEN inflation_rate > 6.0 THEN 'ABOVE_TARGET'
+            ELSE 'BELOW_TARGET'
+        END as inflation_target_status,
+        
+        -- Economic Health Composite Score (0-100)
+        GREATEST(0, LEAST(100, 
+            50 + 
+            (COALESCE(gdp_growth_rate, 0) * 8) -
+            (ABS(COALESCE(inflation_rate, 4.5) - 4.5) * 4) -
+            ((COALESCE(unemployment_rate, 25) - 20) * 0.8) +
+            (CASE WHEN COALESCE(manufacturing_pmi, 50) > 50 THEN 5 ELSE -5 END)
+        )) as economic_health_score,
+        
+        -- Risk Assessment
+        CASE 
+            WHEN debt_gdp_ratio > 70 THEN 'HIGH_FISCAL_RISK'
+            WHEN usd_zar_rate > 20 THEN 'HIGH_CURRENCY_RISK'
+            WHEN unemployment_rate > 30 THEN 'HIGH_SOCIAL_RISK'
+            ELSE 'MODERATE_RISK'
+        END as primary_risk_factor,
+        
+        -- Policy Recommendations
+        CASE 
+            WHEN inflation_rate > 6.5 THEN 'TIGHTEN_MONETARY_POLICY'
+            WHEN gdp_growth_rate < 1.0 THEN 'STIMULUS_NEEDED'
+            WHEN unemployment_rate > 35 THEN 'EMPLOYMENT_INTERVENTION'
+            ELSE 'MAINTAIN_CURRENT_STANCE'
+        END as policy_recommendation
+        
+    FROM pivoted
+)
+SELECT 
+    *,
+    CURRENT_TIMESTAMP() as dashboard_generated_timestamp
+FROM kpi_dashboard
+"""
+
+UNIFIED_VIEW_SQL_TEMPLATE = """
+CREATE OR REPLACE VIEW `{project}.{gold}.unified_economic_dashboard` AS
+SELECT 
+    -- Executive Dashboard (Gold Layer)
+    ed.dashboard_date,
+    ed.gdp_growth_rate,
+    ed.inflation_rate,
+    ed.prime_rate,
+    ed.unemployment_rate,
+    ed.usd_zar_rate,
+    ed.debt_gdp_ratio,
+    ed.current_account,
+    ed.manufacturing_pmi,
+    ed.inflation_target_status,
+    ed.economic_health_score,
+    ed.primary_risk_factor,
+    ed.policy_recommendation,
+    
+    -- AI Analysis (AI Dataset) 
+    ai.executive_summary as ai_executive_summary,
+    ai.policy_assessment as ai_policy_assessment,
+    ai.risk_analysis as ai_risk_analysis,
+    ai.market_outlook as ai_market_outlook,
+    ai.ai_provider,
+    ai.confidence_score as ai_confidence,
+    
+    -- Metadata
+    ed.dashboard_generated_timestamp as last_updated
+    
+FROM `{project}.{gold}.executive_economic_dashboard` ed
+LEFT JOIN (
+    -- Insights are appended per run; join only the newest one per day
+    SELECT *
+    FROM `{project}.{ai}.economic_analysis_insights`
+    WHERE analysis_date IS NOT NULL
+    QUALIFY ROW_NUMBER() OVER (PARTITION BY analysis_date ORDER BY generated_timestamp DESC) = 1
+) ai
+    ON ed.dashboard_date = ai.analysis_date
+"""
+
 class SARBImprovedMedallion:
     """Improved 3-tier Medallion with separate datasets per tier"""
     
+    # How long a "datasets exist" marker is trusted before re-listing datasets
+    DATASET_MARKER_TTL_SECONDS = 3600
+    
+    AI_INSIGHTS_SCHEMA = [
+        bigquery.SchemaField('analysis_id', 'STRING'),
+        bigquery.SchemaField('analysis_date', 'DATE'),
+        bigquery.SchemaField('executive_summary', 'STRING'),
+        bigquery.SchemaField('policy_assessment', 'STRING'),
+        bigquery.SchemaField('risk_analysis', 'STRING'),
+        bigquery.SchemaField('market_outlook', 'STRING'),
+        bigquery.SchemaField('recommendations', 'STRING'),
+        bigquery.SchemaField('identified_risks', 'STRING', mode='REPEATED'),
+        bigquery.SchemaField('policy_actions', 'STRING', mode='REPEATED'),
+        bigquery.SchemaField('ai_provider', 'STRING'),
+        bigquery.SchemaField('confidence_score', 'FLOAT'),
+        bigquery.SchemaField('generated_timestamp', 'TIMESTAMP'),
+    ]
+    
+    BRONZE_SCHEMA = [
+        bigquery.SchemaField('ingestion_timestamp', 'TIMESTAMP'),
+        bigquery.SchemaField('data_source', 'STRING'),
+        bigquery.SchemaField('ingestion_method', 'STRING'),
+        bigquery.SchemaField('indicator_name', 'STRING'),
+        bigquery.SchemaField('category', 'STRING'),
+        bigquery.SchemaField('value', 'FLOAT'),
+        bigquery.SchemaField('unit', 'STRING'),
+        bigquery.SchemaField('date', 'DATE'),
+        bigquery.SchemaField('source', 'STRING'),
+    ]
+    
     def __init__(self, project_id='brendon-presentation', gemini_api_key=None):
         self.project_id = project_id
         
@@ -28,12 +300,23 @@ class SARBImprovedMedallion:
         self.gold_dataset = 'sarb_gold_reporting'
         self.ai_dataset = 'sarb_ai_insights'
         
-        self.bigquery_client = bigquery.Client(project=self.project_id)
+        self.bigquery_client = _get_bigquery_client(self.project_id)
+        
+        # Resolve the table prefixes into the SQL bodies once, not on every run
+        names = dict(project=self.project_id, bronze=self.bronze_dataset, silver=self.silver_dataset,
+                     gold=self.gold_dataset, ai=self.ai_dataset)
+        self._silver_mv_sql = SILVER_MV_SQL_TEMPLATE.format(**names)
+        self._silver_sql = SILVER_SQL_TEMPLATE.format(**names)
+        self._rejected_sql = REJECTED_SQL_TEMPLATE.format(**names)
+        self._gold_sql = GOLD_SQL_TEMPLATE.format(**names)
+        self._unified_view_sql = UNIFIED_VIEW_SQL_TEMPLATE.format(**names)
         
         # Initialize AI
         self.ai_ready = False
         if gemini_api_key:
             try:
+                # Imported here so runs without a Gemini key skip the SDK import cost
+                import google.generativeai as genai
                 genai.configure(api_key=gemini_api_key)
                 self.ai_model = genai.GenerativeModel('gemini-2.5-flash')
                 self.ai_ready = True
@@ -50,7 +333,24 @@ class SARBImprovedMedallion:
             (self.ai_dataset, "AI Insights - Machine learning outputs")
         ]
         
+        # Warm runs: a recent marker from a previous successful run skips the API;
+        # once it expires the datasets are listed again, so deleted ones get recreated
+        marker = os.path.join(os.path.expanduser('~'), '.cache', f'sarb_datasets_created_{self.project_id}')
+        if os.path.exists(marker) and time.time() - os.path.getmtime(marker) < self.DATASET_MARKER_TTL_SECONDS:
+            print("✅ Datasets verified (cached)")
+            return
+        
+        try:
+            existing = {ds.dataset_id for ds in self.bigquery_client.list_datasets(self.project_id)}
+        except Exception as e:
+            print(f"⚠️ Could not list datasets: {e}")
+            existing = set()
+        
+        all_ready = True
         for dataset_id, description in datasets:
+            if dataset_id in existing:
+                print(f"✅ Dataset verified: {dataset_id}")
+                continue
             try:
                 dataset = bigquery.Dataset(f"{self.project_id}.{dataset_id}")
                 dataset.description = description
@@ -59,7 +359,15 @@ class SARBImprovedMedallion:
                 self.bigquery_client.create_dataset(dataset, exists_ok=True)
                 print(f"✅ Dataset created/verified: {dataset_id}")
             except Exception as e:
+                all_ready = False
                 print(f"⚠️ Dataset issue {dataset_id}: {e}")
+        
+        if all_ready:
+            try:
+                os.makedirs(os.path.dirname(marker), exist_ok=True)
+                open(marker, 'w').close()
+            except OSError:
+                pass
     
     def demo_improved_architecture(self):
         """Demonstrate improved 3-tier architecture with separate datasets"""
@@ -79,25 +387,54 @@ class SARBImprovedMedallion:
         # Enhanced sample data with more realistic economic indicators
         enhanced_data = self._get_enhanced_economic_data()
         
+        # Idempotency guard: identical Bronze input and layer SQL mean identical downstream output
+        bronze_ref = f"{self.project_id}.{self.bronze_dataset}.economic_indicators_raw"
+        payload_digest = hashlib.blake2b(digest_size=8)
+        payload_digest.update(json.dumps(enhanced_data, sort_keys=True, default=str).encode())
+        for layer_sql in (self._silver_mv_sql, self._silver_sql, self._rejected_sql,
+                          self._gold_sql, self._unified_view_sql):
+            payload_digest.update(layer_sql.encode())
+        payload_hash = payload_digest.hexdigest()
+        if self._get_payload_hash(bronze_ref) == payload_hash:
+            print("\n⏭️ Bronze payload unchanged since last run - skipping Silver/Gold/AI rebuild")
+            return {
+                'bronze_records': self._get_count(self.bronze_dataset, 'economic_indicators_raw'),
+                'silver_records': self._get_count(self.silver_dataset, 'economic_indicators_validated'),
+                'gold_records': self._get_count(self.gold_dataset, 'executive_economic_dashboard'),
+                'ai_records': self._get_count(self.ai_dataset, 'economic_analysis_insights'),
+                'datasets_created': 4,
+                'architecture_improved': True,
+                'pipeline_skipped': True
+            }
+        
         # 1. BRONZE LAYER - Raw Data Landing
         print("\n🥉 BRONZE LAYER - sarb_bronze_raw")
         print("Purpose: Raw data landing zone, no transformations")
         print("-" * 50)
         
-        bronze_sql = f"""
-        CREATE OR REPLACE TABLE `{self.project_id}.{self.bronze_dataset}.economic_indicators_raw` AS
-        SELECT 
-            '{datetime.now().isoformat()}' as ingestion_timestamp,
-            'sarb_api_v2' as data_source,
-            'automated_pipeline' as ingestion_method,
-            *
-        FROM UNNEST({enhanced_data})
-        """
-        
-        self.bigquery_client.query(bronze_sql).result()
-        bronze_count = self._get_count(self.bronze_dataset, 'economic_indicators_raw')
+        # Load jobs use no query slots and keep native types, unlike a SQL literal payload
+        ingestion_timestamp = datetime.now(timezone.utc).isoformat()
+        bronze_rows = [
+            {
+                'ingestion_timestamp': ingestion_timestamp,
+                'data_source': 'sarb_api_v2',
+                'ingestion_method': 'automated_pipeline',
+                **record
+            }
+            for record in enhanced_data
+        ]
+        bronze_job_config = bigquery.LoadJobConfig(
+            schema=self.BRONZE_SCHEMA,
+            write_disposition="WRITE_TRUNCATE",
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            time_partitioning=bigquery.TimePartitioning(field='date'),
+            clustering_fields=['indicator_name', 'category', 'source'],
+        )
+        self.bigquery_client.load_table_from_json(
+            bronze_rows, bronze_ref, job_config=bronze_job_config
+        ).result()
         
-        print(f"✅ Raw data ingested: {bronze_count} indicators")
+        print("✅ Raw data ingestion: Typed load job, no query slots used")
         print("✅ Data lineage: Source tracking and timestamps")
         print("✅ No transformations: Pure raw data preservation")
         
@@ -106,148 +443,34 @@ class SARBImprovedMedallion:
         print("Purpose: Data quality, validation, and business transformations")
         print("-" * 50)
         
-        silver_sql = f"""
-        CREATE OR REPLACE TABLE `{self.project_id}.{self.silver_dataset}.economic_indicators_validated` AS
-        WITH data_quality AS (
-            SELECT 
-                GENERATE_UUID() as record_id,
-                indicator_name,
-                category,
-                value,
-                unit,
-                date,
-                source,
-                
-                -- Data Quality Assessment
-                CASE 
-                    WHEN value IS NOT NULL AND value > 0 AND value < 1000 THEN 'VALID'
-                    WHEN value IS NULL THEN 'NULL_VALUE'
-                    WHEN value <= 0 THEN 'NEGATIVE_VALUE'
-                    WHEN value >= 1000 THEN 'OUTLIER'
-                    ELSE 'UNKNOWN'
-                END as data_quality_flag,
-                
-                -- Business Logic Transformations
-                LAG(value) OVER (PARTITION BY indicator_name ORDER BY date) as previous_period_value,
-                AVG(value) OVER (PARTITION BY indicator_name ORDER BY date ROWS BETWEEN 2 PRECEDING AND CURRENT ROW) as rolling_3_period_avg,
-                
-                -- Metadata
-                CURRENT_TIMESTAMP() as processing_timestamp,
-                'silver_validation_v1' as transformation_version
-                
-            FROM `{self.project_id}.{self.bronze_dataset}.economic_indicators_raw`
-        ),
-        enriched_data AS (
-            SELECT *,
-                -- Period-over-period analysis
-                value - previous_period_value as period_change_absolute,
-                CASE 
-                    WHEN previous_period_value IS NOT NULL AND previous_period_value != 0 
-                    THEN ROUND(((value - previous_period_value) / previous_period_value) * 100, 2)
-                    ELSE NULL 
-                END as period_change_percent,
-                
-                -- Trend classification
-                CASE 
-                    WHEN value > rolling_3_period_avg * 1.05 THEN 'IMPROVING'
-                    WHEN value < rolling_3_period_avg * 0.95 THEN 'DECLINING'
-                    ELSE 'STABLE'
-                END as trend_classification
-                
-            FROM data_quality
-            WHERE data_quality_flag = 'VALID'  -- Only keep valid data
-        )
-        SELECT * FROM enriched_data
-        """
-        
-        self.bigquery_client.query(silver_sql).result()
-        silver_count = self._get_count(self.silver_dataset, 'economic_indicators_validated')
-        
         print(f"✅ Data quality validation: Applied business rules")
         print(f"✅ Trend analysis: Rolling averages and classifications")
         print(f"✅ Period analysis: Change calculations and variance")
-        print(f"✅ Validated records: {silver_count}")
         
         # 3. GOLD LAYER - Executive Reporting
         print("\n🥇 GOLD LAYER - sarb_gold_reporting")
         print("Purpose: Executive dashboards and KPI reporting")
         print("-" * 50)
         
-        gold_sql = f"""
-        CREATE OR REPLACE TABLE `{self.project_id}.{self.gold_dataset}.executive_economic_dashboard` AS
-        WITH latest_period AS (
-            SELECT 
-                MAX(date) as latest_date
-            FROM `{self.project_id}.{self.silver_dataset}.economic_indicators_validated`
-        ),
-        current_indicators AS (
-            SELECT 
-                indicator_name,
-                value,
-                period_change_percent,
-                trend_classification,
-                date
-            FROM `{self.project_id}.{self.silver_dataset}.economic_indicators_validated` sei
-            CROSS JOIN latest_period lp
-            WHERE sei.date = lp.latest_date
-        ),
-        kpi_dashboard AS (
-            SELECT 
-                CURRENT_DATE() as dashboard_date,
-                
-                -- Core Economic Indicators
-                MAX(CASE WHEN indicator_name = 'GDP_Growth_Rate' THEN value END) as gdp_growth_rate,
-                MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN value END) as inflation_rate,
-                MAX(CASE WHEN indicator_name = 'Prime_Interest_Rate' THEN value END) as prime_rate,
-                MAX(CASE WHEN indicator_name = 'Unemployment_Rate' THEN value END) as unemployment_rate,
-                MAX(CASE WHEN indicator_name = 'USD_ZAR_Exchange_Rate' THEN value END) as usd_zar_rate,
-                MAX(CASE WHEN indicator_name = 'Government_Debt_GDP_Ratio' THEN value END) as debt_gdp_ratio,
-                MAX(CASE WHEN indicator_name = 'Current_Account_Balance' THEN value END) as current_account,
-                MAX(CASE WHEN indicator_name = 'Manufacturing_PMI' THEN value END) as manufacturing_pmi,
-                
-                -- Executive KPIs
-                CASE 
-                    WHEN MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN value END) BETWEEN 3.0 AND 6.0 THEN 'WITHIN_TARGET'
-                    WHEN MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN value END) > 6.0 THEN 'ABOVE_TARGET'
-                    ELSE 'BELOW_TARGET'
-                END as inflation_target_status,
-                
-                -- Economic Health Composite Score (0-100)
-                GREATEST(0, LEAST(100, 
-                    50 + 
-                    (COALESCE(MAX(CASE WHEN indicator_name = 'GDP_Growth_Rate' THEN value END), 0) * 8) -
-                    (ABS(COALESCE(MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN value END), 4.5) - 4.5) * 4) -
-                    ((COALESCE(MAX(CASE WHEN indicator_name = 'Unemployment_Rate' THEN value END), 25) - 20) * 0.8) +
-                    (CASE WHEN COALESCE(MAX(CASE WHEN indicator_name = 'Manufacturing_PMI' THEN value END), 50) > 50 THEN 5 ELSE -5 END)
-                )) as economic_health_score,
-                
-                -- Risk Assessment
-                CASE 
-                    WHEN MAX(CASE WHEN indicator_name = 'Government_Debt_GDP_Ratio' THEN value END) > 70 THEN 'HIGH_FISCAL_RISK'
-                    WHEN MAX(CASE WHEN indicator_name = 'USD_ZAR_Exchange_Rate' THEN value END) > 20 THEN 'HIGH_CURRENCY_RISK'
-                    WHEN MAX(CASE WHEN indicator_name = 'Unemployment_Rate' THEN value END) > 30 THEN 'HIGH_SOCIAL_RISK'
-                    ELSE 'MODERATE_RISK'
-                END as primary_risk_factor,
-                
-                -- Policy Recommendations
-                CASE 
-                    WHEN MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN value END) > 6.5 THEN 'TIGHTEN_MONETARY_POLICY'
-                    WHEN MAX(CASE WHEN indicator_name = 'GDP_Growth_Rate' THEN value END) < 1.0 THEN 'STIMULUS_NEEDED'
-                    WHEN MAX(CASE WHEN indicator_name = 'Unemployment_Rate' THEN value END) > 35 THEN 'EMPLOYMENT_INTERVENTION'
-                    ELSE 'MAINTAIN_CURRENT_STANCE'
-                END as policy_recommendation
-                
-            FROM current_indicators
-        )
-        SELECT 
-            *,
-            CURRENT_TIMESTAMP() as dashboard_generated_timestamp
-        FROM kpi_dashboard
-        """
+        # Earlier runs created economic_indicators_validated as a table,
+        # which CREATE OR REPLACE VIEW cannot replace
+        validated_ref = f"{self.project_id}.{self.silver_dataset}.economic_indicators_validated"
+        try:
+            if self.bigquery_client.get_table(validated_ref).table_type == 'TABLE':
+                self.bigquery_client.delete_table(validated_ref, not_found_ok=True)
+        except NotFound:
+            pass
         
-        self.bigquery_client.query(gold_sql).result()
+        # Silver → Gold is a strict dependency chain, so it runs as one
+        # multi-statement script instead of one job per layer
+        layer_script = ";\n".join([self._silver_mv_sql, self._silver_sql, self._rejected_sql, self._gold_sql])
+        self.bigquery_client.query(layer_script).result()
+        bronze_count = self._get_count(self.bronze_dataset, 'economic_indicators_raw')
+        silver_count = self._get_count(self.silver_dataset, 'economic_indicators_validated')
         gold_count = self._get_count(self.gold_dataset, 'executive_economic_dashboard')
         
+        print(f"✅ Raw data ingested: {bronze_count} indicators")
+        print(f"✅ Validated records: {silver_count}")
         print(f"✅ Executive KPIs: Health score, risk assessment, policy recommendations")
         print(f"✅ Composite metrics: Economic health score (0-100)")
         print(f"✅ Risk analysis: Primary risk factor identification")
@@ -262,85 +485,63 @@ class SARBImprovedMedallion:
         # Get comprehensive data for AI analysis
         ai_analysis = self._generate_comprehensive_ai_analysis()
         
-        ai_sql = f"""
-        CREATE OR REPLACE TABLE `{self.project_id}.{self.ai_dataset}.economic_analysis_insights` AS
-        SELECT 
-            GENERATE_UUID() as analysis_id,
-            CURRENT_DATE() as analysis_date,
-            @executive_summary as executive_summary,
-            @policy_assessment as policy_assessment,
-            @risk_analysis as risk_analysis,
-            @market_outlook as market_outlook,
-            @recommendations as recommendations,
-            ['Inflation persistence', 'Global trade tensions', 'Structural unemployment', 'Fiscal sustainability'] as identified_risks,
-            ['Monitor inflation expectations closely', 'Maintain current monetary stance', 'Support structural reforms', 'Enhance fiscal discipline'] as policy_actions,
-            @ai_provider as ai_provider,
-            @confidence_score as confidence_score,
-            CURRENT_TIMESTAMP() as generated_timestamp
-        """
-        
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("executive_summary", "STRING", ai_analysis['executive_summary']),
-                bigquery.ScalarQueryParameter("policy_assessment", "STRING", ai_analysis['policy_assessment']),
-                bigquery.ScalarQueryParameter("risk_analysis", "STRING", ai_analysis['risk_analysis']),
-                bigquery.ScalarQueryParameter("market_outlook", "STRING", ai_analysis['market_outlook']),
-                bigquery.ScalarQueryParameter("recommendations", "STRING", ai_analysis['recommendations']),
-                bigquery.ScalarQueryParameter("ai_provider", "STRING", ai_analysis['provider']),
-                bigquery.ScalarQueryParameter("confidence_score", "FLOAT", ai_analysis['confidence']),
-            ]
-        )
+        # One row per run, written with a load job (which also creates the table);
+        # streaming into a freshly created table can silently drop the row
+        ai_table_ref = f"{self.project_id}.{self.ai_dataset}.economic_analysis_insights"
+        generated_at = datetime.now(timezone.utc)
+        ai_row = {
+            'analysis_id': str(uuid.uuid4()),
+            'analysis_date': generated_at.date().isoformat(),
+            'executive_summary': ai_analysis['executive_summary'],
+            'policy_assessment': ai_analysis['policy_assessment'],
+            'risk_analysis': ai_analysis['risk_analysis'],
+            'market_outlook': ai_analysis['market_outlook'],
+            'recommendations': ai_analysis['recommendations'],
+            'identified_risks': ['Inflation persistence', 'Global trade tensions', 'Structural unemployment', 'Fiscal sustainability'],
+            'policy_actions': ['Monitor inflation expectations closely', 'Maintain current monetary stance', 'Support structural reforms', 'Enhance fiscal discipline'],
+            'ai_provider': ai_analysis['provider'],
+            'confidence_score': ai_analysis['confidence'],
+            'generated_timestamp': generated_at.isoformat()
+        }
         
-        self.bigquery_client.query(ai_sql, job_config=job_config).result()
-        ai_count = self._get_count(self.ai_dataset, 'economic_analysis_insights')
+        ai_written = True
+        try:
+            job_config = bigquery.LoadJobConfig(
+                schema=self.AI_INSIGHTS_SCHEMA,
+                write_disposition="WRITE_APPEND",
+                create_disposition="CREATE_IF_NEEDED",
+                source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            )
+            self.bigquery_client.load_table_from_json(
+                [ai_row], ai_table_ref, job_config=job_config
+            ).result()
+        except Exception as e:
+            ai_written = False
+            print(f"⚠️ AI insights insert failed: {e}")
         
         print(f"✅ AI analysis: {ai_analysis['provider']} generated insights")
         print(f"✅ Comprehensive analysis: Executive, policy, risk, and market outlook")
         print(f"✅ Actionable recommendations: Policy and strategic guidance")
-        print(f"✅ AI insights: {ai_count} analysis records")
         
         # 5. Create Cross-Dataset View
         print("\n📊 CROSS-DATASET REPORTING VIEW")
         print("Purpose: Unified view across all datasets for executive reporting")
         print("-" * 50)
         
-        unified_view_sql = f"""
-        CREATE OR REPLACE VIEW `{self.project_id}.{self.gold_dataset}.unified_economic_dashboard` AS
-        SELECT 
-            -- Executive Dashboard (Gold Layer)
-            ed.dashboard_date,
-            ed.gdp_growth_rate,
-            ed.inflation_rate,
-            ed.prime_rate,
-            ed.unemployment_rate,
-            ed.usd_zar_rate,
-            ed.debt_gdp_ratio,
-            ed.current_account,
-            ed.manufacturing_pmi,
-            ed.inflation_target_status,
-            ed.economic_health_score,
-            ed.primary_risk_factor,
-            ed.policy_recommendation,
-            
-            -- AI Analysis (AI Dataset) 
-            ai.executive_summary as ai_executive_summary,
-            ai.policy_assessment as ai_policy_assessment,
-            ai.risk_analysis as ai_risk_analysis,
-            ai.market_outlook as ai_market_outlook,
-            ai.ai_provider,
-            ai.confidence_score as ai_confidence,
-            
-            -- Metadata
-            ed.dashboard_generated_timestamp as last_updated
-            
-        FROM `{self.project_id}.{self.gold_dataset}.executive_economic_dashboard` ed
-        LEFT JOIN `{self.project_id}.{self.ai_dataset}.economic_analysis_insights` ai
-            ON ed.dashboard_date = ai.analysis_date
-        """
-        
-        self.bigquery_client.query(unified_view_sql).result()
+        self.bigquery_client.query(self._unified_view_sql).result()
+        ai_count = self._get_count(self.ai_dataset, 'economic_analysis_insights')
+        print(f"✅ AI insights: {ai_count} analysis records")
         print("✅ Unified view created across all datasets")
         
+        # Only stamp the hash once every downstream layer has been rebuilt;
+        # a missing AI row leaves it unstamped so the next run retries
+        if ai_written:
+            bronze_table = self.bigquery_client.get_table(bronze_ref)
+            bronze_table.labels = {**(bronze_table.labels or {}), 'payload_hash': payload_hash}
+            self.bigquery_client.update_table(bronze_table, ['labels'])
+        else:
+            print("⚠️ AI insights missing - payload hash not stamped, next run will rebuild")
+        
         # Summary
         print("\n" + "=" * 60)
         print("🎉 IMPROVED 3-TIER ARCHITECTURE COMPLETE!")
@@ -365,40 +566,45 @@ class SARBImprovedMedallion:
             'gold_records': gold_count,
             'ai_records': ai_count,
             'datasets_created': 4,
-            'architecture_improved': True
+            'architecture_improved': True,
+            'pipeline_skipped': False
         }
     
-    def _get_enhanced_economic_data(self):
+    def _get_enhanced_economic_data(self) -> List[Dict]:
         """Generate more comprehensive economic data for interesting analysis"""
-        return """[
-            STRUCT('GDP_Growth_Rate' as indicator_name, 'Economic Growth' as category, 2.3 as value, 'Percentage' as unit, DATE('2024-09-30') as date, 'SARB' as source),
-            STRUCT('Inflation_Rate', 'Price Stability', 5.4, 'Percentage', DATE('2024-09-30'), 'SARB'),
-            STRUCT('Prime_Interest_Rate', 'Monetary Policy', 11.75, 'Percentage', DATE('2024-09-30'), 'SARB'),
-            STRUCT('Unemployment_Rate', 'Employment', 32.1, 'Percentage', DATE('2024-06-30'), 'StatsSA'),
-            STRUCT('USD_ZAR_Exchange_Rate', 'Exchange Rates', 18.45, 'ZAR per USD', DATE('2024-10-21'), 'SARB'),
-            STRUCT('Government_Debt_GDP_Ratio', 'Fiscal Policy', 69.4, 'Percentage', DATE('2024-06-30'), 'National Treasury'),
-            STRUCT('Current_Account_Balance', 'External Balance', -1.2, 'Percentage of GDP', DATE('2024-06-30'), 'SARB'),
-            STRUCT('Manufacturing_PMI', 'Business Activity', 47.8, 'Index', DATE('2024-09-30'), 'Bureau for Economic Research'),
-            STRUCT('Retail_Sales_Growth', 'Consumer Spending', 1.8, 'Percentage', DATE('2024-09-30'), 'StatsSA'),
-            STRUCT('Mining_Production_Index', 'Industrial Activity', 95.2, 'Index (2015=100)', DATE('2024-09-30'), 'StatsSA'),
-            STRUCT('Business_Confidence_Index', 'Business Sentiment', 42.1, 'Index', DATE('2024-09-30'), 'Bureau for Economic Research'),
-            STRUCT('Consumer_Confidence_Index', 'Consumer Sentiment', -13.2, 'Index', DATE('2024-09-30'), 'Bureau for Economic Research')
-        ]"""
+        indicators = [
+            ('GDP_Growth_Rate', 'Economic Growth', 2.3, 'Percentage', '2024-09-30', 'SARB'),
+            ('Inflation_Rate', 'Price Stability', 5.4, 'Percentage', '2024-09-30', 'SARB'),
+            ('Prime_Interest_Rate', 'Monetary Policy', 11.75, 'Percentage', '2024-09-30', 'SARB'),
+            ('Unemployment_Rate', 'Employment', 32.1, 'Percentage', '2024-06-30', 'StatsSA'),
+            ('USD_ZAR_Exchange_Rate', 'Exchange Rates', 18.45, 'ZAR per USD', '2024-10-21', 'SARB'),
+            ('Government_Debt_GDP_Ratio', 'Fiscal Policy', 69.4, 'Percentage', '2024-06-30', 'National Treasury'),
+            ('Current_Account_Balance', 'External Balance', -1.2, 'Percentage of GDP', '2024-06-30', 'SARB'),
+            ('Manufacturing_PMI', 'Business Activity', 47.8, 'Index', '2024-09-30', 'Bureau for Economic Research'),
+            ('Retail_Sales_Growth', 'Consumer Spending', 1.8, 'Percentage', '2024-09-30', 'StatsSA'),
+            ('Mining_Production_Index', 'Industrial Activity', 95.2, 'Index (2015=100)', '2024-09-30', 'StatsSA'),
+            ('Business_Confidence_Index', 'Business Sentiment', 42.1, 'Index', '2024-09-30', 'Bureau for Economic Research'),
+            ('Consumer_Confidence_Index', 'Consumer Sentiment', -13.2, 'Index', '2024-09-30', 'Bureau for Economic Research')
+        ]
+        # Dates stay ISO strings: load_table_from_json serialises with the stdlib
+        # json encoder and the DATE schema field types them on load
+        return [
+            {'indicator_name': name, 'category': category, 'value': value,
+             'unit': unit, 'date': date, 'source': source}
+            for name, category, value, unit, date, source in indicators
+        ]
     
     def _generate_comprehensive_ai_analysis(self):
         """Generate comprehensive AI analysis with real insights"""
         if self.ai_ready:
             try:
-                # Get actual data for analysis
-                dashboard_query = f"""
-                SELECT * FROM `{self.project_id}.{self.gold_dataset}.executive_economic_dashboard`
-                LIMIT 1
-                """
-                
-                df = self.bigquery_client.query(dashboard_query).to_dataframe()
-                if not df.empty:
-                    data = df.iloc[0].to_dict()
-                    
+                # Get actual data for analysis - a direct table read, no query job
+                rows = self.bigquery_client.list_rows(
+                    f"{self.project_id}.{self.gold_dataset}.executive_economic_dashboard",
+                    max_results=1
+                )
+                data = next(iter(rows), None)
+                if data is not None:
                     prompt = f"""
                     As a senior SARB economist, provide comprehensive analysis based on these indicators:
                     
@@ -446,9 +652,22 @@ class SARBImprovedMedallion:
             'confidence': 0.95
         }
     
+    def _get_payload_hash(self, table_ref: str):
+        """Return the payload_hash label from the last complete run, if any"""
+        try:
+            return (self.bigquery_client.get_table(table_ref).labels or {}).get('payload_hash')
+        except Exception:
+            return None
+    
     def _get_count(self, dataset_id: str, table_name: str) -> int:
         """Get record count for a table in specific dataset"""
         try:
+            # Table metadata carries the row count for free; only logical views need a query
+            table = self.bigquery_client.get_table(f"{self.project_id}.{dataset_id}.{table_name}")
+            if table.table_type != 'VIEW':
+                # Streamed rows sit in the buffer before they are counted in num_rows
+                buffered = table.streaming_buffer.estimated_rows if table.streaming_buffer else 0
+                return (table.num_rows or 0) + (buffered or 0)
             query = f"SELECT COUNT(*) as cnt FROM `{self.project_id}.{dataset_id}.{table_name}`"
             result = list(self.bigquery_client.query(query).result())
             return result[0].cnt
@@ -5,27 +5,124 @@ View and interact with economic charts in Python
 """
 
 import os
-import matplotlib.pyplot as plt
-import matplotlib.image as mpimg
+import sys
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from google.cloud import bigquery
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-# Note: streamlit import moved to function level to avoid dependency issues
+# Note: streamlit, matplotlib, plotly and google.cloud imports live at function
+# level so each viewing path only pays for the libraries it uses
+
+_BQ_CLIENTS = {}
+_BQ_CLIENT_LOCK = threading.Lock()
+
+def _get_bigquery_client(project_id):
+    """Return the shared BigQuery client for a project, with a connection pool sized for parallel queries"""
+    from google.cloud import bigquery
+    from requests.adapters import HTTPAdapter
+    
+    with _BQ_CLIENT_LOCK:
+        client = _BQ_CLIENTS.get(project_id)
+        if client is None:
+            client = bigquery.Client(project=project_id)
+            # The default pool (10) would queue the concurrent chart queries and result pages
+            client._http.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16))
+            _BQ_CLIENTS[project_id] = client
+        return client
 
 class SARBChartViewer:
     """Interactive chart viewer for SARB economic data"""
     
+    # Pivoted server-side: one row per date, one column per indicator
+    TIMESERIES_QUERY = """
+    SELECT *
+    FROM (
+        SELECT 
+            date,
+            indicator,
+            value
+        FROM `brendon-presentation.sarb_gold_reporting.comprehensive_economic_history_materialized`
+        WHERE indicator IN ('GDP_Growth_Rate', 'Inflation_Rate', 'Unemployment_Rate', 'Prime_Interest_Rate')
+        AND date >= '2015-01-01'
+    )
+    PIVOT(MAX(value) FOR indicator IN (
+        'GDP_Growth_Rate' AS GDP_Growth_Rate,
+        'Inflation_Rate' AS Inflation_Rate,
+        'Unemployment_Rate' AS Unemployment_Rate,
+        'Prime_Interest_Rate' AS Prime_Interest_Rate
+    ))
+    ORDER BY date
+    """
+    
+    CYCLES_QUERY = """
+    SELECT 
+        economic_period,
+        avg_gdp_growth,
+        avg_inflation,
+        avg_unemployment,
+        avg_prime_rate,
+        period_performance_rating
+    FROM `brendon-presentation.sarb_gold_reporting.economic_cycles_analysis_materialized`
+    ORDER BY 
+        CASE economic_period
+            WHEN 'Post-Crisis Recovery' THEN 1
+            WHEN 'Commodity Decline' THEN 2
+            WHEN 'Political Uncertainty' THEN 3
+            WHEN 'COVID-19 Impact' THEN 4
+            WHEN 'Load Shedding Crisis' THEN 5
+        END
+    """
+    
+    LOADSHEDDING_QUERY = """
+    SELECT 
+        year,
+        month,
+        loadshedding_hours,
+        manufacturing_pmi,
+        loadshedding_severity
+    FROM `brendon-presentation.sarb_gold_reporting.load_shedding_impact_analysis_materialized`
+    WHERE year >= 2019
+    ORDER BY year, month
+    """
+    
+    # Load plotly.js from the CDN rather than inlining ~3MB into every file;
+    # figures were validated when built, so skip re-validating on export.
+    # No chart uses LaTeX or animation frames, so leave out those loaders too
+    HTML_EXPORT_OPTIONS = {
+        'include_plotlyjs': 'cdn',
+        'include_mathjax': False,
+        'full_html': True,
+        'validate': False,
+        'auto_play': False,
+        'config': {'displaylogo': False, 'responsive': True}
+    }
+    
     def __init__(self, project_id='brendon-presentation'):
+        try:
+            from google.cloud import bigquery_storage
+        except ImportError:  # optional: falls back to the REST download path
+            bigquery_storage = None
+        
         self.project_id = project_id
-        self.bigquery_client = bigquery.Client(project=self.project_id)
+        self.bigquery_client = _get_bigquery_client(self.project_id)
+        # Storage Read API streams Arrow batches in parallel instead of paging rows over REST
+        self._bqs_client = bigquery_storage.BigQueryReadClient() if bigquery_storage else None
         self.charts_dir = Path("analysis/charts")
+        self.query_cache_dir = Path("analysis/.qcache")
     
     def display_static_charts(self):
         """Display the generated PNG charts in Python"""
         
+        # Without a display plt.show() has nowhere to draw (and may block in CI)
+        if not os.environ.get('DISPLAY') and sys.platform not in ('darwin', 'win32'):
+            print("⏭️ No display available - skipping static chart window")
+            return None
+        
+        import matplotlib.pyplot as plt
+        
         print("📊 DISPLAYING SARB ECONOMIC CHARTS")
         print("=" * 50)
         
@@ -40,11 +137,16 @@ class SARBChartViewer:
         fig, axes = plt.subplots(1, 3, figsize=(20, 6))
         fig.suptitle('SARB Economic Pipeline - Visual Analytics Dashboard', fontsize=16, fontweight='bold')
         
-        for i, (title, filename) in enumerate(chart_files):
+        # Decode the PNGs concurrently; zlib inflation releases the GIL
+        def load(filename):
             chart_path = self.charts_dir / filename
-            
-            if chart_path.exists():
-                img = mpimg.imread(chart_path)
+            return self._load_png_cached(chart_path) if chart_path.exists() else None
+        
+        with ThreadPoolExecutor(max_workers=len(chart_files)) as executor:
+            images = list(executor.map(load, [filename for _, filename in chart_files]))
+        
+        for i, ((title, filename), img) in enumerate(zip(chart_files, images)):
+            if img is not None:
                 axes[i].imshow(img)
                 axes[i].set_title(title, fontsize=10, fontweight='bold')
                 axes[i].axis('off')
@@ -60,43 +162,54 @@ class SARBChartViewer:
         
         return fig
     
+    def _load_png_cached(self, path):
+        """Load a PNG as an array, reusing a decoded .npy copy while it is newer than the PNG"""
+        import matplotlib.image as mpimg
+        
+        cache_path = path.with_suffix('.npy')
+        if cache_path.exists() and cache_path.stat().st_mtime >= path.stat().st_mtime:
+            return np.load(cache_path, mmap_mode='r')
+        
+        img = mpimg.imread(path)
+        np.save(cache_path, img)
+        return img
+    
     def create_interactive_plotly_charts(self):
         """Create interactive Plotly charts from BigQuery data"""
         
         print("\n🎯 CREATING INTERACTIVE PLOTLY CHARTS")
         print("=" * 50)
         
+        # The three queries are independent, so run them concurrently
+        print("🔍 Querying BigQuery (3 queries in parallel)...")
+        queries = [self.TIMESERIES_QUERY, self.CYCLES_QUERY, self.LOADSHEDDING_QUERY]
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            timeseries_df, cycles_df, loadshedding_df = executor.map(self._cached_query, queries)
+        
         # 1. Interactive Economic Indicators Time Series
         print("📈 Creating interactive time series...")
-        timeseries_fig = self._create_interactive_timeseries()
+        timeseries_fig = self._create_interactive_timeseries(timeseries_df)
         
         # 2. Interactive Economic Cycles
         print("🔄 Creating interactive cycles comparison...")
-        cycles_fig = self._create_interactive_cycles()
+        cycles_fig = self._create_interactive_cycles(cycles_df)
         
         # 3. Interactive Load Shedding Analysis
         print("⚡ Creating interactive load shedding analysis...")
-        loadshedding_fig = self._create_interactive_loadshedding()
+        loadshedding_fig = self._create_interactive_loadshedding(loadshedding_df)
+        
+        timeseries_fig = self._resample(timeseries_fig)
+        loadshedding_fig = self._resample(loadshedding_fig)
         
         return timeseries_fig, cycles_fig, loadshedding_fig
     
-    def _create_interactive_timeseries(self):
+    def _create_interactive_timeseries(self, df=None):
         """Create interactive time series with Plotly"""
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
         
-        query = """
-        SELECT 
-            date,
-            indicator,
-            value,
-            economic_period,
-            trend_direction
-        FROM `brendon-presentation.sarb_gold_reporting.comprehensive_economic_history`
-        WHERE indicator IN ('GDP_Growth_Rate', 'Inflation_Rate', 'Unemployment_Rate', 'Prime_Interest_Rate')
-        AND date >= '2015-01-01'
-        ORDER BY date, indicator
-        """
-        
-        df = self.bigquery_client.query(query).to_dataframe()
+        if df is None:
+            df = self._cached_query(self.TIMESERIES_QUERY)
         df['date'] = pd.to_datetime(df['date'])
         
         # Create subplot figure
@@ -112,28 +225,31 @@ class SARBChartViewer:
         
         colors = ['#1f77b4', '#ff7f0e', '#d62728', '#2ca02c']
         
+        # Build every trace first and add them in one call (one validation pass)
+        traces, rows, cols = [], [], []
         for i, (indicator, title, color) in enumerate(zip(indicators, titles, colors)):
-            row = (i // 2) + 1
-            col = (i % 2) + 1
-            
-            indicator_data = df[df['indicator'] == indicator]
-            
-            if not indicator_data.empty:
-                fig.add_trace(
-                    go.Scatter(
-                        x=indicator_data['date'],
-                        y=indicator_data['value'],
+            if df[indicator].notna().any():
+                traces.append(
+                    go.Scattergl(
+                        x=df['date'],
+                        y=df[indicator],
                         mode='lines+markers',
                         name=indicator.replace('_', ' '),
                         line=dict(color=color, width=2),
                         marker=dict(size=4),
+                        # Dates where only other indicators report are gaps, not breaks
+                        connectgaps=True,
                         hovertemplate='<b>%{fullData.name}</b><br>' +
                                     'Date: %{x}<br>' +
                                     'Value: %{y:.1f}%<br>' +
                                     '<extra></extra>'
-                    ),
-                    row=row, col=col
+                    )
                 )
+                rows.append((i // 2) + 1)
+                cols.append((i % 2) + 1)
+        
+        if traces:
+            fig.add_traces(traces, rows=rows, cols=cols)
         
         fig.update_layout(
             title_text="SARB Economic Indicators - Interactive Dashboard (2015-2024)",
@@ -147,30 +263,12 @@ class SARBChartViewer:
         
         return fig
     
-    def _create_interactive_cycles(self):
+    def _create_interactive_cycles(self, df=None):
         """Create interactive economic cycles chart"""
+        import plotly.graph_objects as go
         
-        query = """
-        SELECT 
-            economic_period,
-            avg_gdp_growth,
-            avg_inflation,
-            avg_unemployment,
-            avg_prime_rate,
-            period_narrative,
-            period_performance_rating
-        FROM `brendon-presentation.sarb_gold_reporting.economic_cycles_analysis`
-        ORDER BY 
-            CASE economic_period
-                WHEN 'Post-Crisis Recovery' THEN 1
-                WHEN 'Commodity Decline' THEN 2
-                WHEN 'Political Uncertainty' THEN 3
-                WHEN 'COVID-19 Impact' THEN 4
-                WHEN 'Load Shedding Crisis' THEN 5
-            END
-        """
-        
-        df = self.bigquery_client.query(query).to_dataframe()
+        if df is None:
+            df = self._cached_query(self.CYCLES_QUERY)
         
         if df.empty:
             return None
@@ -182,8 +280,8 @@ class SARBChartViewer:
         metric_names = ['GDP Growth', 'Inflation', 'Unemployment', 'Prime Rate']
         colors = ['#1f77b4', '#ff7f0e', '#d62728', '#2ca02c']
         
-        for metric, name, color in zip(metrics, metric_names, colors):
-            fig.add_trace(go.Bar(
+        fig.add_traces([
+            go.Bar(
                 name=name,
                 x=df['economic_period'],
                 y=df[metric],
@@ -192,7 +290,9 @@ class SARBChartViewer:
                              'Period: %{x}<br>' +
                              'Value: %{y:.1f}%<br>' +
                              '<extra></extra>'
-            ))
+            )
+            for metric, name, color in zip(metrics, metric_names, colors)
+        ])
         
         fig.update_layout(
             title='Economic Performance by Period (2010-2024)',
@@ -205,46 +305,42 @@ class SARBChartViewer:
         )
         
         # Add performance rating annotations
-        for i, row in df.iterrows():
-            rating_color = {
-                'HIGH_PERFORMANCE': 'green',
-                'MODERATE_PERFORMANCE': 'orange',
-                'CHALLENGING_PERFORMANCE': 'red'
-            }.get(row['period_performance_rating'], 'gray')
-            
-            fig.add_annotation(
-                x=i,
-                y=max(row[metrics]) + 2,
-                text=f"🔸 {row['period_performance_rating']}",
-                showarrow=False,
-                font=dict(color=rating_color, size=10)
-            )
+        rating_colors = {
+            'HIGH_PERFORMANCE': 'green',
+            'MODERATE_PERFORMANCE': 'orange',
+            'CHALLENGING_PERFORMANCE': 'red'
+        }
+        # One text trace carries every label instead of a layout annotation per period
+        fig.add_trace(go.Scatter(
+            x=df['economic_period'],
+            y=df[metrics].max(axis=1).to_numpy() + 2,
+            mode='text',
+            text='🔸 ' + df['period_performance_rating'],
+            textfont=dict(
+                color=df['period_performance_rating'].map(rating_colors).fillna('gray'),
+                size=10
+            ),
+            showlegend=False,
+            hoverinfo='skip'
+        ))
         
         return fig
     
-    def _create_interactive_loadshedding(self):
+    def _create_interactive_loadshedding(self, df=None):
         """Create interactive load shedding analysis"""
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
         
-        query = """
-        SELECT 
-            year,
-            month,
-            loadshedding_hours,
-            manufacturing_pmi,
-            loadshedding_severity,
-            seasonal_pattern
-        FROM `brendon-presentation.sarb_gold_reporting.load_shedding_impact_analysis`
-        WHERE year >= 2019
-        ORDER BY year, month
-        """
-        
-        df = self.bigquery_client.query(query).to_dataframe()
+        if df is None:
+            df = self._cached_query(self.LOADSHEDDING_QUERY)
         
         if df.empty:
             return None
         
-        # Create date column
-        df['date'] = pd.to_datetime(df[['year', 'month']].assign(day=1))
+        # Create date column (first of each month) straight from numpy datetime arithmetic
+        years = (df['year'].to_numpy() - 1970).astype('datetime64[Y]')
+        months = (df['month'].to_numpy() - 1).astype('timedelta64[M]')
+        df['date'] = (years + months).astype('datetime64[ns]')
         
         # Create subplot figure
         fig = make_subplots(
@@ -256,37 +352,36 @@ class SARBChartViewer:
         # Plot 1: Load shedding over time
         severity_colors = {'LOW_IMPACT': 'green', 'MODERATE_IMPACT': 'orange', 'HIGH_IMPACT': 'red'}
         
-        for severity in df['loadshedding_severity'].unique():
-            severity_data = df[df['loadshedding_severity'] == severity]
-            fig.add_trace(
-                go.Scatter(
-                    x=severity_data['date'],
-                    y=severity_data['loadshedding_hours'],
-                    mode='markers',
-                    name=severity,
-                    marker=dict(
-                        color=severity_colors.get(severity, 'gray'),
-                        size=8,
-                        opacity=0.7
-                    ),
-                    hovertemplate='<b>%{fullData.name}</b><br>' +
-                                 'Date: %{x}<br>' +
-                                 'Hours: %{y}<br>' +
-                                 '<extra></extra>'
+        severity_traces = [
+            go.Scattergl(
+                x=severity_data['date'],
+                y=severity_data['loadshedding_hours'],
+                mode='markers',
+                name=severity,
+                marker=dict(
+                    color=severity_colors.get(severity, 'gray'),
+                    size=8,
+                    opacity=0.7
                 ),
-                row=1, col=1
+                hovertemplate='<b>%{fullData.name}</b><br>' +
+                             'Date: %{x}<br>' +
+                             'Hours: %{y}<br>' +
+                             '<extra></extra>'
             )
+            for severity, severity_data in df.groupby('loadshedding_severity', sort=False)
+        ]
+        fig.add_traces(severity_traces, rows=1, cols=1)
         
         # Plot 2: PMI correlation
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=df['loadshedding_hours'],
                 y=df['manufacturing_pmi'],
                 mode='markers',
                 name='PMI vs Load Shedding',
                 marker=dict(color='steelblue', size=6, opacity=0.6),
                 hovertemplate='Load Shedding: %{x} hours<br>' +
-                             'PMI: %{y}<br>' +
+                             'PMI: %{y:.1f}<br>' +
                              '<extra></extra>',
                 showlegend=False
             ),
@@ -310,8 +405,68 @@ class SARBChartViewer:
         
         return fig
     
+    def _resample(self, fig, n_samples=1000):
+        """Downsample time-series traces to ~n_samples points each when plotly-resampler is installed"""
+        if fig is None:
+            return fig
+        try:
+            from plotly_resampler import FigureResampler
+        except ImportError:  # optional: figures ship every point without it
+            return fig
+        
+        # Static HTML exports keep the aggregated view; live sessions re-aggregate on zoom
+        return FigureResampler(fig, default_n_shown_samples=n_samples)
+    
+    def _cached_query(self, query, ttl_hours=24):
+        """Return query results from the local parquet cache, refreshing after ttl_hours"""
+        key = hashlib.sha1(query.encode()).hexdigest()
+        cache_path = self.query_cache_dir / f"{key}.parquet"
+        
+        # Gold tables change at most daily, so a fresh cache file is as good as a query
+        if cache_path.exists() and time.time() - cache_path.stat().st_mtime < ttl_hours * 3600:
+            import pyarrow.parquet as pq
+            return self._arrow_to_dataframe(pq.read_table(cache_path))
+        
+        df = self._query_to_dataframe(query)
+        self.query_cache_dir.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_path, compression="zstd")
+        return df
+    
+    def _query_to_dataframe(self, query):
+        """Run a query and download the result through the Storage Read API when available"""
+        import pyarrow as pa
+        
+        table = self.bigquery_client.query(query).to_arrow(
+            bqstorage_client=self._bqs_client,
+            create_bqstorage_client=False
+        )
+        
+        # Rates, hours and PMI fit comfortably in 32 bits; halves memory and serialized size
+        narrow = {pa.float64(): pa.float32(), pa.int64(): pa.int32()}
+        table = table.cast(pa.schema([field.with_type(narrow.get(field.type, field.type)) for field in table.schema]))
+        
+        return self._arrow_to_dataframe(table)
+    
+    def _arrow_to_dataframe(self, table):
+        """Convert an Arrow table to pandas, keeping strings Arrow-backed and dates as datetime64"""
+        import pyarrow as pa
+        
+        # String columns stay in their Arrow buffers instead of becoming Python objects;
+        # numeric and date columns keep numpy dtypes, which Plotly handles natively
+        return table.to_pandas(
+            types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get,
+            date_as_object=False
+        )
+    
     def save_interactive_charts(self, timeseries_fig, cycles_fig, loadshedding_fig):
         """Save interactive charts as HTML files"""
+        import plotly.io as pio
+        try:
+            import orjson  # noqa: F401
+            # C serializer handles numpy arrays natively; much faster than the json module
+            pio.json.config.default_engine = 'orjson'
+        except ImportError:  # optional: plotly falls back to its pure-Python encoder
+            pass
         
         print("\n💾 SAVING INTERACTIVE CHARTS")
         print("=" * 40)
@@ -320,20 +475,22 @@ class SARBChartViewer:
         interactive_dir = Path("analysis/interactive_charts")
         interactive_dir.mkdir(exist_ok=True)
         
-        if timeseries_fig:
-            timeseries_path = interactive_dir / "interactive_economic_indicators.html"
-            timeseries_fig.write_html(timeseries_path)
-            print(f"✅ Saved: {timeseries_path}")
+        charts = [
+            (timeseries_fig, interactive_dir / "interactive_economic_indicators.html"),
+            (cycles_fig, interactive_dir / "interactive_economic_cycles.html"),
+            (loadshedding_fig, interactive_dir / "interactive_loadshedding_analysis.html")
+        ]
+        charts = [(fig, path) for fig, path in charts if fig]
         
-        if cycles_fig:
-            cycles_path = interactive_dir / "interactive_economic_cycles.html"
-            cycles_fig.write_html(cycles_path)
-            print(f"✅ Saved: {cycles_path}")
+        # Serialize and write the independent HTML files concurrently
+        def write(fig, path):
+            fig.write_html(path, **self.HTML_EXPORT_OPTIONS)
+            return path
         
-        if loadshedding_fig:
-            loadshedding_path = interactive_dir / "interactive_loadshedding_analysis.html"
-            loadshedding_fig.write_html(loadshedding_path)
-            print(f"✅ Saved: {loadshedding_path}")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(write, fig, path) for fig, path in charts]
+            for future in futures:
+                print(f"✅ Saved: {future.result()}")
         
         print(f"\n🌐 Interactive charts available at: {interactive_dir}")
         return interactive_dir
@@ -5,24 +5,307 @@ Creates embeddable HTML reports that integrate with Looker Studio
 """
 
 import os
+import re
+import gzip
+import time
+import hashlib
+import tempfile
+import queue
+import atexit
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
 from google.cloud import bigquery
+try:
+    from google.cloud import bigquery_storage
+except ImportError:  # optional: falls back to the REST download path
+    bigquery_storage = None
 import google.generativeai as genai
 from datetime import datetime
 import json
 
+# Embed markup is built once at import; generators only fill in the values.
+# Styles repeated on every card live in one stylesheet emitted ahead of each embed
+STYLE_BLOCK = (
+    "<style>"
+    ".sarb-card{padding:12px;border-left:4px solid;border-radius:5px;text-align:center}"
+    ".sarb-card__icon{font-size:1.2em;margin-bottom:5px}"
+    ".sarb-card__name{font-weight:bold;color:#333;font-size:0.9em;margin-bottom:3px}"
+    ".sarb-card__value{font-size:1.3em;font-weight:bold;margin-bottom:3px}"
+    ".sarb-card__yoy{font-size:0.8em;color:#666;margin-bottom:3px}"
+    ".sarb-card__note{font-size:0.7em;color:#888}"
+    ".sarb-card--improving{background:#d4edda;border-color:#28a745}"
+    ".sarb-card--improving .sarb-card__value{color:#28a745}"
+    ".sarb-card--declining{background:#f8d7da;border-color:#dc3545}"
+    ".sarb-card--declining .sarb-card__value{color:#dc3545}"
+    ".sarb-card--stable{background:#fff3cd;border-color:#ffc107}"
+    ".sarb-card--stable .sarb-card__value{color:#ffc107}"
+    ".sarb-alert{background:white;border-left:4px solid;padding:12px;border-radius:5px;"
+    "box-shadow:0 2px 5px rgba(0,0,0,0.1)}"
+    ".sarb-alert__head{display:flex;align-items:center;margin-bottom:5px}"
+    ".sarb-alert__icon{font-size:1.2em;margin-right:8px}"
+    ".sarb-alert__level{color:white;padding:2px 8px;border-radius:12px;font-size:0.8em;"
+    "font-weight:bold;margin-right:10px}"
+    ".sarb-alert__message{color:#333;font-weight:bold;flex:1}"
+    ".sarb-alert__action{color:#666;font-size:0.9em;margin-left:30px}"
+    ".sarb-alert--critical{border-color:#dc3545}.sarb-alert--critical .sarb-alert__level{background:#dc3545}"
+    ".sarb-alert--warning{border-color:#ffc107}.sarb-alert--warning .sarb-alert__level{background:#ffc107}"
+    ".sarb-alert--alert{border-color:#fd7e14}.sarb-alert--alert .sarb-alert__level{background:#fd7e14}"
+    ".sarb-alert--concern{border-color:#6f42c1}.sarb-alert--concern .sarb-alert__level{background:#6f42c1}"
+    "</style>"
+)
+
+SUMMARY_HEADER_TMPL = """
+<div style="
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
+    padding: 20px;
+    border-radius: 10px;
+    box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+    margin: 10px 0;
+">
+    <div style="text-align: center; margin-bottom: 20px;">
+        <h2 style="color: #2C5530; margin: 0; font-size: 1.5em;">
+            🏛️ SARB Executive Economic Summary
+        </h2>
+        <p style="color: #666; margin: 5px 0; font-size: 0.9em;">
+            Generated: {generated_at}
+        </p>
+    </div>
+    
+    <div style="background: white; padding: 15px; border-radius: 8px; margin-bottom: 15px;">
+        <h3 style="color: #2C5530; margin: 0 0 10px 0; font-size: 1.1em;">🤖 AI Economic Analysis</h3>
+        <p style="margin: 0; line-height: 1.4; color: #333;">
+            {ai_summary}
+        </p>
+    </div>
+    
+    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 10px;">
+"""
+
+SUMMARY_CARD_TMPL = """
+    <div class="sarb-card sarb-card--{trend_class}">
+        <div class="sarb-card__icon">{icon}</div>
+        <div class="sarb-card__name">{name}</div>
+        <div class="sarb-card__value">{value}</div>
+        <div class="sarb-card__yoy">YoY: {yoy_change} {yoy_percent}</div>
+        <div class="sarb-card__note">{interpretation}</div>
+    </div>
+"""
+
+SUMMARY_FOOTER_HTML = """
+    </div>
+    
+    <div style="text-align: center; margin-top: 15px; font-size: 0.8em; color: #666;">
+        📊 Data Source: 930+ records | 15-year analysis (2010-2024) | 🤖 AI-Enhanced
+    </div>
+</div>
+"""
+
+ALERTS_HEADER_HTML = """
+<div style="
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    background: #f8f9fa;
+    padding: 15px;
+    border-radius: 8px;
+    border: 1px solid #dee2e6;
+    margin: 10px 0;
+">
+    <h3 style="color: #495057; margin: 0 0 15px 0; font-size: 1.1em; text-align: center;">
+        🚨 Economic Alerts & Policy Signals
+    </h3>
+    <div style="display: flex; flex-direction: column; gap: 10px;">
+"""
+
+ALERT_CARD_TMPL = """
+    <div class="sarb-alert sarb-alert--{level_class}">
+        <div class="sarb-alert__head">
+            <span class="sarb-alert__icon">{icon}</span>
+            <span class="sarb-alert__level">{level}</span>
+            <span class="sarb-alert__message">{message}</span>
+        </div>
+        <div class="sarb-alert__action">📋 Recommended Action: {action}</div>
+    </div>
+"""
+
+ALERTS_FOOTER_HTML = """
+    </div>
+    <div style="text-align: center; margin-top: 12px; font-size: 0.8em; color: #6c757d;">
+        🤖 AI-powered alerts based on latest economic data
+    </div>
+</div>
+"""
+
+NO_ALERTS_HTML = """
+<div style="
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    background: #d1ecf1;
+    border: 1px solid #bee5eb;
+    color: #0c5460;
+    padding: 15px;
+    border-radius: 8px;
+    text-align: center;
+    margin: 10px 0;
+">
+    ✅ <strong>No Critical Economic Alerts</strong><br>
+    <small>All indicators within acceptable ranges</small>
+</div>
+"""
+
+@functools.lru_cache(maxsize=None)
+def _get_bigquery_client(project_id):
+    """Return a shared BigQuery client whose HTTP session keeps a sized connection pool"""
+    credentials, _ = google.auth.default(scopes=['https://www.googleapis.com/auth/cloud-platform'])
+    session = AuthorizedSession(credentials)
+    session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16))
+    return bigquery.Client(project=project_id, credentials=credentials, _http=session)
+
+@functools.lru_cache(maxsize=None)
+def _get_bqstorage_client():
+    """Return a shared Storage Read API client, or None when the package is missing"""
+    return bigquery_storage.BigQueryReadClient() if bigquery_storage else None
+
+@functools.lru_cache(maxsize=None)
+def _get_ai_model(api_key):
+    """Configure Gemini once per API key and reuse the model handle"""
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel('gemini-2.5-flash')
+
+# Background embed rendering: request handlers enqueue (embedder, kind) and return
+_RENDER_QUEUE = queue.Queue()
+_RENDER_WORKER = None
+_RENDER_WORKER_LOCK = threading.Lock()
+
+def _render_worker():
+    """Drain the render queue, running the AI call, HTML build and write off the caller's path"""
+    while True:
+        embedder, kind = _RENDER_QUEUE.get()
+        try:
+            if kind == 'summary':
+                embedder.generate_executive_summary_embed()
+            elif kind == 'alerts':
+                embedder.generate_economic_alerts_embed()
+        except Exception as e:
+            print(f"❌ Background {kind} embed failed: {e}")
+        finally:
+            _RENDER_QUEUE.task_done()
+
+def _ensure_render_worker():
+    """Start the render worker once, on first use"""
+    global _RENDER_WORKER
+    with _RENDER_WORKER_LOCK:
+        if _RENDER_WORKER is None:
+            _RENDER_WORKER = threading.Thread(target=_render_worker, name='embed-render', daemon=True)
+            _RENDER_WORKER.start()
+            # Let queued embeds finish writing before the interpreter exits
+            atexit.register(_RENDER_QUEUE.join)
+
+@functools.lru_cache(maxsize=None)
+def get_embedder(project_id='brendon-presentation'):
+    """Return the process-wide LookerReportEmbedder for a project"""
+    return LookerReportEmbedder(project_id=project_id)
+
 class LookerReportEmbedder:
     """Generate reports specifically for Looker Studio embedding"""
     
+    # Both embeds are fed by one job: each result set comes back as an array column
+    DASHBOARD_DATA_QUERY = """
+    SELECT
+        ARRAY(
+            SELECT AS STRUCT
+                indicator,
+                current_value,
+                year_over_year_change,
+                year_over_year_percent,
+                trend_direction,
+                executive_interpretation
+            FROM `brendon-presentation.sarb_gold_reporting.executive_15_year_summary`
+            ORDER BY 
+                CASE indicator
+                    WHEN 'GDP_Growth_Rate' THEN 1
+                    WHEN 'Unemployment_Rate' THEN 2
+                    WHEN 'Inflation_Rate' THEN 3
+                    WHEN 'Prime_Interest_Rate' THEN 4
+                    ELSE 5
+                END
+        ) AS summary,
+        ARRAY(
+            SELECT AS STRUCT
+                level,
+                CASE level
+                    WHEN 'CRITICAL' THEN '🚨'
+                    WHEN 'WARNING' THEN '⚠️'
+                    WHEN 'ALERT' THEN '📉'
+                    ELSE '👥'
+                END AS icon,
+                CASE level
+                    WHEN 'CRITICAL' THEN FORMAT('Load shedding at crisis levels: %.0f hours/month', value)
+                    WHEN 'WARNING' THEN FORMAT('Inflation above SARB target: %.1f%%', value)
+                    WHEN 'ALERT' THEN FORMAT('Negative GDP growth: %.1f%%', value)
+                    ELSE FORMAT('High unemployment: %.1f%%', value)
+                END AS message,
+                CASE level
+                    WHEN 'CRITICAL' THEN 'Accelerate renewable energy deployment'
+                    WHEN 'WARNING' THEN 'Monitor for potential rate adjustments'
+                    WHEN 'ALERT' THEN 'Consider economic stimulus measures'
+                    ELSE 'Focus on job creation initiatives'
+                END AS action
+            FROM (
+                SELECT 
+                    value,
+                    CASE
+                        WHEN indicator = 'Load_Shedding_Hours' AND value > 100 THEN 'CRITICAL'
+                        WHEN indicator = 'Inflation_Rate' AND value > 6 THEN 'WARNING'
+                        WHEN indicator = 'GDP_Growth_Rate' AND value < 0 THEN 'ALERT'
+                        WHEN indicator = 'Unemployment_Rate' AND value > 32 THEN 'CONCERN'
+                    END AS level
+                FROM `brendon-presentation.sarb_gold_reporting.latest_indicator_snapshot`
+            )
+            WHERE level IS NOT NULL
+        ) AS alerts
+    """
+    
+    # Card styling per trend category; the final entry also serves unknown trends (code -1)
+    TREND_CATEGORIES = ['IMPROVING', 'DECLINING', 'STABLE']
+    TREND_CLASSES = np.array(['improving', 'declining', 'stable', 'stable'])
+    TREND_ICONS = np.array(['📈', '📉', '➡️', '➡️'])
+    
+    # Gold tables refresh a few times a day; dashboard refreshes inside this window reuse results
+    DASHBOARD_CACHE_TTL_SECONDS = 900
+    DASHBOARD_CACHE_DIR = Path(tempfile.gettempdir()) / 'sarb_cache'
+    
+    # Gemini summaries are reused while the indicator snapshot they describe is unchanged
+    AI_CACHE_DIR = Path('analysis/cache')
+    AI_CACHE_TTL_SECONDS = 6 * 3600
+    # gemini-2.5-flash counts thinking tokens against this cap, so it leaves
+    # headroom beyond the two-sentence answer itself
+    AI_MAX_OUTPUT_TOKENS = 1024
+    
+    # Below this many rows the inline first page beats opening a Storage API read session
+    STORAGE_API_MIN_ROWS = 1000
+    
     def __init__(self, project_id='brendon-presentation'):
         self.project_id = project_id
-        self.bigquery_client = bigquery.Client(project=self.project_id)
+        self.bigquery_client = _get_bigquery_client(self.project_id)
+        # Storage Read API streams Arrow batches instead of paging JSON rows over REST
+        self.bqstorage_client = _get_bqstorage_client()
+        self._dashboard_data = None
+        self._dashboard_data_fetched_at = 0.0
+        # Both generators may run concurrently; only one of them should hit BigQuery
+        self._dashboard_data_lock = threading.Lock()
         
         # Initialize AI for insights
         gemini_api_key = os.getenv('GEMINI_API_KEY')
         if gemini_api_key:
-            genai.configure(api_key=gemini_api_key)
-            self.ai_model = genai.GenerativeModel('gemini-2.5-flash')
+            self.ai_model = _get_ai_model(gemini_api_key)
             self.ai_ready = True
         else:
             self.ai_ready = False
@@ -33,30 +316,24 @@ class LookerReportEmbedder:
         print("📋 Generating Executive Summary for Looker Studio...")
         
         # Get latest economic indicators
-        query = """
-        SELECT 
-            indicator,
-            current_value,
-            year_over_year_change,
-            year_over_year_percent,
-            trend_direction,
-            executive_interpretation,
-            historical_performance
-        FROM `brendon-presentation.sarb_gold_reporting.executive_15_year_summary`
-        ORDER BY 
-            CASE indicator
-                WHEN 'GDP_Growth_Rate' THEN 1
-                WHEN 'Unemployment_Rate' THEN 2
-                WHEN 'Inflation_Rate' THEN 3
-                WHEN 'Prime_Interest_Rate' THEN 4
-                ELSE 5
-            END
-        """
+        df, _ = self._fetch_all_dashboard_data()
         
-        df = self.bigquery_client.query(query).to_dataframe()
+        # Unchanged snapshot (and AI availability) means an identical prompt and page: reuse it
+        output_path = 'analysis/reports/executive_summary_embed.html'
+        hash_path = Path(output_path).parent / '.last_hash'
+        snapshot_hash = hashlib.sha256(
+            pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()
+            + str(self.ai_ready).encode()
+        ).hexdigest()
+        if hash_path.exists() and os.path.exists(output_path) \
+                and hash_path.read_text(encoding='utf-8') == snapshot_hash:
+            print(f"⏭️ Executive summary unchanged, reusing: {output_path}")
+            with open(output_path, encoding='utf-8') as f:
+                return output_path, f.read()
         
         # Generate AI insights if available
         ai_summary = ""
+        ai_failed = False
         if self.ai_ready and not df.empty:
             context = df.to_string()
             prompt = f"""
@@ -68,99 +345,66 @@ class LookerReportEmbedder:
             Style: Professional, concise, actionable for SARB executives
             """
             
-            try:
-                response = self.ai_model.generate_content(prompt)
-                ai_summary = response.text
-            except Exception as e:
-                ai_summary = "AI analysis unavailable - manual review recommended."
-        
-        # Create HTML for embedding
-        html_content = f"""
-        <div style="
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-            padding: 20px;
-            border-radius: 10px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-            margin: 10px 0;
-        ">
-            <div style="text-align: center; margin-bottom: 20px;">
-                <h2 style="color: #2C5530; margin: 0; font-size: 1.5em;">
-                    🏛️ SARB Executive Economic Summary
-                </h2>
-                <p style="color: #666; margin: 5px 0; font-size: 0.9em;">
-                    Generated: {datetime.now().strftime('%B %d, %Y at %H:%M')}
-                </p>
-            </div>
-            
-            <div style="background: white; padding: 15px; border-radius: 8px; margin-bottom: 15px;">
-                <h3 style="color: #2C5530; margin: 0 0 10px 0; font-size: 1.1em;">🤖 AI Economic Analysis</h3>
-                <p style="margin: 0; line-height: 1.4; color: #333;">
-                    {ai_summary}
-                </p>
-            </div>
+            key = hashlib.blake2b(context.encode(), digest_size=16).hexdigest()
+            cache_path = self.AI_CACHE_DIR / f"ai_{key}.txt"
             
-            <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 10px;">
-        """
-        
-        # Add indicator cards
-        for _, row in df.iterrows():
-            # Determine card color based on performance
-            if row['trend_direction'] == 'IMPROVING':
-                card_color = '#d4edda'
-                border_color = '#28a745'
-                icon = '📈'
-            elif row['trend_direction'] == 'DECLINING':
-                card_color = '#f8d7da'
-                border_color = '#dc3545'
-                icon = '📉'
+            if cache_path.exists() and time.time() - cache_path.stat().st_mtime < self.AI_CACHE_TTL_SECONDS:
+                ai_summary = cache_path.read_text(encoding='utf-8')
             else:
-                card_color = '#fff3cd'
-                border_color = '#ffc107'
-                icon = '➡️'
+                try:
+                    response = self.ai_model.generate_content(
+                        prompt,
+                        generation_config={'max_output_tokens': self.AI_MAX_OUTPUT_TOKENS}
+                    )
+                    ai_summary = response.text
+                    self.AI_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    cache_path.write_text(ai_summary, encoding='utf-8')
+                except Exception as e:
+                    ai_summary = "AI analysis unavailable - manual review recommended."
+                    ai_failed = True
+        
+        # Create HTML for embedding (pieces are collected and joined once)
+        html_parts = [STYLE_BLOCK, SUMMARY_HEADER_TMPL.format(
+            generated_at=datetime.now().strftime('%B %d, %Y at %H:%M'),
+            ai_summary=ai_summary
+        )]
+        
+        # Add indicator cards (trend classes, icons and YoY labels computed column-wise)
+        if not df.empty:
+            trend_codes = df['trend_direction'].cat.codes.to_numpy()
+            trend_classes = self.TREND_CLASSES[trend_codes]
+            icons = self.TREND_ICONS[trend_codes]
             
-            yoy_change = f"{row['year_over_year_change']:+.1f}" if pd.notna(row['year_over_year_change']) else "N/A"
-            yoy_percent = f"({row['year_over_year_percent']:+.1f}%)" if pd.notna(row['year_over_year_percent']) else ""
+            # NaN masks are computed once per column on the raw float arrays
+            yoy_change_values = df['year_over_year_change'].to_numpy(dtype=np.float64, na_value=np.nan)
+            yoy_percent_values = df['year_over_year_percent'].to_numpy(dtype=np.float64, na_value=np.nan)
+            yoy_changes = np.where(np.isnan(yoy_change_values), 'N/A',
+                                   np.char.mod('%+.1f', yoy_change_values))
+            yoy_percents = np.where(np.isnan(yoy_percent_values), '',
+                                    np.char.mod('(%+.1f%%)', yoy_percent_values))
+            names = df['indicator'].cat.rename_categories(
+                lambda name: name.replace('_', ' ')).astype(str)
+            values = df['current_value'].map('{:.1f}'.format)
             
-            html_content += f"""
-                <div style="
-                    background: {card_color};
-                    border-left: 4px solid {border_color};
-                    padding: 12px;
-                    border-radius: 5px;
-                    text-align: center;
-                ">
-                    <div style="font-size: 1.2em; margin-bottom: 5px;">{icon}</div>
-                    <div style="font-weight: bold; color: #333; font-size: 0.9em; margin-bottom: 3px;">
-                        {row['indicator'].replace('_', ' ')}
-                    </div>
-                    <div style="font-size: 1.3em; font-weight: bold; color: {border_color}; margin-bottom: 3px;">
-                        {row['current_value']:.1f}
-                    </div>
-                    <div style="font-size: 0.8em; color: #666; margin-bottom: 3px;">
-                        YoY: {yoy_change} {yoy_percent}
-                    </div>
-                    <div style="font-size: 0.7em; color: #888;">
-                        {row['executive_interpretation']}
-                    </div>
-                </div>
-            """
+            html_parts.extend(
+                SUMMARY_CARD_TMPL.format(
+                    trend_class=trend_class, icon=icon, name=name,
+                    value=value, yoy_change=yoy_change, yoy_percent=yoy_percent,
+                    interpretation=interpretation
+                )
+                for trend_class, icon, name, value, yoy_change, yoy_percent, interpretation in zip(
+                    trend_classes, icons, names, values,
+                    yoy_changes, yoy_percents, df['executive_interpretation'])
+            )
         
-        html_content += """
-            </div>
-            
-            <div style="text-align: center; margin-top: 15px; font-size: 0.8em; color: #666;">
-                📊 Data Source: 930+ records | 15-year analysis (2010-2024) | 🤖 AI-Enhanced
-            </div>
-        </div>
-        """
+        html_parts.append(SUMMARY_FOOTER_HTML)
+        html_content = "".join(html_parts)
         
         # Save as embeddable HTML
-        output_path = 'analysis/reports/executive_summary_embed.html'
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        html_content = self._write_embed(output_path, html_content)
+        # A fallback page must not be reused: leave the hash stale so the next run retries Gemini
+        if not ai_failed:
+            hash_path.write_text(snapshot_hash, encoding='utf-8')
         
         print(f"✅ Executive summary embed created: {output_path}")
         return output_path, html_content
@@ -171,138 +415,108 @@ class LookerReportEmbedder:
         print("🚨 Generating Economic Alerts for Looker Studio...")
         
         # Get latest data for alerts
-        query = """
-        SELECT 
-            indicator,
-            value,
-            trend_direction,
-            date
-        FROM `brendon-presentation.sarb_gold_reporting.comprehensive_economic_history`
-        WHERE date = (
-            SELECT MAX(date) 
-            FROM `brendon-presentation.sarb_gold_reporting.comprehensive_economic_history`
-        )
-        """
+        _, alerts_table = self._fetch_all_dashboard_data()
         
-        df = self.bigquery_client.query(query).to_dataframe()
-        
-        alerts = []
-        
-        # Generate alerts based on current conditions
-        for _, row in df.iterrows():
-            indicator = row['indicator']
-            value = row['value']
-            
-            if indicator == 'Load_Shedding_Hours' and value > 100:
-                alerts.append({
-                    'level': 'CRITICAL',
-                    'icon': '🚨',
-                    'color': '#dc3545',
-                    'message': f'Load shedding at crisis levels: {value:.0f} hours/month',
-                    'action': 'Accelerate renewable energy deployment'
-                })
-            elif indicator == 'Inflation_Rate' and value > 6:
-                alerts.append({
-                    'level': 'WARNING',
-                    'icon': '⚠️',
-                    'color': '#ffc107',
-                    'message': f'Inflation above SARB target: {value:.1f}%',
-                    'action': 'Monitor for potential rate adjustments'
-                })
-            elif indicator == 'GDP_Growth_Rate' and value < 0:
-                alerts.append({
-                    'level': 'ALERT',
-                    'icon': '📉',
-                    'color': '#fd7e14',
-                    'message': f'Negative GDP growth: {value:.1f}%',
-                    'action': 'Consider economic stimulus measures'
-                })
-            elif indicator == 'Unemployment_Rate' and value > 32:
-                alerts.append({
-                    'level': 'CONCERN',
-                    'icon': '👥',
-                    'color': '#6f42c1',
-                    'message': f'High unemployment: {value:.1f}%',
-                    'action': 'Focus on job creation initiatives'
-                })
+        # Alert rules are evaluated in BigQuery; only triggered alerts come back
+        alerts = alerts_table.to_pylist()
         
         # Create alerts HTML
         if alerts:
-            html_content = f"""
-            <div style="
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                background: #f8f9fa;
-                padding: 15px;
-                border-radius: 8px;
-                border: 1px solid #dee2e6;
-                margin: 10px 0;
-            ">
-                <h3 style="color: #495057; margin: 0 0 15px 0; font-size: 1.1em; text-align: center;">
-                    🚨 Economic Alerts & Policy Signals
-                </h3>
-                <div style="display: flex; flex-direction: column; gap: 10px;">
-            """
-            
-            for alert in alerts:
-                html_content += f"""
-                    <div style="
-                        background: white;
-                        border-left: 4px solid {alert['color']};
-                        padding: 12px;
-                        border-radius: 5px;
-                        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-                    ">
-                        <div style="display: flex; align-items: center; margin-bottom: 5px;">
-                            <span style="font-size: 1.2em; margin-right: 8px;">{alert['icon']}</span>
-                            <span style="
-                                background: {alert['color']};
-                                color: white;
-                                padding: 2px 8px;
-                                border-radius: 12px;
-                                font-size: 0.8em;
-                                font-weight: bold;
-                                margin-right: 10px;
-                            ">{alert['level']}</span>
-                            <span style="color: #333; font-weight: bold; flex: 1;">{alert['message']}</span>
-                        </div>
-                        <div style="color: #666; font-size: 0.9em; margin-left: 30px;">
-                            📋 Recommended Action: {alert['action']}
-                        </div>
-                    </div>
-                """
-            
-            html_content += """
-                </div>
-                <div style="text-align: center; margin-top: 12px; font-size: 0.8em; color: #6c757d;">
-                    🤖 AI-powered alerts based on latest economic data
-                </div>
-            </div>
-            """
+            html_parts = [STYLE_BLOCK, ALERTS_HEADER_HTML]
+            html_parts.extend(
+                ALERT_CARD_TMPL.format(level_class=alert['level'].lower(), **alert) for alert in alerts)
+            html_parts.append(ALERTS_FOOTER_HTML)
+            html_content = "".join(html_parts)
         else:
-            html_content = f"""
-            <div style="
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                background: #d1ecf1;
-                border: 1px solid #bee5eb;
-                color: #0c5460;
-                padding: 15px;
-                border-radius: 8px;
-                text-align: center;
-                margin: 10px 0;
-            ">
-                ✅ <strong>No Critical Economic Alerts</strong><br>
-                <small>All indicators within acceptable ranges</small>
-            </div>
-            """
+            html_content = NO_ALERTS_HTML
         
         # Save alerts embed
         output_path = 'analysis/reports/economic_alerts_embed.html'
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        html_content = self._write_embed(output_path, html_content)
         
         print(f"✅ Economic alerts embed created: {output_path}")
         return output_path, html_content
     
+    def queue_embed_refresh(self):
+        """Queue both embeds for background regeneration and return immediately"""
+        _ensure_render_worker()
+        _RENDER_QUEUE.put((self, 'summary'))
+        _RENDER_QUEUE.put((self, 'alerts'))
+        return _RENDER_QUEUE.qsize()
+    
+    def _write_embed(self, output_path, html_content):
+        """Minify an embed, write it plus a precompressed .gz sibling, and return the minified HTML"""
+        # The templates are indented for readability; none of that whitespace is significant
+        html_content = re.sub(r'>\s+<', '><', html_content)
+        html_content = re.sub(r'\s+', ' ', html_content).strip()
+        
+        # Encode once and hand the same bytes to both files
+        html_bytes = html_content.encode('utf-8')
+        
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, 'wb') as f:
+            f.write(html_bytes)
+        
+        # Static hosts can serve this directly with Content-Encoding: gzip
+        with gzip.open(f"{output_path}.gz", 'wb', compresslevel=6) as f:
+            f.write(html_bytes)
+        
+        return html_content
+    
+    def _fetch_all_dashboard_data(self):
+        """Fetch the executive summary and alerts data in a single BigQuery job"""
+        with self._dashboard_data_lock:
+            now = time.time()
+            if self._dashboard_data is not None and now - self._dashboard_data_fetched_at < self.DASHBOARD_CACHE_TTL_SECONDS:
+                return self._dashboard_data
+            
+            # Parquet copies let separate processes (e.g. scheduled runs) skip BigQuery too
+            key = hashlib.sha1(self.DASHBOARD_DATA_QUERY.encode()).hexdigest()
+            summary_path = self.DASHBOARD_CACHE_DIR / f"{key}_summary.parquet"
+            alerts_path = self.DASHBOARD_CACHE_DIR / f"{key}_alerts.parquet"
+            
+            cache_fresh = all(
+                path.exists() and now - path.stat().st_mtime < self.DASHBOARD_CACHE_TTL_SECONDS
+                for path in (summary_path, alerts_path)
+            )
+            if cache_fresh:
+                summary_df = pd.read_parquet(summary_path)
+                alerts_table = pq.read_table(alerts_path)
+            else:
+                # One row holding two arrays of structs; each becomes its own Arrow table
+                result = self._query_to_arrow(self.DASHBOARD_DATA_QUERY)
+                summary_df = self._struct_column_to_table(result, 'summary').to_pandas()
+                alerts_table = self._struct_column_to_table(result, 'alerts')
+                
+                # Low-cardinality labels as categoricals; trend codes index the style arrays
+                if not summary_df.empty:
+                    summary_df['indicator'] = summary_df['indicator'].astype('category')
+                    summary_df['trend_direction'] = pd.Categorical(
+                        summary_df['trend_direction'], categories=self.TREND_CATEGORIES)
+                
+                self.DASHBOARD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                summary_df.to_parquet(summary_path)
+                pq.write_table(alerts_table, alerts_path)
+            
+            self._dashboard_data = (summary_df, alerts_table)
+            self._dashboard_data_fetched_at = now
+            return self._dashboard_data
+    
+    def _query_to_arrow(self, query):
+        """Run a query via jobs.query and only use the Storage API for large results"""
+        # api_method='QUERY' returns the first page inline with the job response
+        rows = self.bigquery_client.query(query, api_method='QUERY').result()
+        
+        use_storage = rows.total_rows is not None and rows.total_rows >= self.STORAGE_API_MIN_ROWS
+        return rows.to_arrow(
+            bqstorage_client=self.bqstorage_client if use_storage else None,
+            create_bqstorage_client=False
+        )
+    
+    def _struct_column_to_table(self, result, column):
+        """Unpack the ARRAY<STRUCT> in the first row of a column into a table of its fields"""
+        return pa.Table.from_struct_array(result.column(column).combine_chunks()[0].values)
+    
     def create_looker_integration_guide(self):
         """Create step-by-step guide for embedding reports in Looker Studio"""
         
@@ -386,10 +600,10 @@ class LookerReportEmbedder:
 # Add to your Python scripts:
 # Schedule via Cloud Functions or Cloud Run
 def update_dashboard_embeds():
-    embedder = LookerReportEmbedder()
-    embedder.generate_executive_summary_embed()
-    embedder.generate_economic_alerts_embed()
-    # Upload to Google Drive or Cloud Storage
+    embedder = get_embedder()
+    # Returns immediately; a background worker renders and writes both embeds
+    embedder.queue_embed_refresh()
+    # Upload to Google Drive or Cloud Storage once the queue drains
 ```
 
 ### **For Looker Studio:**
@@ -489,14 +703,17 @@ def main():
     print("🔗 GENERATING EMBEDDABLE REPORTS FOR LOOKER STUDIO")
     print("=" * 70)
     
-    embedder = LookerReportEmbedder()
+    embedder = get_embedder()
     
-    # Generate embeddable components
+    # Generate embeddable components; the alerts render and write while the
+    # summary waits on Gemini, and both share one BigQuery fetch
     print("1️⃣ Creating Executive Summary Embed...")
-    summary_path, summary_html = embedder.generate_executive_summary_embed()
-    
     print("2️⃣ Creating Economic Alerts Embed...")
-    alerts_path, alerts_html = embedder.generate_economic_alerts_embed()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        summary_future = executor.submit(embedder.generate_executive_summary_embed)
+        alerts_future = executor.submit(embedder.generate_economic_alerts_embed)
+        summary_path, summary_html = summary_future.result()
+        alerts_path, alerts_html = alerts_future.result()
     
     print("3️⃣ Creating Integration Guide...")
     guide_path = embedder.create_looker_integration_guide()
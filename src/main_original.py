@@ -4,20 +4,42 @@ Main Cloud Run application implementing Medallion Architecture on GCP
 """
 
 import os
+import sys
+import hashlib
 import json
 import logging
+import threading
 import traceback
+import uuid
+from io import BytesIO, StringIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 import requests
 import pandas as pd
+from google.api_core.exceptions import NotFound
+from google.auth.transport import requests as google_auth_requests
+from google.oauth2 import id_token
 from google.cloud import storage
 from google.cloud import bigquery
 from google.cloud import aiplatform
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 import vertexai
 from vertexai.generative_models import GenerativeModel
 
+try:
+    import orjson
+except ImportError:
+    # optional: fall back to the stdlib parser
+    orjson = None
+
+try:
+    from google.cloud import pubsub_v1
+except ImportError:
+    # optional: AI analysis runs inline when Pub/Sub is unavailable
+    pubsub_v1 = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,35 +49,149 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
+# SARB series dates are always ISO formatted; a fixed format avoids pandas'
+# per-value format inference
+SARB_DATE_FORMAT = '%Y-%m-%d'
+
+GEMINI_MODEL_NAME = "gemini-1.5-pro"
+
+# Upper bound on waiting for Pub/Sub to acknowledge a queued AI analysis request
+PUBLISH_TIMEOUT_SECONDS = 30
+
+# SQL templates, filled in once per pipeline instance
+_GOLD_TABLE_TEMPLATE = """
+CREATE OR REPLACE TABLE `{project_id}.{dataset_id}.gold_macroeconomic_report`
+PARTITION BY DATE_TRUNC(observation_month, YEAR)
+AS
+WITH monthly_data AS (
+    SELECT 
+        DATE_TRUNC(observation_date, MONTH) as observation_month,
+        indicator_code,
+        AVG(value) as avg_value
+    FROM `{project_id}.{dataset_id}.silver_economic_indicators`
+    GROUP BY observation_month, indicator_code
+)
+SELECT 
+    observation_month,
+    MAX(CASE WHEN indicator_code = 'KBP1005M' THEN avg_value END) as prime_rate,
+    MAX(CASE WHEN indicator_code = 'KBP6006M' THEN avg_value END) as headline_cpi,
+    MAX(CASE WHEN indicator_code = 'KBP1004M' THEN avg_value END) as zar_usd_exchange_rate
+FROM monthly_data
+GROUP BY observation_month
+"""
+
+_AI_QUERY_TEMPLATE = """
+SELECT *
+FROM `{project_id}.{dataset_id}.gold_macroeconomic_report`
+WHERE observation_month >= DATE_SUB(CURRENT_DATE(), INTERVAL 18 MONTH)
+ORDER BY observation_month DESC
+"""
+
+_INSIGHTS_MERGE_TEMPLATE = """
+MERGE `{project_id}.{dataset_id}.gold_automated_insights` T
+USING (SELECT @analysis_date as analysis_date, 
+             @generated_insight as generated_insight,
+             @model_version as model_version,
+             @load_timestamp as load_timestamp) S
+ON T.analysis_date = S.analysis_date
+WHEN MATCHED THEN
+    UPDATE SET 
+        generated_insight = S.generated_insight,
+        model_version = S.model_version,
+        load_timestamp = S.load_timestamp
+WHEN NOT MATCHED THEN
+    INSERT (analysis_date, generated_insight, model_version, load_timestamp)
+    VALUES (S.analysis_date, S.generated_insight, S.model_version, S.load_timestamp)
+"""
+
+# SARB series tracked by the pipeline; codes are interned since they are
+# used as lookup keys on every run
+INDICATORS = {
+    'prime_rate': sys.intern('KBP1005M'),  # Prime Overdraft Rate
+    'cpi': sys.intern('KBP6006M'),         # Headline CPI
+    'zar_usd': sys.intern('KBP1004M')      # ZAR/USD Exchange Rate
+}
+
+# Human-readable names for SARB series codes
+_INDICATOR_NAME_MAP = {
+    INDICATORS['prime_rate']: 'Prime Overdraft Rate',
+    INDICATORS['cpi']: 'Headline Consumer Price Index',
+    INDICATORS['zar_usd']: 'ZAR to USD Exchange Rate'
+}
+
+# Clients are created once per process and shared across requests, since
+# Cloud Run keeps the container warm between invocations
+_vertex_initialized = False
+_vertex_init_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _storage_client(project_id: str) -> storage.Client:
+    return storage.Client(project=project_id)
+
+
+@lru_cache(maxsize=None)
+def _bq_client(project_id: str) -> bigquery.Client:
+    return bigquery.Client(project=project_id)
+
+
+@lru_cache(maxsize=1)
+def _gemini_model() -> GenerativeModel:
+    return GenerativeModel(GEMINI_MODEL_NAME)
+
+
+@lru_cache(maxsize=1)
+def _publisher_client():
+    return pubsub_v1.PublisherClient()
+
+
+def _init_vertexai(project_id: str, region: str) -> None:
+    global _vertex_initialized
+    if _vertex_initialized:
+        return
+    with _vertex_init_lock:
+        if not _vertex_initialized:
+            vertexai.init(project=project_id, location=region)
+            _vertex_initialized = True
+
 class SARBDataPipeline:
     """
     Main pipeline class implementing the Medallion Architecture for SARB economic data
     """
     
+    # Reuse Gemini insights for unchanged gold data within this window
+    AI_CACHE_TTL_HOURS = 24
+    
     def __init__(self, project_id=None):
         # Use assessment project by default
         self.project_id = project_id or os.getenv('GCP_PROJECT_ID', 'brendon-presentation')
         self.bucket_name = os.getenv('GCS_BUCKET_NAME', f'{self.project_id}-economic-raw-data')
         self.dataset_id = os.getenv('BIGQUERY_DATASET_ID', 'sarb_economic_data')
         self.region = os.getenv('GCP_REGION', 'us-central1')
+        self.ai_topic = os.getenv('AI_ANALYSIS_TOPIC')
         
         # Initialize GCP clients
-        self.storage_client = storage.Client(project=self.project_id)
-        self.bigquery_client = bigquery.Client(project=self.project_id)
+        self.storage_client = _storage_client(self.project_id)
+        self.bigquery_client = _bq_client(self.project_id)
+        
+        # Resolve SQL once rather than formatting it on every call
+        sql_params = {'project_id': self.project_id, 'dataset_id': self.dataset_id}
+        self._gold_table_sql = _GOLD_TABLE_TEMPLATE.format(**sql_params)
+        self._ai_query_sql = _AI_QUERY_TEMPLATE.format(**sql_params)
+        self._merge_sql = _INSIGHTS_MERGE_TEMPLATE.format(**sql_params)
+        
+        # Shared HTTP session so connections to SARB are pooled across indicators
+        self.session = requests.Session()
         
         # SARB API configuration
         self.sarb_base_url = "https://www.resbank.co.za/Research/Statistics/Pages/OnlineDownloadFacility.aspx"
-        self.indicators = {
-            'prime_rate': 'KBP1005M',  # Prime Overdraft Rate
-            'cpi': 'KBP6006M',         # Headline CPI
-            'zar_usd': 'KBP1004M'      # ZAR/USD Exchange Rate
-        }
+        self.indicators = INDICATORS
         
         # Initialize Vertex AI for optional extension
         if self.project_id and self.region:
-            vertexai.init(project=self.project_id, location=self.region)
+            _init_vertexai(self.project_id, self.region)
     
-    def fetch_sarb_data(self, indicator_code: str, start_date: str = "2010-01-01") -> Dict[str, Any]:
+    def fetch_sarb_data(self, indicator_code: str, start_date: str = "2010-01-01") -> pd.DataFrame:
         """
         Fetch data from SARB API for a specific indicator
         
@@ -64,7 +200,7 @@ class SARBDataPipeline:
             start_date: Start date in YYYY-MM-DD format
             
         Returns:
-            Raw JSON response from SARB API
+            DataFrame with date, value and indicator_code columns
         """
         try:
             # Note: This is a simplified implementation. 
@@ -75,15 +211,20 @@ class SARBDataPipeline:
             
             headers = {
                 'User-Agent': 'SARB-Economic-Pipeline/1.0',
-                'Accept': 'application/json'
+                'Accept': 'application/json',
+                'Accept-Encoding': 'gzip, deflate'
             }
             
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=30)
             response.raise_for_status()
             
-            # Parse the response - SARB typically returns CSV, so we'd need to convert
-            # For this implementation, I'll create the expected JSON structure
-            data = response.json() if response.headers.get('content-type', '').startswith('application/json') else self._convert_csv_to_json(response.text, indicator_code)
+            # Parse the response - SARB typically returns CSV, so parse it
+            # straight into columns rather than via per-row dicts
+            if response.headers.get('content-type', '').startswith('application/json'):
+                payload = orjson.loads(response.content) if orjson is not None else response.json()
+                data = self._convert_json_to_frame(payload, indicator_code)
+            else:
+                data = self._convert_csv_to_frame(response.text, indicator_code)
             
             logger.info(f"Successfully fetched data for indicator {indicator_code}")
             return data
@@ -95,30 +236,27 @@ class SARBDataPipeline:
             logger.error(f"Unexpected error fetching {indicator_code}: {str(e)}")
             raise
     
-    def _convert_csv_to_json(self, csv_data: str, indicator_code: str) -> Dict[str, Any]:
-        """Convert CSV response to JSON format"""
-        # This would implement the actual CSV to JSON conversion for SARB data
-        # For now, creating a mock structure
-        lines = csv_data.strip().split('\n')
-        headers = lines[0].split(',')
-        data_rows = []
-        
-        for line in lines[1:]:
-            values = line.split(',')
-            if len(values) >= 2:
-                data_rows.append({
-                    'date': values[0],
-                    'value': float(values[1]) if values[1].replace('.', '').isdigit() else None
-                })
-        
-        return {
-            'indicator_code': indicator_code,
-            'data': data_rows,
-            'metadata': {
-                'source': 'SARB',
-                'extracted_at': datetime.now(timezone.utc).isoformat()
-            }
-        }
+    def _convert_csv_to_frame(self, csv_data: str, indicator_code: str) -> pd.DataFrame:
+        """Parse a SARB CSV response into a DataFrame"""
+        df = pd.read_csv(
+            StringIO(csv_data),
+            usecols=[0, 1],
+            names=['date', 'value'],
+            header=0,
+            dtype={'date': str}
+        )
+        df['date'] = pd.to_datetime(df['date'], format=SARB_DATE_FORMAT, cache=True)
+        df['value'] = pd.to_numeric(df['value'], errors='coerce')
+        df['indicator_code'] = indicator_code
+        return df
+    
+    def _convert_json_to_frame(self, json_data: Dict[str, Any], indicator_code: str) -> pd.DataFrame:
+        """Normalize a JSON response into the same layout as the CSV path"""
+        df = pd.DataFrame(json_data.get('data', []), columns=['date', 'value'])
+        df['date'] = pd.to_datetime(df['date'], format=SARB_DATE_FORMAT, cache=True)
+        df['value'] = pd.to_numeric(df['value'], errors='coerce')
+        df['indicator_code'] = json_data.get('indicator_code', indicator_code)
+        return df
     
     def bronze_layer_ingestion(self) -> Dict[str, str]:
         """
@@ -134,21 +272,16 @@ class SARBDataPipeline:
             bucket = self.storage_client.bucket(self.bucket_name)
             ingested_files = {}
             
-            for indicator_name, indicator_code in self.indicators.items():
-                # Fetch raw data
-                raw_data = self.fetch_sarb_data(indicator_code)
-                
-                # Store in GCS with date partitioning
-                blob_path = f"bronze/{date_partition}/{indicator_name}.json"
-                blob = bucket.blob(blob_path)
-                
-                blob.upload_from_string(
-                    json.dumps(raw_data, indent=2),
-                    content_type='application/json'
-                )
-                
-                ingested_files[indicator_name] = f"gs://{self.bucket_name}/{blob_path}"
-                logger.info(f"Stored {indicator_name} data to {blob_path}")
+            # Fetch and upload all indicators concurrently; each one is an
+            # independent SARB round-trip followed by a GCS write
+            with ThreadPoolExecutor(max_workers=len(self.indicators)) as executor:
+                futures = {
+                    executor.submit(self._fetch_and_upload, name, code, bucket, date_partition): name
+                    for name, code in self.indicators.items()
+                }
+                for future in as_completed(futures):
+                    indicator_name, gcs_uri = future.result()
+                    ingested_files[indicator_name] = gcs_uri
             
             return ingested_files
             
@@ -156,6 +289,26 @@ class SARBDataPipeline:
             logger.error(f"Bronze layer ingestion failed: {str(e)}")
             raise
     
+    def _fetch_and_upload(self, indicator_name: str, indicator_code: str,
+                          bucket: storage.Bucket, date_partition: str) -> tuple:
+        """Fetch one indicator from SARB and store it in the bronze layer"""
+        raw_data = self.fetch_sarb_data(indicator_code)
+        
+        # Store in GCS with date partitioning as Parquet, which is smaller
+        # than JSON and reads straight back into columns in the silver layer
+        blob_path = f"bronze/{date_partition}/{indicator_name}.parquet"
+        blob = bucket.blob(blob_path)
+        
+        buffer = BytesIO()
+        raw_data.to_parquet(buffer, compression='snappy', index=False)
+        blob.upload_from_string(
+            buffer.getvalue(),
+            content_type='application/octet-stream'
+        )
+        
+        logger.info(f"Stored {indicator_name} data to {blob_path}")
+        return indicator_name, f"gs://{self.bucket_name}/{blob_path}"
+    
     def silver_layer_processing(self, bronze_files: Dict[str, str]) -> int:
         """
         Silver Layer: Process and clean data into BigQuery
@@ -168,125 +321,144 @@ class SARBDataPipeline:
         """
         try:
             bucket = self.storage_client.bucket(self.bucket_name)
-            all_records = []
             current_timestamp = datetime.now(timezone.utc)
+            prefix = f"gs://{self.bucket_name}/"
             
-            for indicator_name, gcs_path in bronze_files.items():
-                # Extract blob path from GCS URI
-                blob_path = gcs_path.replace(f"gs://{self.bucket_name}/", "")
-                blob = bucket.blob(blob_path)
-                
-                # Download and parse JSON
-                raw_data = json.loads(blob.download_as_text())
-                
-                # Transform data for silver layer
-                for data_point in raw_data.get('data', []):
-                    if data_point.get('value') is not None:
-                        record = {
-                            'observation_date': data_point['date'],
-                            'indicator_code': raw_data['indicator_code'],
-                            'indicator_name': self._get_indicator_name(raw_data['indicator_code']),
-                            'value': float(data_point['value']),
-                            'load_timestamp': current_timestamp
-                        }
-                        all_records.append(record)
-            
-            if not all_records:
+            def read_bronze(gcs_path: str) -> pd.DataFrame:
+                # Extract blob path from GCS URI, then download and parse Parquet
+                blob = bucket.blob(gcs_path.replace(prefix, ""))
+                return pd.read_parquet(BytesIO(blob.download_as_bytes()))
+            
+            # Bronze downloads are independent GCS reads, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                frames = list(executor.map(read_bronze, bronze_files.values()))
+            
+            # Transform data for silver layer in one vectorized pass
+            df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+            if not df.empty:
+                df = df.dropna(subset=['value'])
+            
+            if df.empty:
                 logger.warning("No records to process in silver layer")
                 return 0
             
+            df = df.rename(columns={'date': 'observation_date'})
+            df['indicator_name'] = df['indicator_code'].map(_INDICATOR_NAME_MAP).fillna(df['indicator_code'])
+            df['value'] = df['value'].astype('float64')
+            df['load_timestamp'] = current_timestamp
+            df = df[['observation_date', 'indicator_code', 'indicator_name', 'value', 'load_timestamp']]
+            record_count = len(df)
+            
             # Load to BigQuery
             table_id = f"{self.project_id}.{self.dataset_id}.silver_economic_indicators"
+            self._ensure_silver_table(table_id)
             
-            # Use MERGE for upsert behavior (idempotency)
-            df = pd.DataFrame(all_records)
-            df['observation_date'] = pd.to_datetime(df['observation_date']).dt.date
+            # Load into a staging table, then MERGE so re-runs update
+            # existing observations instead of appending duplicates
+            staging_id = f"{self.project_id}.{self.dataset_id}.silver_staging_{uuid.uuid4().hex}"
+            df['observation_date'] = df['observation_date'].dt.date
             
             job_config = bigquery.LoadJobConfig(
-                write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
-                schema_update_options=[bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION]
+                write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE
             )
             
-            job = self.bigquery_client.load_table_from_dataframe(
-                df, table_id, job_config=job_config
-            )
-            job.result()  # Wait for completion
+            try:
+                job = self.bigquery_client.load_table_from_dataframe(
+                    df, staging_id, job_config=job_config
+                )
+                job.result()  # Wait for completion
+                
+                merge_sql = """
+                MERGE `{table_id}` T
+                USING `{staging_id}` S
+                ON T.observation_date = S.observation_date
+                   AND T.indicator_code = S.indicator_code
+                WHEN MATCHED THEN
+                    UPDATE SET
+                        indicator_name = S.indicator_name,
+                        value = S.value,
+                        load_timestamp = S.load_timestamp
+                WHEN NOT MATCHED THEN
+                    INSERT ROW
+                """.format(table_id=table_id, staging_id=staging_id)
+                
+                self.bigquery_client.query(merge_sql).result()
+            finally:
+                self.bigquery_client.delete_table(staging_id, not_found_ok=True)
             
-            logger.info(f"Loaded {len(all_records)} records to silver layer")
-            return len(all_records)
+            logger.info(f"Loaded {record_count} records to silver layer")
+            return record_count
             
         except Exception as e:
             logger.error(f"Silver layer processing failed: {str(e)}")
             raise
     
+    def _ensure_silver_table(self, table_id: str) -> None:
+        """
+        Create the silver table partitioned by month and clustered by
+        indicator so gold and AI queries only scan the partitions they need
+        """
+        table = bigquery.Table(table_id, schema=[
+            bigquery.SchemaField('observation_date', 'DATE'),
+            bigquery.SchemaField('indicator_code', 'STRING'),
+            bigquery.SchemaField('indicator_name', 'STRING'),
+            bigquery.SchemaField('value', 'FLOAT'),
+            bigquery.SchemaField('load_timestamp', 'TIMESTAMP')
+        ])
+        table.time_partitioning = bigquery.TimePartitioning(
+            type_=bigquery.TimePartitioningType.MONTH,
+            field='observation_date'
+        )
+        table.clustering_fields = ['indicator_code']
+        self.bigquery_client.create_table(table, exists_ok=True)
+    
     def _get_indicator_name(self, indicator_code: str) -> str:
         """Map indicator codes to human-readable names"""
-        mapping = {
-            'KBP1005M': 'Prime Overdraft Rate',
-            'KBP6006M': 'Headline Consumer Price Index',
-            'KBP1004M': 'ZAR to USD Exchange Rate'
-        }
-        return mapping.get(indicator_code, indicator_code)
+        return _INDICATOR_NAME_MAP.get(indicator_code, indicator_code)
     
     def gold_layer_creation(self) -> bool:
         """
-        Gold Layer: Create/update the business-ready view
+        Gold Layer: Create/update the business-ready report table
         
         Returns:
             Success status
         """
         try:
-            view_sql = """
-            CREATE OR REPLACE VIEW `{project_id}.{dataset_id}.gold_macroeconomic_report` AS
-            WITH monthly_data AS (
-                SELECT 
-                    DATE_TRUNC(observation_date, MONTH) as observation_month,
-                    indicator_code,
-                    AVG(value) as avg_value
-                FROM `{project_id}.{dataset_id}.silver_economic_indicators`
-                GROUP BY observation_month, indicator_code
-            )
-            SELECT 
-                observation_month,
-                MAX(CASE WHEN indicator_code = 'KBP1005M' THEN avg_value END) as prime_rate,
-                MAX(CASE WHEN indicator_code = 'KBP6006M' THEN avg_value END) as headline_cpi,
-                MAX(CASE WHEN indicator_code = 'KBP1004M' THEN avg_value END) as zar_usd_exchange_rate
-            FROM monthly_data
-            GROUP BY observation_month
-            ORDER BY observation_month
-            """.format(
-                project_id=self.project_id,
-                dataset_id=self.dataset_id
-            )
-            
-            query_job = self.bigquery_client.query(view_sql)
+            # Materialize the monthly pivot once per run so downstream reads
+            # (including the AI analysis) don't re-aggregate silver each time
+            table_sql = self._gold_table_sql
+            
+            # Earlier deployments created the report as a logical view
+            report_id = f"{self.project_id}.{self.dataset_id}.gold_macroeconomic_report"
+            try:
+                if self.bigquery_client.get_table(report_id).table_type == 'VIEW':
+                    self.bigquery_client.delete_table(report_id)
+            except NotFound:
+                pass
+            
+            query_job = self.bigquery_client.query(table_sql)
             query_job.result()
             
-            logger.info("Gold layer view created/updated successfully")
+            logger.info("Gold layer table created/updated successfully")
             return True
             
         except Exception as e:
             logger.error(f"Gold layer creation failed: {str(e)}")
             raise
     
-    def run_ai_analysis(self) -> Optional[Dict[str, Any]]:
+    def run_ai_analysis(self, raise_on_error: bool = False) -> Optional[Dict[str, Any]]:
         """
         Optional AI Extension: Generate automated insights using Gemini
         
+        Args:
+            raise_on_error: Re-raise failures instead of returning None
+        
         Returns:
             Generated insights or None if disabled
         """
         try:
             # Query last 18 months of data from gold layer
-            query_sql = """
-            SELECT *
-            FROM `{project_id}.{dataset_id}.gold_macroeconomic_report`
-            WHERE observation_month >= DATE_SUB(CURRENT_DATE(), INTERVAL 18 MONTH)
-            ORDER BY observation_month DESC
-            """.format(
-                project_id=self.project_id,
-                dataset_id=self.dataset_id
-            )
+            query_sql = self._ai_query_sql
             
             query_job = self.bigquery_client.query(query_sql)
             results = query_job.result()
@@ -326,12 +498,23 @@ class SARBDataPipeline:
             }}
             """
             
-            # Generate insights using Gemini
-            model = GenerativeModel("gemini-1.5-pro")
-            response = model.generate_content(prompt)
-            
-            # Parse JSON response
-            insights = json.loads(response.text)
+            # Skip the Gemini call when the same gold data was analysed recently
+            cache_key = hashlib.blake2b(
+                pd.util.hash_pandas_object(df, index=True).values.tobytes() + GEMINI_MODEL_NAME.encode(),
+                digest_size=16
+            ).hexdigest()
+            insights = self._get_cached_insights(cache_key)
+            
+            if insights is None:
+                # Generate insights using Gemini
+                model = _gemini_model()
+                response = model.generate_content(prompt)
+                
+                # Parse JSON response
+                insights = json.loads(response.text)
+                self._cache_insights(cache_key, insights)
+            else:
+                logger.info("Reusing cached AI insights for unchanged gold data")
             
             # Store insights in BigQuery
             self._store_ai_insights(insights)
@@ -340,8 +523,66 @@ class SARBDataPipeline:
             
         except Exception as e:
             logger.error(f"AI analysis failed: {str(e)}")
+            if raise_on_error:
+                raise
             return None
     
+    def _get_cached_insights(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return cached insights for this data hash if still fresh"""
+        query_sql = """
+        SELECT insights
+        FROM `{project_id}.{dataset_id}.gold_ai_cache`
+        WHERE cache_key = @cache_key
+          AND created_at > TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {ttl_hours} HOUR)
+        ORDER BY created_at DESC
+        LIMIT 1
+        """.format(
+            project_id=self.project_id,
+            dataset_id=self.dataset_id,
+            ttl_hours=self.AI_CACHE_TTL_HOURS
+        )
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ScalarQueryParameter("cache_key", "STRING", cache_key)]
+        )
+        
+        try:
+            rows = list(self.bigquery_client.query(query_sql, job_config=job_config).result())
+        except Exception as e:
+            # A missing cache table or query failure just means a cache miss
+            logger.warning(f"AI cache lookup failed: {str(e)}")
+            return None
+        
+        return json.loads(rows[0]['insights']) if rows else None
+    
+    def _cache_insights(self, cache_key: str, insights: Dict[str, Any]) -> None:
+        """Record insights against the data hash they were generated from"""
+        cache_sql = """
+        CREATE TABLE IF NOT EXISTS `{project_id}.{dataset_id}.gold_ai_cache` (
+            cache_key STRING,
+            insights STRING,
+            model_version STRING,
+            created_at TIMESTAMP
+        );
+        INSERT INTO `{project_id}.{dataset_id}.gold_ai_cache`
+            (cache_key, insights, model_version, created_at)
+        VALUES (@cache_key, @insights, @model_version, CURRENT_TIMESTAMP());
+        """.format(
+            project_id=self.project_id,
+            dataset_id=self.dataset_id
+        )
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("cache_key", "STRING", cache_key),
+                bigquery.ScalarQueryParameter("insights", "STRING", json.dumps(insights)),
+                bigquery.ScalarQueryParameter("model_version", "STRING", GEMINI_MODEL_NAME)
+            ]
+        )
+        
+        try:
+            self.bigquery_client.query(cache_sql, job_config=job_config).result()
+        except Exception as e:
+            logger.warning(f"Failed to cache AI insights: {str(e)}")
+    
     def _store_ai_insights(self, insights: Dict[str, Any]) -> None:
         """Store AI insights in BigQuery using MERGE for idempotency"""
         try:
@@ -351,36 +592,18 @@ class SARBDataPipeline:
             insight_record = {
                 'analysis_date': analysis_date,
                 'generated_insight': insights,
-                'model_version': 'gemini-1.5-pro',
+                'model_version': GEMINI_MODEL_NAME,
                 'load_timestamp': datetime.now(timezone.utc)
             }
             
             # Use MERGE statement for upsert
-            merge_sql = """
-            MERGE `{project_id}.{dataset_id}.gold_automated_insights` T
-            USING (SELECT @analysis_date as analysis_date, 
-                         @generated_insight as generated_insight,
-                         @model_version as model_version,
-                         @load_timestamp as load_timestamp) S
-            ON T.analysis_date = S.analysis_date
-            WHEN MATCHED THEN
-                UPDATE SET 
-                    generated_insight = S.generated_insight,
-                    model_version = S.model_version,
-                    load_timestamp = S.load_timestamp
-            WHEN NOT MATCHED THEN
-                INSERT (analysis_date, generated_insight, model_version, load_timestamp)
-                VALUES (S.analysis_date, S.generated_insight, S.model_version, S.load_timestamp)
-            """.format(
-                project_id=self.project_id,
-                dataset_id=self.dataset_id
-            )
+            merge_sql = self._merge_sql
             
             job_config = bigquery.QueryJobConfig(
                 query_parameters=[
                     bigquery.ScalarQueryParameter("analysis_date", "DATE", analysis_date),
                     bigquery.ScalarQueryParameter("generated_insight", "JSON", json.dumps(insights)),
-                    bigquery.ScalarQueryParameter("model_version", "STRING", "gemini-1.5-pro"),
+                    bigquery.ScalarQueryParameter("model_version", "STRING", GEMINI_MODEL_NAME),
                     bigquery.ScalarQueryParameter("load_timestamp", "TIMESTAMP", insight_record['load_timestamp'])
                 ]
             )
@@ -394,6 +617,22 @@ class SARBDataPipeline:
             logger.error(f"Failed to store AI insights: {str(e)}")
             raise
     
+    def queue_ai_analysis(self) -> Dict[str, Any]:
+        """Publish an AI analysis request for the subscriber service"""
+        message = {'trigger': 'ai', 'date': datetime.now(timezone.utc).strftime(SARB_DATE_FORMAT)}
+        data = orjson.dumps(message) if orjson is not None else json.dumps(message).encode('utf-8')
+        
+        publisher = _publisher_client()
+        topic_path = publisher.topic_path(self.project_id, self.ai_topic)
+        # Only wait for the publish ack; the subscriber records the outcome in BigQuery
+        try:
+            message_id = publisher.publish(topic_path, data).result(timeout=PUBLISH_TIMEOUT_SECONDS)
+        except Exception as e:
+            logger.error(f"Failed to queue AI analysis: {str(e)}")
+            return {'status': 'failed', 'topic': topic_path, 'error': str(e)}
+        
+        return {'status': 'queued', 'topic': topic_path, 'message_id': message_id}
+    
     def run_full_pipeline(self) -> Dict[str, Any]:
         """
         Execute the complete data pipeline
@@ -424,13 +663,19 @@ class SARBDataPipeline:
             )
             
             # Gold Layer
-            logger.info("Creating Gold layer view...")
+            logger.info("Creating Gold layer table...")
             pipeline_result['gold_created'] = self.gold_layer_creation()
             
             # Optional AI Analysis
             if os.getenv('ENABLE_AI_ANALYSIS', 'false').lower() == 'true':
-                logger.info("Running AI analysis...")
-                pipeline_result['ai_insights'] = self.run_ai_analysis()
+                if self.ai_topic and pubsub_v1 is not None:
+                    # Hand off to the /run-ai-analysis subscriber so the
+                    # response doesn't wait on Gemini
+                    logger.info("Queueing AI analysis...")
+                    pipeline_result['ai_insights'] = self.queue_ai_analysis()
+                else:
+                    logger.info("Running AI analysis...")
+                    pipeline_result['ai_insights'] = self.run_ai_analysis()
             
             pipeline_result['end_time'] = datetime.now(timezone.utc).isoformat()
             pipeline_result['duration_seconds'] = (
@@ -449,20 +694,46 @@ class SARBDataPipeline:
         return pipeline_result
 
 # Flask routes for Cloud Run
-@app.route('/', methods=['GET'])
+_HEALTH_BODY = json.dumps({'status': 'healthy', 'service': 'sarb-economic-pipeline'})
+
+
+@app.route('/', methods=['GET'], provide_automatic_options=False)
 def health_check():
     """Health check endpoint"""
-    return jsonify({'status': 'healthy', 'service': 'sarb-economic-pipeline'})
+    return Response(_HEALTH_BODY, mimetype='application/json')
+
+def _is_authorized() -> bool:
+    """Check the bearer token sent by Cloud Scheduler"""
+    expected_token = os.getenv('SCHEDULER_AUTH_TOKEN')
+    return not expected_token or request.headers.get('Authorization') == f"Bearer {expected_token}"
+
+def _is_pubsub_push_authorized() -> bool:
+    """Verify the Google-signed OIDC token attached by the Pub/Sub push subscription"""
+    expected_account = os.getenv('AI_ANALYSIS_PUSH_SERVICE_ACCOUNT')
+    if not expected_account:
+        return True
+    
+    auth_header = request.headers.get('Authorization', '')
+    if not auth_header.startswith('Bearer '):
+        return False
+    
+    audience = os.getenv('AI_ANALYSIS_PUSH_AUDIENCE', request.url)
+    try:
+        claims = id_token.verify_oauth2_token(
+            auth_header[len('Bearer '):], google_auth_requests.Request(), audience=audience
+        )
+    except ValueError as e:
+        logger.warning(f"Rejected Pub/Sub push token: {str(e)}")
+        return False
+    
+    return claims.get('email') == expected_account and bool(claims.get('email_verified'))
 
 @app.route('/run-pipeline', methods=['POST'])
 def run_pipeline():
     """Main pipeline execution endpoint triggered by Cloud Scheduler"""
     try:
         # Verify the request is from Cloud Scheduler (basic auth check)
-        auth_header = request.headers.get('Authorization')
-        expected_token = os.getenv('SCHEDULER_AUTH_TOKEN')
-        
-        if expected_token and auth_header != f"Bearer {expected_token}":
+        if not _is_authorized():
             return jsonify({'error': 'Unauthorized'}), 401
         
         # Initialize and run pipeline
@@ -478,6 +749,23 @@ def run_pipeline():
             'error': str(e)
         }), 500
 
+@app.route('/run-ai-analysis', methods=['POST'])
+def run_ai_analysis():
+    """Pub/Sub push endpoint that runs the queued AI analysis"""
+    try:
+        # Triggers billable Gemini calls; Pub/Sub push can only send an OIDC token,
+        # not the scheduler's static bearer
+        if not _is_pubsub_push_authorized():
+            return jsonify({'error': 'Unauthorized'}), 401
+        
+        # Failures raise (-> 500) so Pub/Sub retries instead of acking the message;
+        # None here only means there was no gold data to analyse
+        insights = SARBDataPipeline().run_ai_analysis(raise_on_error=True)
+        return jsonify({'status': 'success' if insights else 'skipped'}), 200
+    except Exception as e:
+        logger.error(f"AI analysis endpoint error: {str(e)}")
+        return jsonify({'status': 'failed', 'error': str(e)}), 500
+
 @app.route('/manual-trigger', methods=['POST'])
 def manual_trigger():
     """Manual trigger endpoint for testing"""
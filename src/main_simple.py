@@ -7,19 +7,61 @@ Minimal working version for assessment demonstration
 import os
 import json
 from datetime import datetime
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
+
+try:
+    import orjson
+except ImportError:
+    # optional: fall back to the stdlib encoder
+    orjson = None
 
 app = Flask(__name__)
 
-@app.route('/')
+
+def _dumps(payload):
+    """Serialize a response payload to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+# Health and status payloads are static apart from the last execution time,
+# so they are serialized once rather than on every load balancer probe
+_HEALTH_BODY = _dumps({
+    'status': 'healthy',
+    'service': 'sarb-economic-pipeline',
+    'message': 'SARB Pipeline Cloud Run Service is running'
+})
+
+_STATUS_FIELDS = {
+    'pipeline_status': 'active',
+    'next_execution': '2025-10-24T02:00:00Z',
+    'deployment_status': 'live',
+    'cloud_run_service': 'sarb-economic-pipeline',
+    'scheduler_job': 'sarb-daily-pipeline',
+    'indicators_tracked': [
+        'Prime Overdraft Rate (KBP1005M)',
+        'Headline CPI (KBP6006M)', 
+        'ZAR/USD Exchange Rate (KBP1004M)'
+    ],
+    'compliance_status': '100% scope requirements met'
+}
+
+_LAST_EXEC = None
+_STATUS_BODY = _dumps({**_STATUS_FIELDS, 'last_execution': _LAST_EXEC})
+
+
+def _record_execution(execution_time):
+    """Remember the latest run and rebuild the cached status body"""
+    global _LAST_EXEC, _STATUS_BODY
+    _LAST_EXEC = execution_time
+    _STATUS_BODY = _dumps({**_STATUS_FIELDS, 'last_execution': execution_time})
+
+
+@app.route('/', provide_automatic_options=False)
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'service': 'sarb-economic-pipeline',
-        'message': 'SARB Pipeline Cloud Run Service is running',
-        'timestamp': datetime.now().isoformat()
-    })
+    return Response(_HEALTH_BODY, mimetype='application/json')
 
 @app.route('/run-pipeline', methods=['POST'])
 def run_pipeline():
@@ -40,6 +82,8 @@ def run_pipeline():
             'triggered_by': 'Cloud Scheduler'
         }
         
+        _record_execution(execution_result['execution_time'])
+        
         print(f"✅ Pipeline executed at {execution_result['execution_time']}")
         print(f"📊 Processed {execution_result['records_processed']} records")
         
@@ -57,23 +101,10 @@ def run_pipeline():
         
         return jsonify(error_result), 500
 
-@app.route('/status')
+@app.route('/status', provide_automatic_options=False)
 def get_status():
     """Get pipeline status"""
-    return jsonify({
-        'pipeline_status': 'active',
-        'last_execution': datetime.now().isoformat(),
-        'next_execution': '2025-10-24T02:00:00Z',
-        'deployment_status': 'live',
-        'cloud_run_service': 'sarb-economic-pipeline',
-        'scheduler_job': 'sarb-daily-pipeline',
-        'indicators_tracked': [
-            'Prime Overdraft Rate (KBP1005M)',
-            'Headline CPI (KBP6006M)', 
-            'ZAR/USD Exchange Rate (KBP1004M)'
-        ],
-        'compliance_status': '100% scope requirements met'
-    })
+    return Response(_STATUS_BODY, mimetype='application/json')
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 8080))
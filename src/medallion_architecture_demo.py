@@ -6,31 +6,83 @@ Bronze (Raw) → Silver (Cleansed) → Gold (Business Ready) → AI Insights (Se
 
 import os
 import hashlib
+import json
 import logging
+import uuid
 from datetime import datetime, timezone
-from typing import Dict, List
+from decimal import Decimal
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
 from google.cloud import bigquery
+try:
+    from google.cloud import bigquery_storage
+except ImportError:  # optional: falls back to the REST download path
+    bigquery_storage = None
 import google.generativeai as genai
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+GEMINI_MODEL_NAME = 'gemini-2.5-flash'
+
+# Dashboard inputs that determine the AI analysis; insights are reused
+# whenever these are unchanged
+AI_INPUT_COLS = [
+    'dashboard_date',
+    'gdp_growth_rate',
+    'inflation_rate',
+    'prime_interest_rate',
+    'unemployment_rate',
+    'usd_zar_exchange_rate'
+]
+
+
+@lru_cache(maxsize=4)
+def _get_client(project_id: str) -> bigquery.Client:
+    """Shared BigQuery client per project, reused across instances"""
+    return bigquery.Client(project=project_id)
+
+
+@lru_cache(maxsize=1)
+def _get_bqstorage_client():
+    """Shared Storage Read API client, or None when the package is missing"""
+    return bigquery_storage.BigQueryReadClient() if bigquery_storage else None
+
+
+@lru_cache(maxsize=1)
+def _get_gemini_model(api_key: str):
+    """Configure Gemini once and reuse the model handle"""
+    # gRPC keeps one long-lived HTTP/2 channel open across generate_content calls
+    genai.configure(api_key=api_key, transport='grpc')
+    return genai.GenerativeModel(GEMINI_MODEL_NAME)
+
+
 class SARBMedallionArchitecture:
     """Demonstrates proper 3-tier Medallion architecture"""
     
+    # Bronze batches below this size are transformed to Silver locally in
+    # pandas rather than with a BigQuery query job
+    SMALL_DATA_THRESHOLD = 10_000
+    # Below this many rows the Storage Read API's setup cost outweighs its speed
+    STORAGE_API_MIN_ROWS = 1000
+    
+    # gemini-2.5-flash counts thinking tokens against this cap; too low a cap
+    # truncates the JSON reply
+    AI_MAX_OUTPUT_TOKENS = 1024
+    
     def __init__(self, project_id='brendon-presentation', gemini_api_key=None):
         self.project_id = project_id
         self.dataset_id = 'sarb_economic_data'
-        self.bigquery_client = bigquery.Client(project=self.project_id)
+        self.bigquery_client = _get_client(self.project_id)
         
         # Initialize AI
         self.ai_ready = False
         if gemini_api_key:
             try:
-                genai.configure(api_key=gemini_api_key)
-                self.ai_model = genai.GenerativeModel('gemini-2.5-flash')
+                self.ai_model = _get_gemini_model(gemini_api_key)
                 self.ai_ready = True
             except Exception as e:
                 logger.warning(f"⚠️ AI not available: {e}")
@@ -41,7 +93,6 @@ class SARBMedallionArchitecture:
         """Create 3-tier architecture tables"""
         print("🏗️ Setting up 3-Tier Medallion Architecture...")
         
-        # Create tables one by one to avoid partition issues
         tables = [
             # Bronze Layer
             f"""
@@ -101,6 +152,7 @@ class SARBMedallionArchitecture:
                 created_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP()
             )
             PARTITION BY dashboard_date
+            CLUSTER BY dashboard_date
             """,
             
             # AI Insights - Separate Summary Table
@@ -116,18 +168,26 @@ class SARBMedallionArchitecture:
                 ai_model_version STRING,
                 ai_provider STRING,
                 confidence_score NUMERIC,
-                analysis_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP()
+                analysis_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP(),
+                content_hash STRING
             )
             PARTITION BY analysis_date
+            CLUSTER BY analysis_date, ai_provider, content_hash
             """
         ]
         
-        for i, table_sql in enumerate(tables):
-            try:
-                self.bigquery_client.query(table_sql).result()
-                logger.info(f"✅ Created table {i+1}/4")
-            except Exception as e:
-                logger.warning(f"⚠️ Table {i+1} creation issue: {e}")
+        # Submit all DDL as one multi-statement script: a single round-trip
+        script = ";\n".join(tables)
+        try:
+            job = self.bigquery_client.query(script)
+            job.result()
+            
+            # Child jobs are listed newest first
+            child_jobs = list(self.bigquery_client.list_jobs(parent_job=job.job_id))
+            for i, child in enumerate(reversed(child_jobs)):
+                logger.info(f"✅ Created table {i+1}/{len(tables)} ({child.state})")
+        except Exception as e:
+            logger.warning(f"⚠️ Table creation issue: {e}")
         
         print("✅ 3-Tier architecture setup complete!")
     
@@ -137,32 +197,35 @@ class SARBMedallionArchitecture:
         print("Purpose: Store exact copy of source data with lineage")
         print("-" * 50)
         
-        # Add metadata to raw records
-        bronze_records = []
-        for record in raw_data:
-            row_hash = hashlib.md5(
-                f"{record['indicator_name']}{record['value']}{record['date']}".encode()
-            ).hexdigest()
-            
-            bronze_record = {
-                **record,
-                'ingestion_timestamp': datetime.now(timezone.utc).isoformat(),
-                'file_source': 'demo_api',
-                'row_hash': row_hash
-            }
-            bronze_records.append(bronze_record)
+        # Add metadata to raw records column-wise
+        ingestion_timestamp = datetime.now(timezone.utc)
+        df = pd.DataFrame(raw_data)
+        hash_input = df['indicator_name'].astype(str) + df['value'].astype(str) + df['date'].astype(str)
+        df['row_hash'] = hash_input.str.encode('utf-8').map(lambda b: hashlib.blake2b(b, digest_size=16).hexdigest())
+        df['ingestion_timestamp'] = ingestion_timestamp
+        df['file_source'] = 'demo_api'
         
         # Insert into Bronze table
         table_ref = f"{self.project_id}.{self.dataset_id}.bronze_raw_indicators"
-        job_config = bigquery.LoadJobConfig(write_disposition="WRITE_TRUNCATE")
         
-        job = self.bigquery_client.load_table_from_json(
-            bronze_records, table_ref, job_config=job_config
+        # Always a load job: bronze is only ingested right after setup_architecture
+        # replaces the table, and streamed rows would neither truncate nor show in num_rows
+        # Match the table's DATE and NUMERIC column types in the Parquet payload
+        df['date'] = pd.to_datetime(df['date']).dt.date
+        df['value'] = df['value'].map(lambda v: Decimal(str(v)))
+        
+        job_config = bigquery.LoadJobConfig(
+            write_disposition="WRITE_TRUNCATE",
+            source_format=bigquery.SourceFormat.PARQUET
+        )
+        
+        job = self.bigquery_client.load_table_from_dataframe(
+            df, table_ref, job_config=job_config
         )
         job.result()
         
         audit_id = f"bronze_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        print(f"✅ Raw data stored: {len(bronze_records)} records")
+        print(f"✅ Raw data stored: {len(df)} records")
         print(f"✅ Data lineage: Each record has row_hash for tracking")
         print(f"✅ Audit ID: {audit_id}")
         
@@ -175,20 +238,32 @@ class SARBMedallionArchitecture:
         print("-" * 50)
         
         # Transform Bronze → Silver with data quality and enrichments
+        bronze_table = f"{self.project_id}.{self.dataset_id}.bronze_raw_indicators"
+        silver_table = f"{self.project_id}.{self.dataset_id}.silver_economic_indicators"
+        
+        if self.bigquery_client.get_table(bronze_table).num_rows < self.SMALL_DATA_THRESHOLD:
+            count = self._silver_layer_local(bronze_table, silver_table)
+            self._print_silver_summary(count)
+            return count
+        
         silver_sql = f"""
-        INSERT INTO `{self.project_id}.{self.dataset_id}.silver_economic_indicators`
-        (
-            indicator_id, indicator_name, indicator_category, value, unit, date, source,
-            is_validated, confidence_score, created_timestamp, source_row_hash,
-            previous_value, period_change, period_change_percent
-        )
+        CREATE OR REPLACE TABLE `{silver_table}`
+        PARTITION BY date
+        CLUSTER BY indicator_category, indicator_name
+        AS
         WITH deduplicated AS (
+            SELECT *
+            FROM `{bronze_table}`
+            WHERE value IS NOT NULL
+            QUALIFY ROW_NUMBER() OVER (
+                PARTITION BY indicator_name, date, value 
+                ORDER BY ingestion_timestamp DESC
+            ) = 1
+        ),
+        with_previous AS (
             SELECT *,
-                ROW_NUMBER() OVER (
-                    PARTITION BY indicator_name, date, value 
-                    ORDER BY ingestion_timestamp DESC
-                ) as rn
-            FROM `{self.project_id}.{self.dataset_id}.bronze_raw_indicators`
+                LAG(value) OVER (PARTITION BY indicator_name ORDER BY date) as prev
+            FROM deduplicated
         ),
         enriched AS (
             SELECT 
@@ -202,41 +277,98 @@ class SARBMedallionArchitecture:
                 
                 -- Data Quality Validation
                 CASE WHEN value IS NOT NULL AND value >= 0 THEN TRUE ELSE FALSE END as is_validated,
-                CASE WHEN value IS NOT NULL AND value >= 0 THEN 1.0 ELSE 0.5 END as confidence_score,
+                CAST(CASE WHEN value IS NOT NULL AND value >= 0 THEN 1.0 ELSE 0.5 END AS NUMERIC) as confidence_score,
                 
                 CURRENT_TIMESTAMP() as created_timestamp,
                 row_hash as source_row_hash,
                 
                 -- Business Logic: Previous values and period changes
-                LAG(value) OVER (PARTITION BY indicator_name ORDER BY date) as previous_value,
-                value - LAG(value) OVER (PARTITION BY indicator_name ORDER BY date) as period_change,
-                SAFE_DIVIDE(
-                    value - LAG(value) OVER (PARTITION BY indicator_name ORDER BY date),
-                    LAG(value) OVER (PARTITION BY indicator_name ORDER BY date)
-                ) * 100 as period_change_percent
+                prev as previous_value,
+                value - prev as period_change,
+                SAFE_DIVIDE(value - prev, prev) * 100 as period_change_percent
                 
-            FROM deduplicated
-            WHERE rn = 1 AND value IS NOT NULL
+            FROM with_previous
         )
         SELECT * FROM enriched
         """
         
-        # Clear and rebuild Silver table
-        self.bigquery_client.query(f"DELETE FROM `{self.project_id}.{self.dataset_id}.silver_economic_indicators` WHERE 1=1").result()
+        # Rebuild Silver table in a single statement
         self.bigquery_client.query(silver_sql).result()
         
-        # Get count
-        count_result = self.bigquery_client.query(
-            f"SELECT COUNT(*) as cnt FROM `{self.project_id}.{self.dataset_id}.silver_economic_indicators`"
-        ).result()
-        count = list(count_result)[0].cnt
+        # Get count from table metadata
+        count = self.bigquery_client.get_table(silver_table).num_rows
+        self._print_silver_summary(count)
         
+        return count
+    
+    @staticmethod
+    def _print_silver_summary(count: int):
         print(f"✅ Data cleansing: Removed duplicates and invalid records")
         print(f"✅ Data validation: Added quality flags and confidence scores")
         print(f"✅ Business enrichment: Added period changes and trends")
         print(f"✅ Records processed: {count}")
+    
+    @staticmethod
+    def _to_numeric(series: pd.Series) -> pd.Series:
+        """Convert floats to Decimals for BigQuery NUMERIC columns (9 d.p.)"""
+        return series.round(9).map(lambda v: None if pd.isna(v) else Decimal(str(v)))
+    
+    def _rows_to_dataframe(self, rows) -> pd.DataFrame:
+        """Download a row iterator, using the Storage Read API only for large results"""
+        use_storage = rows.total_rows is not None and rows.total_rows >= self.STORAGE_API_MIN_ROWS
+        return rows.to_dataframe(
+            bqstorage_client=_get_bqstorage_client() if use_storage else None,
+            create_bqstorage_client=False
+        )
+    
+    def _query_to_dataframe(self, query: str) -> pd.DataFrame:
+        """Run a query and download its results via _rows_to_dataframe"""
+        return self._rows_to_dataframe(self.bigquery_client.query(query).result())
+    
+    def _silver_layer_local(self, bronze_table: str, silver_table: str) -> int:
+        """Same Silver transform as the SQL path, computed in pandas for small inputs"""
+        df = self._rows_to_dataframe(self.bigquery_client.list_rows(bronze_table))
+        
+        # Deduplicate, keeping the latest ingestion of each observation
+        df = df[df['value'].notna()]
+        df = (
+            df.sort_values(['indicator_name', 'date', 'ingestion_timestamp'])
+            .drop_duplicates(['indicator_name', 'date', 'value'], keep='last')
+        )
         
-        return count
+        # Previous values and period changes per indicator
+        values = df['value'].astype('float64')
+        previous = values.groupby(df['indicator_name']).shift()
+        change = values - previous
+        validated = values >= 0
+        
+        silver = pd.DataFrame({
+            'indicator_id': [str(uuid.uuid4()) for _ in range(len(df))],
+            'indicator_name': df['indicator_name'],
+            'indicator_category': df['category'],
+            'value': df['value'],
+            'unit': df['unit'],
+            'date': df['date'],
+            'source': df['source'],
+            'is_validated': validated,
+            'confidence_score': validated.map({True: Decimal('1.0'), False: Decimal('0.5')}),
+            'created_timestamp': datetime.now(timezone.utc),
+            'source_row_hash': df['row_hash'],
+            'previous_value': self._to_numeric(previous),
+            'period_change': self._to_numeric(change),
+            # SAFE_DIVIDE semantics: NULL when the previous value is zero
+            'period_change_percent': self._to_numeric(change / previous.where(previous != 0) * 100)
+        })
+        
+        job_config = bigquery.LoadJobConfig(
+            write_disposition="WRITE_TRUNCATE",
+            source_format=bigquery.SourceFormat.PARQUET
+        )
+        self.bigquery_client.load_table_from_dataframe(
+            silver, silver_table, job_config=job_config
+        ).result()
+        
+        return len(silver)
     
     def gold_layer_business_ready(self) -> int:
         """GOLD LAYER: Business-ready reporting optimized tables"""
@@ -245,14 +377,12 @@ class SARBMedallionArchitecture:
         print("-" * 50)
         
         # Create executive dashboard with business KPIs
+        gold_table = f"{self.project_id}.{self.dataset_id}.gold_executive_dashboard"
         gold_sql = f"""
-        INSERT INTO `{self.project_id}.{self.dataset_id}.gold_executive_dashboard`
-        (
-            dashboard_date, gdp_growth_rate, inflation_rate, prime_interest_rate, 
-            unemployment_rate, usd_zar_exchange_rate, inflation_target_variance, 
-            monetary_policy_stance, economic_health_score, gdp_trend, inflation_trend, 
-            exchange_rate_trend, inflation_risk_level, created_timestamp
-        )
+        CREATE OR REPLACE TABLE `{gold_table}`
+        PARTITION BY dashboard_date
+        CLUSTER BY dashboard_date
+        AS
         WITH latest_indicators AS (
             SELECT 
                 indicator_name,
@@ -281,7 +411,7 @@ class SARBMedallionArchitecture:
             usd_zar_exchange_rate,
             
             -- Business KPIs
-            ABS(inflation_rate - 4.5) as inflation_target_variance,
+            CAST(ABS(inflation_rate - 4.5) AS NUMERIC) as inflation_target_variance,
             
             CASE 
                 WHEN prime_interest_rate > 10 THEN 'Restrictive'
@@ -290,9 +420,9 @@ class SARBMedallionArchitecture:
             END as monetary_policy_stance,
             
             -- Economic Health Score (0-100)
-            GREATEST(0, LEAST(100, 
+            CAST(GREATEST(0, LEAST(100, 
                 50 + (gdp_growth_rate * 10) - (ABS(inflation_rate - 4.5) * 5) - ((unemployment_rate - 25) * 0.5)
-            )) as economic_health_score,
+            )) AS NUMERIC) as economic_health_score,
             
             -- Business Trends
             CASE 
@@ -326,15 +456,11 @@ class SARBMedallionArchitecture:
         WHERE dashboard_date IS NOT NULL
         """
         
-        # Clear and rebuild Gold table
-        self.bigquery_client.query(f"DELETE FROM `{self.project_id}.{self.dataset_id}.gold_executive_dashboard` WHERE 1=1").result()
+        # Rebuild Gold table in a single statement
         self.bigquery_client.query(gold_sql).result()
         
-        # Get count
-        count_result = self.bigquery_client.query(
-            f"SELECT COUNT(*) as cnt FROM `{self.project_id}.{self.dataset_id}.gold_executive_dashboard`"
-        ).result()
-        count = list(count_result)[0].cnt
+        # Get count from table metadata
+        count = self.bigquery_client.get_table(gold_table).num_rows
         
         print(f"✅ Business KPIs: Inflation target variance, policy stance, health score")
         print(f"✅ Trend analysis: GDP, inflation, and exchange rate trends")
@@ -351,21 +477,7 @@ class SARBMedallionArchitecture:
         
         if not self.ai_ready:
             print("⚠️ AI not available - using professional fallback")
-            insight_id = f"fallback_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            
-            fallback_record = [{
-                'insight_id': insight_id,
-                'analysis_date': datetime.now().date().isoformat(),
-                'executive_summary': 'Professional economic analysis: Current indicators show moderate growth with inflation within SARB target range.',
-                'monetary_policy_assessment': 'Restrictive monetary policy stance appropriate for current economic conditions.',
-                'exchange_rate_analysis': 'ZAR shows relative stability against USD with ongoing external pressures.',
-                'risk_factors': ['Inflation persistence', 'Global sentiment', 'Structural unemployment'],
-                'policy_recommendations': ['Maintain current stance', 'Monitor inflation expectations', 'Support structural reforms'],
-                'ai_model_version': 'professional_fallback',
-                'ai_provider': 'fallback',
-                'confidence_score': 0.9,
-                'analysis_timestamp': datetime.now(timezone.utc).isoformat()
-            }]
+            insight_id, fallback_record = self._fallback_insight()
         else:
             # Get latest dashboard data for AI analysis
             dashboard_query = f"""
@@ -373,49 +485,66 @@ class SARBMedallionArchitecture:
             ORDER BY dashboard_date DESC LIMIT 1
             """
             
-            df = self.bigquery_client.query(dashboard_query).to_dataframe()
+            df = self._query_to_dataframe(dashboard_query)
             if df.empty:
                 print("⚠️ No dashboard data for AI analysis")
                 return None
             
             data = df.iloc[0].to_dict()
             
-            # Generate AI insights
-            prompt = f"""
-            As a senior SARB economist, provide concise analysis of:
-            GDP Growth: {data.get('gdp_growth_rate', 'N/A')}%
-            Inflation: {data.get('inflation_rate', 'N/A')}%
-            Interest Rate: {data.get('prime_interest_rate', 'N/A')}%
-            Exchange Rate: R{data.get('usd_zar_exchange_rate', 'N/A')}/USD
+            # Reuse an earlier insight generated from identical inputs
+            content_hash = hashlib.sha256(
+                json.dumps({k: data.get(k) for k in sorted(AI_INPUT_COLS)}, default=str).encode()
+            ).hexdigest()
+            cached_id = self._find_cached_insight(content_hash)
+            if cached_id:
+                print(f"♻️ Dashboard inputs unchanged - reused insight {cached_id}")
+                return cached_id
             
-            Provide: Executive summary (1 sentence), Policy assessment (1 sentence), Exchange analysis (1 sentence), 3 key risks, 3 recommendations.
-            """
+            # Generate AI insights
+            prompt = (
+                "SARB economist. One sentence each. Return JSON with keys "
+                "summary, policy, exchange, risks[3], recommendations[3]. "
+                f"GDP {data.get('gdp_growth_rate', 'N/A')}%, "
+                f"CPI {data.get('inflation_rate', 'N/A')}%, "
+                f"prime {data.get('prime_interest_rate', 'N/A')}%, "
+                f"USD/ZAR {data.get('usd_zar_exchange_rate', 'N/A')}"
+            )
             
             try:
-                response = self.ai_model.generate_content(prompt)
-                ai_text = response.text
+                response = self.ai_model.generate_content(
+                    prompt,
+                    generation_config={
+                        'response_mime_type': 'application/json',
+                        'max_output_tokens': self.AI_MAX_OUTPUT_TOKENS
+                    }
+                )
+                ai_result = json.loads(response.text)
                 
                 insight_id = f"ai_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
                 
                 fallback_record = [{
                     'insight_id': insight_id,
                     'analysis_date': data['dashboard_date'],
-                    'executive_summary': ai_text[:200] + '...' if len(ai_text) > 200 else ai_text,
-                    'monetary_policy_assessment': 'AI-generated monetary policy analysis',
-                    'exchange_rate_analysis': 'AI-generated exchange rate analysis',
-                    'risk_factors': ['AI-identified risk 1', 'AI-identified risk 2', 'AI-identified risk 3'],
-                    'policy_recommendations': ['AI recommendation 1', 'AI recommendation 2', 'AI recommendation 3'],
-                    'ai_model_version': 'gemini-2.5-flash',
+                    'executive_summary': ai_result.get('summary', ''),
+                    'monetary_policy_assessment': ai_result.get('policy', ''),
+                    'exchange_rate_analysis': ai_result.get('exchange', ''),
+                    'risk_factors': list(ai_result.get('risks', []))[:3],
+                    'policy_recommendations': list(ai_result.get('recommendations', []))[:3],
+                    'ai_model_version': GEMINI_MODEL_NAME,
                     'ai_provider': 'gemini_api',
                     'confidence_score': 0.85,
-                    'analysis_timestamp': datetime.now(timezone.utc).isoformat()
+                    'analysis_timestamp': datetime.now(timezone.utc).isoformat(),
+                    'content_hash': content_hash
                 }]
                 
                 print(f"✅ Real AI analysis generated with Gemini 2.5 Flash")
                 
             except Exception as e:
-                print(f"⚠️ AI generation failed: {e}")
-                return None
+                # Truncated/invalid JSON still gets a stored insight; no content_hash,
+                # so the next run retries Gemini for these inputs
+                print(f"⚠️ AI generation failed: {e} - using professional fallback")
+                insight_id, fallback_record = self._fallback_insight()
         
         # Insert AI insights
         table_ref = f"{self.project_id}.{self.dataset_id}.ai_economic_insights"
@@ -432,6 +561,46 @@ class SARBMedallionArchitecture:
         
         return insight_id
     
+    @staticmethod
+    def _fallback_insight():
+        """Professional (non-AI) insight record, used when Gemini is unavailable or fails"""
+        insight_id = f"fallback_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        
+        fallback_record = [{
+            'insight_id': insight_id,
+            'analysis_date': datetime.now().date().isoformat(),
+            'executive_summary': 'Professional economic analysis: Current indicators show moderate growth with inflation within SARB target range.',
+            'monetary_policy_assessment': 'Restrictive monetary policy stance appropriate for current economic conditions.',
+            'exchange_rate_analysis': 'ZAR shows relative stability against USD with ongoing external pressures.',
+            'risk_factors': ['Inflation persistence', 'Global sentiment', 'Structural unemployment'],
+            'policy_recommendations': ['Maintain current stance', 'Monitor inflation expectations', 'Support structural reforms'],
+            'ai_model_version': 'professional_fallback',
+            'ai_provider': 'fallback',
+            'confidence_score': 0.9,
+            'analysis_timestamp': datetime.now(timezone.utc).isoformat()
+        }]
+        return insight_id, fallback_record
+    
+    def _find_cached_insight(self, content_hash: str) -> Optional[str]:
+        """Insight ID previously generated for these dashboard inputs, if any"""
+        lookup_query = f"""
+        SELECT insight_id
+        FROM `{self.project_id}.{self.dataset_id}.ai_economic_insights`
+        WHERE content_hash = @content_hash
+        LIMIT 1
+        """
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ScalarQueryParameter("content_hash", "STRING", content_hash)]
+        )
+        
+        try:
+            rows = list(self.bigquery_client.query(lookup_query, job_config=job_config).result())
+        except Exception as e:
+            logger.warning(f"⚠️ Insight cache lookup failed: {e}")
+            return None
+        
+        return rows[0].insight_id if rows else None
+    
     def show_final_reporting_view(self):
         """Show the final optimized reporting view"""
         print("\n📊 FINAL REPORTING VIEW - Optimized for Business Users")
@@ -467,7 +636,7 @@ class SARBMedallionArchitecture:
         LIMIT 5
         """
         
-        df = self.bigquery_client.query(report_query).to_dataframe()
+        df = self._query_to_dataframe(report_query)
         
         if not df.empty:
             print("✅ Final reporting view:")
@@ -481,6 +650,70 @@ class SARBMedallionArchitecture:
         
         return df
     
+    @staticmethod
+    def _payload_hash(raw_data: List[Dict]) -> str:
+        """Content hash of the raw input, independent of record order"""
+        ordered = sorted(raw_data, key=itemgetter('indicator_name', 'date'))
+        return hashlib.sha256(json.dumps(ordered, sort_keys=True, default=str).encode()).hexdigest()
+    
+    def _get_cached_stages(self, payload_hash: str) -> Dict[str, Tuple[str, datetime]]:
+        """Latest recorded (result, timestamp) per stage for this payload, if any"""
+        cache_query = f"""
+        SELECT stage, ARRAY_AGG(audit_id ORDER BY ts DESC LIMIT 1)[OFFSET(0)] as audit_id, MAX(ts) as ts
+        FROM `{self.project_id}.{self.dataset_id}.pipeline_run_cache`
+        WHERE payload_hash = @payload_hash
+        GROUP BY stage
+        """
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ScalarQueryParameter("payload_hash", "STRING", payload_hash)]
+        )
+        
+        try:
+            rows = self.bigquery_client.query(cache_query, job_config=job_config).result()
+            return {row.stage: (row.audit_id, row.ts) for row in rows}
+        except Exception as e:
+            # No cache table yet (or lookup failed) - treat as a miss
+            logger.info(f"Pipeline cache miss: {e}")
+            return {}
+    
+    def _tables_unchanged_since(self, ts: datetime, table_names: List[str]) -> bool:
+        """True if none of the tables were modified after ts (e.g. by another pipeline)"""
+        try:
+            return all(
+                self.bigquery_client.get_table(f"{self.project_id}.{self.dataset_id}.{name}").modified <= ts
+                for name in table_names
+            )
+        except Exception as e:
+            logger.info(f"Pipeline cache not verifiable: {e}")
+            return False
+    
+    def _record_cached_stages(self, payload_hash: str, stages: Dict[str, str]):
+        """Remember stage results so identical inputs can skip them next run"""
+        cache_table = f"{self.project_id}.{self.dataset_id}.pipeline_run_cache"
+        record_sql = f"""
+        CREATE TABLE IF NOT EXISTS `{cache_table}` (
+            stage STRING,
+            payload_hash STRING,
+            audit_id STRING,
+            ts TIMESTAMP
+        );
+        INSERT INTO `{cache_table}` (stage, payload_hash, audit_id, ts)
+        SELECT stage, @payload_hash, @audit_ids[OFFSET(pos)], CURRENT_TIMESTAMP()
+        FROM UNNEST(@stages) AS stage WITH OFFSET pos
+        """
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("payload_hash", "STRING", payload_hash),
+                bigquery.ArrayQueryParameter("stages", "STRING", list(stages.keys())),
+                bigquery.ArrayQueryParameter("audit_ids", "STRING", list(stages.values()))
+            ]
+        )
+        
+        try:
+            self.bigquery_client.query(record_sql, job_config=job_config).result()
+        except Exception as e:
+            logger.warning(f"⚠️ Could not record pipeline cache: {e}")
+    
     def run_complete_demo(self, sample_data: List[Dict]):
         """Run the complete 3-tier demonstration"""
         print("🎯 SARB 3-TIER MEDALLION ARCHITECTURE DEMONSTRATION")
@@ -488,12 +721,29 @@ class SARBMedallionArchitecture:
         print("Architecture: Bronze → Silver → Gold → AI Insights (Separate)")
         print("=" * 70)
         
-        # Setup
-        self.setup_architecture()
+        # Identical input produces identical bronze/silver tables, so reuse
+        # the previous run's results instead of rebuilding them
+        payload_hash = self._payload_hash(sample_data)
+        cached = self._get_cached_stages(payload_hash)
+        
+        # The cache row only counts if bronze/silver haven't been rewritten since
+        # (the other demo pipelines write the same dataset)
+        if 'bronze' in cached and 'silver' in cached and self._tables_unchanged_since(
+            min(cached['bronze'][1], cached['silver'][1]),
+            ['bronze_raw_indicators', 'silver_economic_indicators']
+        ):
+            print("\n♻️ Input unchanged since last run - reusing Bronze and Silver layers")
+            bronze_id = cached['bronze'][0]
+            silver_count = int(cached['silver'][0])
+        else:
+            # Setup
+            self.setup_architecture()
+            
+            # Run each layer
+            bronze_id = self.bronze_layer_ingestion(sample_data)
+            silver_count = self.silver_layer_processing()
+            self._record_cached_stages(payload_hash, {'bronze': bronze_id, 'silver': str(silver_count)})
         
-        # Run each layer
-        bronze_id = self.bronze_layer_ingestion(sample_data)
-        silver_count = self.silver_layer_processing()
         gold_count = self.gold_layer_business_ready()
         ai_id = self.ai_insights_layer()
         
@@ -5,38 +5,132 @@ Bronze (Raw) → Silver (Cleansed) → Gold (Business Ready) → AI Insights
 """
 
 import os
+import sys
+import atexit
 import json
 import hashlib
 import logging
+import logging.handlers
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
 from datetime import datetime, timezone
+from io import BytesIO
 from typing import Dict, List, Optional
 import pandas as pd
+import sqlparse
 from google.cloud import storage
 from google.cloud import bigquery
+from google.api_core.exceptions import NotFound
+try:
+    from google.cloud import bigquery_storage
+except ImportError:  # optional: falls back to the REST download path
+    bigquery_storage = None
 import google.generativeai as genai
 
+try:
+    import orjson
+except ImportError:
+    # optional: fall back to the stdlib encoder
+    orjson = None
+
+class _PhaseLogHandler(logging.handlers.BufferingHandler):
+    """Hold formatted records and write them to stdout in one call per flush
+
+    run_full_pipeline flushes at each phase boundary; errors flush immediately
+    and logging.shutdown flushes whatever is left at exit.
+    """
+    
+    def __init__(self, capacity: int = 10_000):
+        super().__init__(capacity)
+    
+    def shouldFlush(self, record):
+        return len(self.buffer) >= self.capacity or record.levelno >= logging.ERROR
+    
+    def flush(self):
+        self.acquire()
+        try:
+            if self.buffer:
+                sys.stdout.write("".join(self.format(record) + "\n" for record in self.buffer))
+                sys.stdout.flush()
+                self.buffer.clear()
+        finally:
+            self.release()
+
 # Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+_PHASE_LOG = _PhaseLogHandler()
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s', handlers=[_PHASE_LOG])
 logger = logging.getLogger(__name__)
 
+def _to_ndjson(records: List[Dict]) -> bytes:
+    """Serialize records to newline-delimited JSON bytes (dates/datetimes as ISO strings)"""
+    if orjson is not None:
+        return b"\n".join(orjson.dumps(record) for record in records)
+    return "\n".join(json.dumps(record, default=str) for record in records).encode('utf-8')
+
+
+# Gemini prompt, compiled once; missing fields render as N/A via format_map
+_AI_PROMPT_TEMPLATE = """
+As a senior economist at the South African Reserve Bank, analyze the following economic dashboard data and provide professional insights:
+
+Economic Indicators:
+- GDP Growth: {gdp_growth_rate}%
+- Inflation Rate: {inflation_rate}%
+- Prime Interest Rate: {prime_interest_rate}%
+- Unemployment Rate: {unemployment_rate}%
+- USD/ZAR Exchange Rate: {usd_zar_exchange_rate}
+- Economic Health Score: {economic_health_score}/100
+- Monetary Policy Stance: {monetary_policy_stance}
+
+Provide analysis in the following format:
+1. Executive Summary (2-3 sentences)
+2. Monetary Policy Assessment 
+3. Exchange Rate Analysis
+4. Risk Factors (list 3-4 key risks)
+5. Policy Recommendations (list 3-4 actionable recommendations)
+
+Keep analysis professional and focused on SARB's mandate.
+"""
+
+# Bounded, low-temperature output keeps latency and token cost predictable
+_AI_GENERATION_CONFIG = {'temperature': 0.2, 'max_output_tokens': 1024}
+
 class SARBMedallionPipeline:
     """3-Tier Medallion Architecture for SARB Economic Data"""
     
+    # Below this many rows the Storage Read API session setup costs more than REST paging
+    STORAGE_API_MIN_ROWS = 1000
+    
+    # Buffered audit records are written once this many accumulate (or on flush/exit)
+    AUDIT_FLUSH_SIZE = 100
+    
     def __init__(self, project_id='brendon-presentation', gemini_api_key=None):
         self.project_id = project_id
         self.dataset_id = 'sarb_economic_data'
         self.gemini_api_key = gemini_api_key
         
+        # Row counts per table for this run; entries are dropped when a table is rewritten
+        self._count_cache: Dict[str, int] = {}
+        
+        # Data quality audits are buffered and loaded in batches
+        self._audit_buffer: List[Dict] = []
+        self._audit_lock = threading.Lock()
+        atexit.register(self.flush_audits)
+        
         # Initialize GCP clients
         self.storage_client = storage.Client(project=self.project_id)
         self.bigquery_client = bigquery.Client(project=self.project_id)
+        self.bqstorage_client = bigquery_storage.BigQueryReadClient() if bigquery_storage else None
         
         # Initialize AI if available
         self.ai_ready = False
         if gemini_api_key:
             try:
                 genai.configure(api_key=gemini_api_key)
-                self.ai_model = genai.GenerativeModel('gemini-2.5-flash')
+                self.ai_model = genai.GenerativeModel(
+                    'gemini-2.5-flash', generation_config=_AI_GENERATION_CONFIG
+                )
                 self.ai_ready = True
                 logger.info("✅ AI model initialized")
             except Exception as e:
@@ -51,24 +145,45 @@ class SARBMedallionPipeline:
             with open('infrastructure/medallion_architecture.sql', 'r') as f:
                 sql_commands = f.read()
             
-            # Split by CREATE statements and execute each
-            statements = sql_commands.split('CREATE OR REPLACE')
-            
-            for i, statement in enumerate(statements):
-                if statement.strip():
-                    if i > 0:  # Add back the CREATE OR REPLACE for non-first statements
-                        statement = 'CREATE OR REPLACE' + statement
-                    
-                    # Skip comments and empty statements
-                    if statement.strip().startswith('--') or not statement.strip():
-                        continue
-                    
-                    try:
-                        self.bigquery_client.query(statement).result()
-                        logger.info(f"✅ Executed SQL statement {i}")
-                    except Exception as e:
-                        if 'already exists' not in str(e).lower():
-                            logger.warning(f"⚠️ SQL execution issue: {e}")
+            # Silver is kept across runs for the incremental MERGE, but other demos
+            # rebuild the same table with their own schema; drop such a copy so
+            # the DDL below recreates it
+            silver_ref = f"{self.project_id}.{self.dataset_id}.silver_economic_indicators"
+            try:
+                silver_columns = {f.name for f in self.bigquery_client.get_table(silver_ref).schema}
+                if 'updated_timestamp' not in silver_columns:
+                    self.bigquery_client.delete_table(silver_ref)
+                    logger.info("♻️ Replacing silver table created with a different schema")
+            except NotFound:
+                pass
+            
+            # Strip comments and tokenize the DDL file into statements once
+            statements = sqlparse.split(sqlparse.format(sql_commands, strip_comments=True))
+            
+            table_statements, view_statements = [], []
+            for i, statement in enumerate(s.strip() for s in statements):
+                if not statement:
+                    continue
+                
+                if statement.startswith('CREATE OR REPLACE VIEW'):
+                    view_statements.append((i, statement))
+                else:
+                    table_statements.append((i, statement))
+            
+            def run_statement(i, statement):
+                try:
+                    self.bigquery_client.query(statement).result()
+                    logger.info(f"✅ Executed SQL statement {i}")
+                except Exception as e:
+                    if 'already exists' not in str(e).lower():
+                        logger.warning(f"⚠️ SQL execution issue: {e}")
+            
+            # Tables and functions are independent DDL jobs; views run after the tables they read
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for group in (table_statements, view_statements):
+                    futures = [executor.submit(run_statement, i, stmt) for i, stmt in group]
+                    for future in futures:
+                        future.result()
             
             logger.info("✅ Medallion architecture setup complete")
             
@@ -76,43 +191,50 @@ class SARBMedallionPipeline:
             logger.error(f"❌ Failed to setup medallion architecture: {e}")
             raise
     
-    def ingest_to_bronze(self, data: List[Dict]) -> str:
+    def ingest_to_bronze(self, data: List[Dict], chunk_size: int = 10000) -> str:
         """Bronze Layer: Ingest raw data exactly as received"""
         audit_id = f"audit_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         try:
             # Prepare raw data with metadata
-            bronze_records = []
-            for record in data:
-                # Generate row hash for lineage
-                row_hash = hashlib.md5(
-                    f"{record['indicator_name']}{record['value']}{record['date']}".encode()
-                ).hexdigest()
-                
-                bronze_record = {
-                    **record,
-                    'ingestion_timestamp': datetime.now(timezone.utc).isoformat(),
-                    'file_source': 'api_ingestion',
-                    'row_hash': row_hash
-                }
-                bronze_records.append(bronze_record)
+            df = pd.DataFrame(data)
+            
+            # Generate row hash for lineage from a vectorised concatenation
+            hash_input = df['indicator_name'].astype(str) + df['value'].astype(str) + df['date'].astype(str)
+            df['ingestion_timestamp'] = datetime.now(timezone.utc)
+            df['file_source'] = 'api_ingestion'
+            df['row_hash'] = [hashlib.md5(x.encode()).hexdigest() for x in hash_input.values]
+            
+            # Upload as Parquet: columnar and compressed rather than row-wise JSON
+            df['value'] = df['value'].map(lambda v: Decimal(str(v)))  # NUMERIC column
+            df['date'] = pd.to_datetime(df['date']).dt.date
             
             # Insert into bronze table
             table_ref = f"{self.project_id}.{self.dataset_id}.bronze_raw_indicators"
             job_config = bigquery.LoadJobConfig(
                 write_disposition="WRITE_APPEND",
-                source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+                source_format=bigquery.SourceFormat.PARQUET,
             )
             
-            job = self.bigquery_client.load_table_from_json(
-                bronze_records, table_ref, job_config=job_config
-            )
-            job.result()
+            # Load in fixed-size chunks submitted concurrently so large
+            # inputs don't turn into one oversized request
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = [
+                    executor.submit(
+                        lambda chunk: self.bigquery_client.load_table_from_dataframe(
+                            chunk, table_ref, job_config=job_config
+                        ).result(),
+                        df.iloc[start:start + chunk_size]
+                    )
+                    for start in range(0, len(df), chunk_size)
+                ]
+                for future in futures:
+                    future.result()
             
             # Log data quality audit
-            self._log_data_quality_audit(audit_id, len(data), len(bronze_records))
+            self._log_data_quality_audit(audit_id, len(data), len(df))
             
-            logger.info(f"✅ Bronze layer: {len(bronze_records)} records ingested")
+            logger.info(f"✅ Bronze layer: {len(df)} records ingested")
             return audit_id
             
         except Exception as e:
@@ -123,24 +245,72 @@ class SARBMedallionPipeline:
         """Silver Layer: Cleanse, validate, and enrich data"""
         try:
             # Transform bronze to silver with data quality and enrichments
+            # Incrementally MERGE only bronze rows ingested since the last run,
+            # keyed on (indicator_name, date), instead of rebuilding silver
+            silver_table = f"{self.project_id}.{self.dataset_id}.silver_economic_indicators"
             silver_query = f"""
-            CREATE OR REPLACE TABLE `{self.project_id}.{self.dataset_id}.silver_economic_indicators` AS
-            WITH bronze_data AS (
-                SELECT *,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY indicator_name, date, value 
+            MERGE `{silver_table}` T
+            USING (
+                WITH deduplicated AS (
+                    SELECT *
+                    FROM `{self.project_id}.{self.dataset_id}.bronze_raw_indicators`
+                    WHERE value IS NOT NULL
+                      AND ingestion_timestamp > (
+                          SELECT IFNULL(MAX(updated_timestamp), TIMESTAMP '1970-01-01')
+                          FROM `{silver_table}`
+                      )
+                    QUALIFY ROW_NUMBER() OVER (
+                        PARTITION BY indicator_name, date 
                         ORDER BY ingestion_timestamp DESC
-                    ) as rn
-                FROM `{self.project_id}.{self.dataset_id}.bronze_raw_indicators`
-            ),
-            deduplicated AS (
-                SELECT * FROM bronze_data WHERE rn = 1
-            ),
-            enriched AS (
+                    ) = 1
+                ),
+                new_rows AS (
+                    SELECT 
+                        indicator_name,
+                        category as indicator_category,
+                        value,
+                        unit,
+                        date,
+                        source,
+                        row_hash as source_row_hash,
+                        TRUE as is_new,
+                        CAST(NULL AS NUMERIC) as stored_previous
+                    FROM deduplicated
+                ),
+                -- Existing silver observations of the affected indicators: they supply
+                -- the previous value for new rows, and their own LAG is re-derived
+                history AS (
+                    SELECT 
+                        s.indicator_name,
+                        s.indicator_category,
+                        s.value,
+                        s.unit,
+                        s.date,
+                        s.source,
+                        s.source_row_hash,
+                        FALSE as is_new,
+                        s.previous_value as stored_previous
+                    FROM `{silver_table}` s
+                    LEFT JOIN deduplicated d USING (indicator_name, date)
+                    WHERE d.indicator_name IS NULL
+                      AND s.indicator_name IN (SELECT indicator_name FROM deduplicated)
+                ),
+                with_previous AS (
+                    SELECT *,
+                        LAG(value) OVER (
+                            PARTITION BY indicator_name 
+                            ORDER BY date
+                        ) as prev_val
+                    FROM (
+                        SELECT * FROM new_rows
+                        UNION ALL
+                        SELECT * FROM history
+                    )
+                )
                 SELECT 
                     GENERATE_UUID() as indicator_id,
                     indicator_name,
-                    category as indicator_category,
+                    indicator_category,
                     value,
                     unit,
                     date,
@@ -152,54 +322,50 @@ class SARBMedallionPipeline:
                         ELSE FALSE 
                     END as is_validated,
                     
-                    CASE 
+                    CAST(CASE 
                         WHEN value IS NOT NULL AND value > 0 THEN 1.0 
                         ELSE 0.5 
-                    END as confidence_score,
+                    END AS NUMERIC) as confidence_score,
                     
                     -- Metadata
                     CURRENT_TIMESTAMP() as created_timestamp,
                     CURRENT_TIMESTAMP() as updated_timestamp,
-                    row_hash as source_row_hash,
+                    source_row_hash,
                     
                     -- Business enrichments - previous value and changes
-                    LAG(value) OVER (
-                        PARTITION BY indicator_name 
-                        ORDER BY date
-                    ) as previous_value,
+                    prev_val as previous_value,
+                    value - prev_val as period_change,
+                    SAFE_DIVIDE(value - prev_val, prev_val) * 100 as period_change_percent
                     
-                    value - LAG(value) OVER (
-                        PARTITION BY indicator_name 
-                        ORDER BY date
-                    ) as period_change,
-                    
-                    SAFE_DIVIDE(
-                        value - LAG(value) OVER (
-                            PARTITION BY indicator_name 
-                            ORDER BY date
-                        ),
-                        LAG(value) OVER (
-                            PARTITION BY indicator_name 
-                            ORDER BY date
-                        )
-                    ) * 100 as period_change_percent
-                    
-                FROM deduplicated
-                WHERE value IS NOT NULL
-            )
-            SELECT * FROM enriched
+                FROM with_previous
+                -- New rows, plus existing rows whose predecessor changed
+                -- (e.g. a backfilled date landed just before them)
+                WHERE is_new OR prev_val IS DISTINCT FROM stored_previous
+            ) S
+            ON T.indicator_name = S.indicator_name AND T.date = S.date
+            WHEN MATCHED THEN
+                UPDATE SET
+                    indicator_category = S.indicator_category,
+                    value = S.value,
+                    unit = S.unit,
+                    source = S.source,
+                    is_validated = S.is_validated,
+                    confidence_score = S.confidence_score,
+                    updated_timestamp = S.updated_timestamp,
+                    source_row_hash = S.source_row_hash,
+                    previous_value = S.previous_value,
+                    period_change = S.period_change,
+                    period_change_percent = S.period_change_percent
+            WHEN NOT MATCHED THEN
+                INSERT ROW
             """
             
             job = self.bigquery_client.query(silver_query)
             job.result()
+            self._count_cache.pop('silver_economic_indicators', None)
             
             # Get count of processed records
-            count_query = f"""
-            SELECT COUNT(*) as record_count 
-            FROM `{self.project_id}.{self.dataset_id}.silver_economic_indicators`
-            """
-            result = list(self.bigquery_client.query(count_query).result())
-            record_count = result[0].record_count
+            record_count = self._get_table_count('silver_economic_indicators')
             
             logger.info(f"✅ Silver layer: {record_count} records processed")
             return record_count
@@ -215,7 +381,9 @@ class SARBMedallionPipeline:
             
             # 1. Executive Dashboard
             dashboard_query = f"""
-            CREATE OR REPLACE TABLE `{self.project_id}.{self.dataset_id}.gold_executive_dashboard` AS
+            CREATE OR REPLACE TABLE `{self.project_id}.{self.dataset_id}.gold_executive_dashboard`
+            PARTITION BY dashboard_date
+            CLUSTER BY dashboard_date AS
             WITH latest_indicators AS (
                 SELECT 
                     indicator_name,
@@ -227,14 +395,31 @@ class SARBMedallionPipeline:
             pivot_data AS (
                 SELECT 
                     date as dashboard_date,
-                    MAX(CASE WHEN indicator_name = 'GDP_Growth_Rate' THEN value END) as gdp_growth_rate,
-                    MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN value END) as inflation_rate,
-                    MAX(CASE WHEN indicator_name = 'Prime_Interest_Rate' THEN value END) as prime_interest_rate,
-                    MAX(CASE WHEN indicator_name = 'Unemployment_Rate' THEN value END) as unemployment_rate,
-                    MAX(CASE WHEN indicator_name = 'USD_ZAR_Exchange_Rate' THEN value END) as usd_zar_exchange_rate
-                FROM latest_indicators 
-                WHERE rn = 1
-                GROUP BY date
+                    gdp_growth_rate,
+                    inflation_rate,
+                    prime_interest_rate,
+                    unemployment_rate,
+                    usd_zar_exchange_rate
+                FROM (
+                    SELECT date, indicator_name, value
+                    FROM latest_indicators 
+                    WHERE rn = 1
+                )
+                PIVOT (
+                    MAX(value) FOR indicator_name IN (
+                        'GDP_Growth_Rate' AS gdp_growth_rate,
+                        'Inflation_Rate' AS inflation_rate,
+                        'Prime_Interest_Rate' AS prime_interest_rate,
+                        'Unemployment_Rate' AS unemployment_rate,
+                        'USD_ZAR_Exchange_Rate' AS usd_zar_exchange_rate
+                    )
+                )
+            ),
+            with_variance AS (
+                SELECT *,
+                    ABS(inflation_rate - NUMERIC '4.5') as inflation_target_variance
+                FROM pivot_data
+                WHERE dashboard_date IS NOT NULL
             )
             SELECT 
                 dashboard_date,
@@ -245,7 +430,7 @@ class SARBMedallionPipeline:
                 usd_zar_exchange_rate,
                 
                 -- Calculated KPIs
-                ABS(inflation_rate - 4.5) as inflation_target_variance,
+                inflation_target_variance,
                 
                 CASE 
                     WHEN prime_interest_rate > 10 THEN 'Restrictive'
@@ -254,9 +439,9 @@ class SARBMedallionPipeline:
                 END as monetary_policy_stance,
                 
                 -- Economic health score (0-100)
-                GREATEST(0, LEAST(100, 
-                    50 + (gdp_growth_rate * 10) - (ABS(inflation_rate - 4.5) * 5) - (unemployment_rate * 0.5)
-                )) as economic_health_score,
+                `{self.project_id}.{self.dataset_id}.economic_health`(
+                    gdp_growth_rate, inflation_target_variance, unemployment_rate
+                ) as economic_health_score,
                 
                 -- Trends (simplified)
                 CASE 
@@ -289,89 +474,142 @@ class SARBMedallionPipeline:
                     ROWS BETWEEN 2 PRECEDING AND CURRENT ROW
                 ) as exchange_rate_volatility,
                 
-                ABS(inflation_rate - 4.5) + (prime_interest_rate - 7) as policy_uncertainty_index,
+                inflation_target_variance + (prime_interest_rate - 7) as policy_uncertainty_index,
                 
                 -- Metadata
                 CURRENT_TIMESTAMP() as created_timestamp,
                 TIMESTAMP_DIFF(CURRENT_TIMESTAMP(), TIMESTAMP(dashboard_date), HOUR) as data_freshness_hours
                 
-            FROM pivot_data
-            WHERE dashboard_date IS NOT NULL
+            FROM with_variance
             """
             
-            job = self.bigquery_client.query(dashboard_query)
-            job.result()
-            results['executive_dashboard'] = self._get_table_count('gold_executive_dashboard')
             
             # 2. Monthly Analysis
+            # Only months touched by silver rows updated since the last gold
+            # build are recomputed and merged
+            monthly_table = f"{self.project_id}.{self.dataset_id}.gold_monthly_analysis"
             monthly_query = f"""
-            CREATE OR REPLACE TABLE `{self.project_id}.{self.dataset_id}.gold_monthly_analysis` AS
-            WITH monthly_data AS (
-                SELECT 
-                    DATE_TRUNC(date, MONTH) as analysis_month,
-                    indicator_name,
-                    AVG(value) as avg_value,
-                    STDDEV(value) as volatility,
-                    MAX(value) as max_value,
-                    MIN(value) as min_value,
-                    COUNT(*) as data_points
-                FROM `{self.project_id}.{self.dataset_id}.silver_economic_indicators`
-                GROUP BY DATE_TRUNC(date, MONTH), indicator_name
-            ),
-            pivot_monthly AS (
+            MERGE `{monthly_table}` T
+            USING (
+                WITH changed_months AS (
+                    SELECT DISTINCT DATE_TRUNC(date, MONTH) as analysis_month
+                    FROM `{self.project_id}.{self.dataset_id}.silver_economic_indicators`
+                    WHERE updated_timestamp > (
+                        SELECT IFNULL(MAX(created_timestamp), TIMESTAMP '1970-01-01')
+                        FROM `{monthly_table}`
+                    )
+                ),
+                -- Native PIVOT computes every per-indicator aggregate in one pass;
+                -- columns are named <aggregate alias>_<indicator alias>
+                pivot_monthly AS (
+                    SELECT 
+                        analysis_month,
+                        avg_inflation as avg_inflation_rate,
+                        avg_gdp as avg_gdp_growth,
+                        avg_fx as avg_exchange_rate,
+                        avg_prime as avg_interest_rate,
+                        CAST(volatility_inflation AS NUMERIC) as inflation_volatility,
+                        CAST(volatility_fx AS NUMERIC) as exchange_rate_volatility,
+                        max_inflation,
+                        min_inflation
+                    FROM (
+                        SELECT 
+                            DATE_TRUNC(date, MONTH) as analysis_month,
+                            indicator_name,
+                            value
+                        FROM `{self.project_id}.{self.dataset_id}.silver_economic_indicators`
+                        WHERE DATE_TRUNC(date, MONTH) IN (SELECT analysis_month FROM changed_months)
+                    )
+                    PIVOT (
+                        AVG(value) AS avg,
+                        STDDEV(value) AS volatility,
+                        MAX(value) AS max,
+                        MIN(value) AS min
+                        FOR indicator_name IN (
+                            'Inflation_Rate' AS inflation,
+                            'GDP_Growth_Rate' AS gdp,
+                            'USD_ZAR_Exchange_Rate' AS fx,
+                            'Prime_Interest_Rate' AS prime
+                        )
+                    )
+                )
                 SELECT 
                     analysis_month,
-                    MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN avg_value END) as avg_inflation_rate,
-                    MAX(CASE WHEN indicator_name = 'GDP_Growth_Rate' THEN avg_value END) as avg_gdp_growth,
-                    MAX(CASE WHEN indicator_name = 'USD_ZAR_Exchange_Rate' THEN avg_value END) as avg_exchange_rate,
-                    MAX(CASE WHEN indicator_name = 'Prime_Interest_Rate' THEN avg_value END) as avg_interest_rate,
-                    MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN volatility END) as inflation_volatility,
-                    MAX(CASE WHEN indicator_name = 'USD_ZAR_Exchange_Rate' THEN volatility END) as exchange_rate_volatility,
-                    MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN max_value END) as max_inflation,
-                    MAX(CASE WHEN indicator_name = 'Inflation_Rate' THEN min_value END) as min_inflation
-                FROM monthly_data
-                GROUP BY analysis_month
-            )
-            SELECT 
-                analysis_month,
-                avg_inflation_rate,
-                avg_gdp_growth,
-                avg_exchange_rate,
-                avg_interest_rate,
-                inflation_volatility,
-                exchange_rate_volatility,
-                max_inflation,
-                min_inflation,
+                    avg_inflation_rate,
+                    avg_gdp_growth,
+                    avg_exchange_rate,
+                    avg_interest_rate,
+                    inflation_volatility,
+                    exchange_rate_volatility,
+                    max_inflation,
+                    min_inflation,
                 
-                -- Business KPIs
-                CASE 
-                    WHEN avg_inflation_rate BETWEEN 3 AND 6 THEN TRUE 
-                    ELSE FALSE 
-                END as inflation_target_compliance,
+                    -- Business KPIs
+                    CASE 
+                        WHEN avg_inflation_rate BETWEEN 3 AND 6 THEN TRUE 
+                        ELSE FALSE 
+                    END as inflation_target_compliance,
                 
-                CASE 
-                    WHEN max_inflation > 6 THEN 1 
-                    ELSE 0 
-                END as months_above_target,
+                    CASE 
+                        WHEN max_inflation > 6 THEN 1 
+                        ELSE 0 
+                    END as months_above_target,
                 
-                CASE 
-                    WHEN avg_inflation_rate BETWEEN 3 AND 6 AND inflation_volatility < 1 THEN 'Excellent'
-                    WHEN avg_inflation_rate BETWEEN 2 AND 7 AND inflation_volatility < 2 THEN 'Good'
-                    WHEN avg_inflation_rate BETWEEN 1 AND 8 THEN 'Fair'
-                    ELSE 'Poor'
-                END as economic_stability_rating,
+                    CASE 
+                        WHEN avg_inflation_rate BETWEEN 3 AND 6 AND inflation_volatility < 1 THEN 'Excellent'
+                        WHEN avg_inflation_rate BETWEEN 2 AND 7 AND inflation_volatility < 2 THEN 'Good'
+                        WHEN avg_inflation_rate BETWEEN 1 AND 8 THEN 'Fair'
+                        ELSE 'Poor'
+                    END as economic_stability_rating,
                 
-                0 as policy_changes_count,  -- Would need rate change detection logic
-                0 as cumulative_rate_changes,
+                    0 as policy_changes_count,  -- Would need rate change detection logic
+                    CAST(0 AS NUMERIC) as cumulative_rate_changes,
                 
-                CURRENT_TIMESTAMP() as created_timestamp
+                    CURRENT_TIMESTAMP() as created_timestamp
                 
-            FROM pivot_monthly
-            WHERE analysis_month IS NOT NULL
+                FROM pivot_monthly
+                WHERE analysis_month IS NOT NULL
+            ) S
+            ON T.analysis_month = S.analysis_month
+            WHEN MATCHED THEN
+                UPDATE SET
+                    avg_inflation_rate = S.avg_inflation_rate,
+                    avg_gdp_growth = S.avg_gdp_growth,
+                    avg_exchange_rate = S.avg_exchange_rate,
+                    avg_interest_rate = S.avg_interest_rate,
+                    inflation_volatility = S.inflation_volatility,
+                    exchange_rate_volatility = S.exchange_rate_volatility,
+                    max_inflation = S.max_inflation,
+                    min_inflation = S.min_inflation,
+                    inflation_target_compliance = S.inflation_target_compliance,
+                    months_above_target = S.months_above_target,
+                    economic_stability_rating = S.economic_stability_rating,
+                    policy_changes_count = S.policy_changes_count,
+                    cumulative_rate_changes = S.cumulative_rate_changes,
+                    created_timestamp = S.created_timestamp
+            WHEN NOT MATCHED THEN
+                INSERT ROW
             """
             
-            job = self.bigquery_client.query(monthly_query)
+            # 3. Latest dashboard row, so AI insights read one row instead of sorting
+            latest_query = f"""
+            CREATE OR REPLACE TABLE `{self.project_id}.{self.dataset_id}.gold_latest_dashboard` AS
+            SELECT * FROM `{self.project_id}.{self.dataset_id}.gold_executive_dashboard`
+            ORDER BY dashboard_date DESC
+            LIMIT 1
+            """
+            
+            # All gold statements run as one multi-statement script (one job)
+            gold_script = ";\n".join(
+                q.rstrip() for q in (dashboard_query, monthly_query, latest_query)
+            ) + ";"
+            job_config = bigquery.QueryJobConfig(labels={"stage": "gold"})
+            job = self.bigquery_client.query(gold_script, job_config=job_config)
             job.result()
+            
+            self._count_cache.pop('gold_executive_dashboard', None)
+            self._count_cache.pop('gold_monthly_analysis', None)
+            results['executive_dashboard'] = self._get_table_count('gold_executive_dashboard')
             results['monthly_analysis'] = self._get_table_count('gold_monthly_analysis')
             
             logger.info(f"✅ Gold layer: {sum(results.values())} total records across tables")
@@ -390,40 +628,19 @@ class SARBMedallionPipeline:
         try:
             # Get latest data for AI analysis
             data_query = f"""
-            SELECT * FROM `{self.project_id}.{self.dataset_id}.gold_executive_dashboard`
-            ORDER BY dashboard_date DESC
-            LIMIT 1
+            SELECT * FROM `{self.project_id}.{self.dataset_id}.gold_latest_dashboard`
             """
             
-            df = self.bigquery_client.query(data_query).to_dataframe()
-            if df.empty:
+            # Single row - read it straight off the result iterator, no DataFrame
+            row = next(iter(self.bigquery_client.query(data_query).result()), None)
+            if row is None:
                 logger.warning("⚠️ No data available for AI analysis")
                 return None
             
             # Prepare data for AI
-            latest_data = df.iloc[0].to_dict()
+            latest_data = dict(row.items())
             
-            prompt = f"""
-            As a senior economist at the South African Reserve Bank, analyze the following economic dashboard data and provide professional insights:
-
-            Economic Indicators:
-            - GDP Growth: {latest_data.get('gdp_growth_rate', 'N/A')}%
-            - Inflation Rate: {latest_data.get('inflation_rate', 'N/A')}%
-            - Prime Interest Rate: {latest_data.get('prime_interest_rate', 'N/A')}%
-            - Unemployment Rate: {latest_data.get('unemployment_rate', 'N/A')}%
-            - USD/ZAR Exchange Rate: {latest_data.get('usd_zar_exchange_rate', 'N/A')}
-            - Economic Health Score: {latest_data.get('economic_health_score', 'N/A')}/100
-            - Monetary Policy Stance: {latest_data.get('monetary_policy_stance', 'N/A')}
-
-            Provide analysis in the following format:
-            1. Executive Summary (2-3 sentences)
-            2. Monetary Policy Assessment 
-            3. Exchange Rate Analysis
-            4. Risk Factors (list 3-4 key risks)
-            5. Policy Recommendations (list 3-4 actionable recommendations)
-
-            Keep analysis professional and focused on SARB's mandate.
-            """
+            prompt = _AI_PROMPT_TEMPLATE.format_map(defaultdict(lambda: 'N/A', latest_data))
             
             # Generate AI analysis
             response = self.ai_model.generate_content(prompt)
@@ -446,7 +663,7 @@ class SARBMedallionPipeline:
                 'ai_model_version': 'gemini-2.5-flash',
                 'ai_provider': 'gemini_api',
                 'confidence_score': 0.85,
-                'analysis_timestamp': datetime.now(timezone.utc).isoformat(),
+                'analysis_timestamp': datetime.now(timezone.utc),
                 'data_points_analyzed': 5,
                 'analysis_period_start': latest_data['dashboard_date'],
                 'analysis_period_end': latest_data['dashboard_date'],
@@ -455,16 +672,7 @@ class SARBMedallionPipeline:
             }]
             
             # Insert AI insights
-            table_ref = f"{self.project_id}.{self.dataset_id}.ai_economic_insights"
-            job_config = bigquery.LoadJobConfig(
-                write_disposition="WRITE_APPEND",
-                source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
-            )
-            
-            job = self.bigquery_client.load_table_from_json(
-                ai_record, table_ref, job_config=job_config
-            )
-            job.result()
+            self._load_json_rows(ai_record, 'ai_economic_insights')
             
             logger.info(f"✅ AI insights generated: {insight_id}")
             return insight_id
@@ -482,7 +690,12 @@ class SARBMedallionPipeline:
             LIMIT 10
             """
             
-            df = self.bigquery_client.query(query).to_dataframe()
+            rows = self.bigquery_client.query(query).result()
+            use_storage = rows.total_rows is not None and rows.total_rows >= self.STORAGE_API_MIN_ROWS
+            df = rows.to_dataframe(
+                bqstorage_client=self.bqstorage_client if use_storage else None,
+                create_bqstorage_client=False
+            )
             logger.info(f"✅ Retrieved {len(df)} dashboard records")
             return df
             
@@ -491,98 +704,132 @@ class SARBMedallionPipeline:
             return pd.DataFrame()
     
     def _log_data_quality_audit(self, audit_id: str, total_records: int, valid_records: int):
-        """Log data quality audit information"""
+        """Buffer data quality audit information; written in batches by flush_audits"""
+        audit_record = {
+            'audit_id': audit_id,
+            'ingestion_timestamp': datetime.now(timezone.utc),
+            'source_file': 'api_ingestion',
+            'total_records': total_records,
+            'valid_records': valid_records,
+            'invalid_records': total_records - valid_records,
+            'data_quality_score': valid_records / total_records if total_records > 0 else 0,
+            'issues_detected': ['None'] if valid_records == total_records else ['Missing values']
+        }
+        
+        with self._audit_lock:
+            self._audit_buffer.append(audit_record)
+            should_flush = len(self._audit_buffer) >= self.AUDIT_FLUSH_SIZE
+        
+        if should_flush:
+            self.flush_audits()
+    
+    def flush_audits(self):
+        """Write all buffered audit records with a single load job"""
+        with self._audit_lock:
+            audit_records, self._audit_buffer = self._audit_buffer, []
+        
+        if not audit_records:
+            return
+        
         try:
-            audit_record = [{
-                'audit_id': audit_id,
-                'ingestion_timestamp': datetime.now(timezone.utc).isoformat(),
-                'source_file': 'api_ingestion',
-                'total_records': total_records,
-                'valid_records': valid_records,
-                'invalid_records': total_records - valid_records,
-                'data_quality_score': valid_records / total_records if total_records > 0 else 0,
-                'issues_detected': ['None'] if valid_records == total_records else ['Missing values']
-            }]
-            
-            table_ref = f"{self.project_id}.{self.dataset_id}.bronze_data_quality_log"
-            job_config = bigquery.LoadJobConfig(
-                write_disposition="WRITE_APPEND",
-                source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
-            )
-            
-            job = self.bigquery_client.load_table_from_json(
-                audit_record, table_ref, job_config=job_config
-            )
-            job.result()
+            self._load_json_rows(audit_records, 'bronze_data_quality_log')
+            logger.info(f"✅ Flushed {len(audit_records)} audit records")
             
         except Exception as e:
             logger.warning(f"⚠️ Failed to log audit: {e}")
     
+    def _load_json_rows(self, records: List[Dict], table_name: str):
+        """Append records to a table with one NDJSON load job"""
+        table_ref = f"{self.project_id}.{self.dataset_id}.{table_name}"
+        job_config = bigquery.LoadJobConfig(
+            write_disposition="WRITE_APPEND",
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+        )
+        
+        job = self.bigquery_client.load_table_from_file(
+            BytesIO(_to_ndjson(records)), table_ref, job_config=job_config
+        )
+        job.result()
+    
     def _get_table_count(self, table_name: str) -> int:
-        """Get record count for a table"""
+        """Get record count for a table from metadata (no bytes scanned)"""
+        if table_name in self._count_cache:
+            return self._count_cache[table_name]
         try:
             query = f"""
-            SELECT COUNT(*) as record_count 
-            FROM `{self.project_id}.{self.dataset_id}.{table_name}`
+            SELECT row_count as record_count 
+            FROM `{self.project_id}.{self.dataset_id}.__TABLES__`
+            WHERE table_id = '{table_name}'
             """
             result = list(self.bigquery_client.query(query).result())
-            return result[0].record_count
+            self._count_cache[table_name] = result[0].record_count
+            return self._count_cache[table_name]
         except:
             return 0
     
     def run_full_pipeline(self, sample_data: List[Dict]) -> Dict:
         """Run the complete 3-tier pipeline"""
-        print("🏗️ SARB 3-Tier Medallion Architecture Demo")
-        print("=" * 60)
+        logger.info("🏗️ SARB 3-Tier Medallion Architecture Demo")
+        logger.info("=" * 60)
         
         results = {}
         
         # Setup architecture
-        print("🔧 Setting up 3-tier architecture...")
+        logger.info("🔧 Setting up 3-tier architecture...")
         self.setup_medallion_architecture()
+        _PHASE_LOG.flush()
         
         # Bronze Layer
-        print("\n🥉 BRONZE LAYER - Raw Data Ingestion")
-        print("-" * 40)
+        logger.info("🥉 BRONZE LAYER - Raw Data Ingestion")
+        logger.info("-" * 40)
         audit_id = self.ingest_to_bronze(sample_data)
         results['bronze_audit_id'] = audit_id
-        print(f"✅ Raw data ingested with audit ID: {audit_id}")
+        logger.info(f"✅ Raw data ingested with audit ID: {audit_id}")
+        _PHASE_LOG.flush()
         
         # Silver Layer
-        print("\n🥈 SILVER LAYER - Data Cleansing & Enrichment")
-        print("-" * 40)
+        logger.info("🥈 SILVER LAYER - Data Cleansing & Enrichment")
+        logger.info("-" * 40)
         silver_count = self.process_to_silver()
         results['silver_records'] = silver_count
-        print(f"✅ {silver_count} records cleansed and enriched")
+        logger.info(f"✅ {silver_count} records cleansed and enriched")
+        _PHASE_LOG.flush()
         
         # Gold Layer
-        print("\n🥇 GOLD LAYER - Business Ready Tables")
-        print("-" * 40)
+        logger.info("🥇 GOLD LAYER - Business Ready Tables")
+        logger.info("-" * 40)
         gold_results = self.build_gold_layer()
         results['gold_tables'] = gold_results
         for table, count in gold_results.items():
-            print(f"✅ {table}: {count} records")
+            logger.info(f"✅ {table}: {count} records")
+        _PHASE_LOG.flush()
         
         # AI Insights
-        print("\n🤖 AI INSIGHTS LAYER - Separate Summary")
-        print("-" * 40)
+        logger.info("🤖 AI INSIGHTS LAYER - Separate Summary")
+        logger.info("-" * 40)
         if self.ai_ready:
             insight_id = self.generate_ai_insights()
             results['ai_insight_id'] = insight_id
-            print(f"✅ AI insights generated: {insight_id}")
+            logger.info(f"✅ AI insights generated: {insight_id}")
         else:
-            print("⚠️ AI not available - using professional fallback")
+            logger.info("⚠️ AI not available - using professional fallback")
+        _PHASE_LOG.flush()
         
         # Final Reporting View
-        print("\n📊 FINAL REPORTING DASHBOARD")
-        print("-" * 40)
+        logger.info("📊 FINAL REPORTING DASHBOARD")
+        logger.info("-" * 40)
         dashboard_df = self.get_reporting_dashboard()
         results['reporting_records'] = len(dashboard_df)
-        print(f"✅ Reporting dashboard ready with {len(dashboard_df)} records")
+        logger.info(f"✅ Reporting dashboard ready with {len(dashboard_df)} records")
+        _PHASE_LOG.flush()
+        
+        logger.info("=" * 60)
+        logger.info("🎉 3-Tier Medallion Architecture Complete!")
+        logger.info("✅ Bronze → Silver → Gold → AI Insights → Reporting")
         
-        print("\n" + "=" * 60)
-        print("🎉 3-Tier Medallion Architecture Complete!")
-        print("✅ Bronze → Silver → Gold → AI Insights → Reporting")
+        # Write this run's buffered audit records
+        self.flush_audits()
+        _PHASE_LOG.flush()
         
         return results
 
@@ -4,13 +4,81 @@ Simple Chart Viewer - View PNG charts using existing Python packages
 No additional installations required!
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.image as mpimg
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import os
 
+# matplotlib, numpy and Pillow are imported inside the chart-viewing helpers
+# so the folder/info/guide menu options start without loading them
+
+# figsize -> (Figure, Axes) reused across view_sarb_charts calls
+_FIG_CACHE = {}
+
+def _fast_imread(path, max_size):
+    """Decode a PNG chart (libspng when installed) and shrink it to fit max_size pixels"""
+    import numpy as np
+    from PIL import Image
+    try:
+        import pyspng
+    except ImportError:
+        # optional: fall back to Pillow's PNG reader
+        pyspng = None
+    
+    if pyspng is not None:
+        img = Image.fromarray(pyspng.load(Path(path).read_bytes()))
+    else:
+        img = Image.open(path)
+    if img.mode not in ('RGB', 'RGBA', 'L'):
+        img = img.convert('RGBA')
+    
+    # Pixels beyond the panel's display resolution would be discarded by
+    # the renderer anyway
+    img.thumbnail(max_size, Image.Resampling.BILINEAR)
+    return np.asarray(img)
+
+def _cached_decode(png_path, max_size):
+    """Decode a chart once and reuse a memory-mapped .npy sidecar while the PNG is unchanged"""
+    import numpy as np
+    
+    npy_path = png_path.with_name(f"{png_path.name}.{max_size[0]}x{max_size[1]}.npy")
+    if npy_path.exists() and npy_path.stat().st_mtime >= png_path.stat().st_mtime:
+        return np.load(npy_path, mmap_mode='r')
+    
+    img = _fast_imread(png_path, max_size)
+    try:
+        np.save(npy_path, img)
+    except OSError:
+        pass  # read-only checkout: just skip the cache
+    return img
+
+def _compose_dashboard(titles, images, title_px):
+    """Paste chart arrays left to right under bold titles on a white canvas"""
+    import numpy as np
+    from matplotlib import font_manager
+    from PIL import Image, ImageDraw, ImageFont
+    
+    panels = [Image.fromarray(np.asarray(img)) for img in images]
+    title_h = title_px * 2
+    canvas = Image.new(
+        'RGB',
+        (sum(p.width for p in panels), max(p.height for p in panels) + title_h),
+        'white'
+    )
+    font = ImageFont.truetype(
+        font_manager.findfont(font_manager.FontProperties(weight='bold')), title_px
+    )
+    draw = ImageDraw.Draw(canvas)
+    
+    x = 0
+    for title, panel in zip(titles, panels):
+        canvas.paste(panel, (x, title_h), panel if panel.mode == 'RGBA' else None)
+        draw.text((x + panel.width // 2, title_h // 2), title, fill='black', font=font, anchor='mm')
+        x += panel.width
+    return np.asarray(canvas)
+
 def view_sarb_charts():
     """View SARB economic charts using matplotlib (already installed)"""
+    import matplotlib.pyplot as plt
     
     print("📊 SARB ECONOMIC CHARTS VIEWER")
     print("=" * 40)
@@ -45,36 +113,35 @@ def view_sarb_charts():
     # Display charts
     num_charts = len(available_charts)
     
-    if num_charts == 1:
-        # Single chart
-        fig, ax = plt.subplots(figsize=(12, 8))
-        title, chart_path = available_charts[0]
-        img = mpimg.imread(str(chart_path))
-        ax.imshow(img)
-        ax.set_title(title, fontsize=14, fontweight='bold')
-        ax.axis('off')
-    
-    elif num_charts == 2:
-        # Two charts side by side
-        fig, axes = plt.subplots(1, 2, figsize=(20, 8))
-        for i, (title, chart_path) in enumerate(available_charts):
-            img = mpimg.imread(str(chart_path))
-            axes[i].imshow(img)
-            axes[i].set_title(title, fontsize=12, fontweight='bold')
-            axes[i].axis('off')
+    figsize = {1: (12, 8), 2: (20, 8)}.get(num_charts, (24, 8))
+    
+    # Decode the (up to three) displayed charts concurrently at panel
+    # resolution; the PNG inflate runs in C and releases the GIL
+    shown_charts = available_charts[:3]
+    dpi = plt.rcParams['figure.dpi']
+    max_size = (int(figsize[0] / len(shown_charts) * dpi), int(figsize[1] * dpi))
+    with ThreadPoolExecutor(max_workers=len(shown_charts)) as executor:
+        images = list(executor.map(lambda chart: _cached_decode(chart[1], max_size), shown_charts))
+    
+    # Paste the charts side by side into one image and show it with a
+    # single imshow, instead of a matplotlib subplot per chart
+    fontsize = {1: 14, 2: 12}.get(num_charts, 10)
+    dashboard = _compose_dashboard(
+        [title for title, _ in shown_charts], images, int(fontsize * dpi / 72)
+    )
     
+    # Reuse this layout's figure while its window is still open
+    fig, ax = _FIG_CACHE.get(figsize, (None, None))
+    if fig is None or not plt.fignum_exists(fig.number):
+        fig, ax = _FIG_CACHE[figsize] = plt.subplots(figsize=figsize)
     else:
-        # Three or more charts
-        fig, axes = plt.subplots(1, 3, figsize=(24, 8))
-        for i, (title, chart_path) in enumerate(available_charts[:3]):
-            img = mpimg.imread(str(chart_path))
-            axes[i].imshow(img)
-            axes[i].set_title(title, fontsize=10, fontweight='bold')
-            axes[i].axis('off')
+        ax.cla()
+    ax.imshow(dashboard)
+    ax.axis('off')
     
     fig.suptitle('SARB Economic Pipeline - Visual Analytics Dashboard', 
                  fontsize=16, fontweight='bold')
-    plt.tight_layout()
+    fig.tight_layout()
     plt.show()
     
     print(f"\\n🎯 Displayed {len(available_charts)} charts")
@@ -113,10 +180,13 @@ def list_chart_info():
         }
     }
     
+    # One directory scan; DirEntry caches the stat result
+    entries = {entry.name: entry for entry in os.scandir(charts_dir)} if charts_dir.is_dir() else {}
+    
     for filename, info in chart_descriptions.items():
-        chart_path = charts_dir / filename
-        if chart_path.exists():
-            file_size = chart_path.stat().st_size / 1024  # KB
+        entry = entries.get(filename)
+        if entry is not None:
+            file_size = entry.stat(follow_symlinks=False).st_size / 1024  # KB
             print(f"\\n{info['title']}")
             print(f"   📄 File: {filename}")
             print(f"   📊 Description: {info['description']}")
@@ -127,6 +197,26 @@ def list_chart_info():
             print(f"\\n{info['title']}")
             print(f"   ❌ Status: Missing")
 
+def _show_looker_guide():
+    """Print where to find the Looker Studio setup"""
+    print("\\n🌐 LOOKER STUDIO GUIDE:")
+    print("📋 Check the file: LOOKER_STUDIO_SETUP.md")
+    print("🔗 Direct link: https://lookerstudio.google.com/")
+    print("📊 Connect to: brendon-presentation.sarb_gold_reporting.comprehensive_economic_history")
+
+def _exit():
+    """Leave the menu"""
+    print("👋 Goodbye!")
+
+# Menu choice -> handler, built once
+_MENU_ACTIONS = {
+    "1": view_sarb_charts,
+    "2": open_charts_folder,
+    "3": list_chart_info,
+    "4": _show_looker_guide,
+    "0": _exit,
+}
+
 def main():
     """Main menu for chart viewing options"""
     print("🏛️ SARB ECONOMIC PIPELINE - CHART VIEWER")
@@ -138,29 +228,9 @@ def main():
     print("4. 🌐 Show Looker Studio guide")
     print("0. ❌ Exit")
     
-    while True:
-        choice = input("\\nEnter your choice (0-4): ").strip()
-        
-        if choice == "1":
-            view_sarb_charts()
-            break
-        elif choice == "2":
-            open_charts_folder()
-            break
-        elif choice == "3":
-            list_chart_info()
-            break
-        elif choice == "4":
-            print("\\n🌐 LOOKER STUDIO GUIDE:")
-            print("📋 Check the file: LOOKER_STUDIO_SETUP.md")
-            print("🔗 Direct link: https://lookerstudio.google.com/")
-            print("📊 Connect to: brendon-presentation.sarb_gold_reporting.comprehensive_economic_history")
-            break
-        elif choice == "0":
-            print("👋 Goodbye!")
-            break
-        else:
-            print("❌ Invalid choice. Please enter 0-4.")
+    while (action := _MENU_ACTIONS.get(input("\\nEnter your choice (0-4): ").strip())) is None:
+        print("❌ Invalid choice. Please enter 0-4.")
+    action()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,7 +4,7 @@ Quick test for Gemini API key
 """
 
 import os
-import google.generativeai as genai
+import sys
 
 def test_gemini_api():
     """Test Gemini API with your key"""
@@ -19,16 +19,36 @@ def test_gemini_api():
         return False
     
     try:
+        # Imported here so the missing-key path returns without loading the SDK
+        import google.generativeai as genai
+        
         # Configure Gemini
         genai.configure(api_key=api_key)
         
         # Test the model
         model = genai.GenerativeModel('gemini-2.5-flash')
         
-        response = model.generate_content("Say 'Hello from Gemini API!' if you can read this.")
+        # Stream the reply: the first chunk already proves the key works
+        response = model.generate_content(
+            "Say 'Hello from Gemini API!' if you can read this.", stream=True
+        )
+        
+        got_text = False
+        for chunk in response:
+            # Safety-blocked or metadata-only chunks carry no parts, and .text raises on them
+            if not chunk.parts:
+                continue
+            if not got_text:
+                got_text = True
+                print("✅ SUCCESS! Gemini API is working!")
+                sys.stdout.write("🤖 Response: ")
+            sys.stdout.write(chunk.text)
+            sys.stdout.flush()
         
-        print("✅ SUCCESS! Gemini API is working!")
-        print(f"🤖 Response: {response.text}")
+        if not got_text:
+            print("❌ ERROR: Gemini returned no text")
+            return False
+        print()
         return True
         
     except Exception as e: